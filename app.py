@@ -4,35 +4,45 @@ Kullanıcılar dosya yükleyebilir, hedef formatı seçebilir ve dönüştürül
 """
 import os
 from datetime import datetime, timedelta
-from flask import (Flask, request, render_template, send_file, flash, redirect, url_for, jsonify)
+from flask import (Flask, Request, Response, request, g, render_template, send_file, flash, redirect, url_for,
+                   jsonify, stream_with_context)
 from dotenv import load_dotenv
 import logging
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge, UnsupportedMediaType
 import platform  # İşletim sistemini kontrol etmek için
 import zipfile # PDF'ten JPG'e dönüştürme için
 import threading
 import time
 import re
-import requests
-from bs4 import BeautifulSoup
-import yt_dlp
+import codecs
+from html.parser import HTMLParser
+from xml.sax.saxutils import escape as xml_escape, quoteattr
+from collections import OrderedDict, deque
 import json
-import imageio_ffmpeg
-from pydub import AudioSegment
+import sqlite3
+import heapq
+import hashlib
 import subprocess
+import queue
+import tempfile
 import shutil
 import atexit
-from concurrent.futures import ThreadPoolExecutor
-import psutil  # Sistem kaynaklarını takip etmek için
-
-# FFmpeg'in yolunu bul ve pydub için ayarla
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
+import multiprocessing
+import importlib
+import importlib.util
+import sys
+import signal
+try:
+    import resource  # Dönüştürücü process'lerinde kaynak sınırları (yalnızca Unix)
+except ImportError:
+    resource = None
 try:
-    ffmpeg_path = imageio_ffmpeg.get_ffmpeg_exe()
-    AudioSegment.converter = ffmpeg_path
-    logging.info(f"FFmpeg pydub için ayarlandı: {ffmpeg_path}")
-except Exception as e:
-    ffmpeg_path = None # Eğer bulunamazsa None olarak ayarla
-    logging.warning(f"imageio-ffmpeg aracılığıyla FFmpeg bulunamadı: {e}. Ses/video dönüştürme işlemleri başarısız olabilir.")
+    import fcntl  # Worker'lar arası dosya kilitleri (yalnızca Unix)
+except ImportError:
+    fcntl = None
 
 # .env dosyasındaki ortam değişkenlerini yükle
 load_dotenv()
@@ -45,8 +55,56 @@ app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50 MB max dosya boyutu
 app.config['CLEANUP_INTERVAL_HOURS'] = int(os.getenv('CLEANUP_INTERVAL_HOURS', '1'))  # 1 saat
 app.config['FILE_RETENTION_HOURS'] = int(os.getenv('FILE_RETENTION_HOURS', '24'))  # 24 saat
 app.config['MAX_CONCURRENT_DOWNLOADS'] = int(os.getenv('MAX_CONCURRENT_DOWNLOADS', '5'))  # Max 5 eşzamanlı indirme
+app.config['SPOTIFY_STAGE_LIMITS'] = os.getenv('SPOTIFY_STAGE_LIMITS', 'metadata=4,search=2,download=3,transcode=2')  # Aşama başına eşzamanlı şarkı
+app.config['SPOTIFY_REQUESTS_PER_SECOND'] = float(os.getenv('SPOTIFY_REQUESTS_PER_SECOND', '2'))  # Spotify sayfa isteği hız sınırı
+app.config['YOUTUBE_REQUESTS_PER_SECOND'] = float(os.getenv('YOUTUBE_REQUESTS_PER_SECOND', '1'))  # YouTube arama/indirme hız sınırı
+app.config['HTTP_POOL_SIZE'] = int(os.getenv('HTTP_POOL_SIZE', '10'))  # Host başına açık tutulan bağlantı
+app.config['SPOTIFY_TRACK_CACHE_SIZE'] = int(os.getenv('SPOTIFY_TRACK_CACHE_SIZE', '5000'))  # Önbellekteki şarkı bilgisi sayısı
+app.config['SPOTIFY_TRACK_CACHE_TTL_HOURS'] = int(os.getenv('SPOTIFY_TRACK_CACHE_TTL_HOURS', '24'))
+app.config['BATCH_MAX_FILES'] = int(os.getenv('BATCH_MAX_FILES', '500'))  # Toplu işte en fazla dosya
+app.config['BATCH_MAX_PARALLEL'] = int(os.getenv('BATCH_MAX_PARALLEL', str(min(4, os.cpu_count() or 1))))  # Toplu işte eşzamanlı dosya
+app.config['BATCH_MAX_CONTENT_LENGTH'] = int(os.getenv('BATCH_MAX_CONTENT_MB', '500')) * 1024 * 1024  # Toplu istek boyut sınırı
+app.config['MAX_CONCURRENT_JOBS'] = int(os.getenv('MAX_CONCURRENT_JOBS', str(os.cpu_count() or 2)))  # Eşzamanlı dönüştürme işi
+app.config['CONVERTER_PROCESS_WORKERS'] = int(os.getenv('CONVERTER_PROCESS_WORKERS', str(os.cpu_count() or 2)))  # Dönüştürücü process sayısı
+app.config['CONVERTER_MAX_TASKS_PER_WORKER'] = int(os.getenv('CONVERTER_MAX_TASKS_PER_WORKER', '50'))  # Process'ler bu kadar işten sonra yenilenir
+app.config['CONVERTER_CONCURRENCY_LIMITS'] = os.getenv('CONVERTER_CONCURRENCY_LIMITS', 'video=1,audio=2,pdf=2')  # Grup başına eşzamanlı iş
+app.config['CONVERTER_TIMEOUTS'] = os.getenv('CONVERTER_TIMEOUTS', 'default=300,pdf=900,audio=600,video=1800')  # Dönüştürücü/grup başına süre sınırı (saniye)
+app.config['CONVERTER_MEMORY_LIMIT_MB'] = int(os.getenv('CONVERTER_MEMORY_LIMIT_MB', '4096'))  # Dönüştürücü process'i adres alanı sınırı (0 = sınırsız)
+app.config['CONVERTER_CPU_LIMIT_SECONDS'] = int(os.getenv('CONVERTER_CPU_LIMIT_SECONDS', '0'))  # Görev başına CPU süresi (0 = süre sınırı kadar)
+app.config['CONVERTER_MAX_OUTPUT_MB'] = int(os.getenv('CONVERTER_MAX_OUTPUT_MB', '2048'))  # Bir işin üretebileceği en fazla çıktı (0 = sınırsız)
 app.config['DISK_USAGE_WARNING_PERCENT'] = int(os.getenv('DISK_USAGE_WARNING_PERCENT', '85'))  # %85 disk uyarısı
 app.config['DISK_USAGE_CRITICAL_PERCENT'] = int(os.getenv('DISK_USAGE_CRITICAL_PERCENT', '95'))  # %95 disk kritiği
+app.config['ADMISSION_MAX_QUEUE'] = int(os.getenv('ADMISSION_MAX_QUEUE', str(app.config['MAX_CONCURRENT_JOBS'] * 4)))  # Process başına kuyrukta/çalışan en fazla iş
+app.config['ADMISSION_QUEUE_PER_SLOT'] = int(os.getenv('ADMISSION_QUEUE_PER_SLOT', '4'))  # Grup eşzamanlılık limiti başına kabul edilen iş
+app.config['ADMISSION_CHEAP_RESERVE_PERCENT'] = int(os.getenv('ADMISSION_CHEAP_RESERVE_PERCENT', '25'))  # Kuyruğun yalnızca ucuz işlere açık kısmı
+app.config['ADMISSION_CHEAP_COST'] = int(os.getenv('ADMISSION_CHEAP_COST', '32'))  # Bu tahmini maliyete kadar olan işler ucuz sayılır
+app.config['ADMISSION_MIN_FREE_MEMORY_MB'] = int(os.getenv('ADMISSION_MIN_FREE_MEMORY_MB', '512'))  # İş kabul edilirken boş kalması gereken bellek
+app.config['ADMISSION_DISK_HEADROOM_MB'] = int(os.getenv('ADMISSION_DISK_HEADROOM_MB', '1024'))  # İşin çıktısından sonra kalması gereken boş disk
+app.config['ADMISSION_RETRY_AFTER_SECONDS'] = int(os.getenv('ADMISSION_RETRY_AFTER_SECONDS', '30'))  # Retry-After taban değeri
+app.config['CONVERTER_COST_WEIGHTS'] = os.getenv('CONVERTER_COST_WEIGHTS', 'default=2,document=2,data=4,image=6,pdf=6,office=4,audio=2,video=8,archive=2')  # Grup başına girdi MB'ı başına maliyet
+app.config['CLEANUP_BATCH_SIZE'] = int(os.getenv('CLEANUP_BATCH_SIZE', '50'))  # Temizlik turunda en fazla silinen öğe
+app.config['CLEANUP_POLL_SECONDS'] = int(os.getenv('CLEANUP_POLL_SECONDS', '60'))  # Süresi dolan öğeler için en uzun bekleme
+app.config['CLEANUP_PRESSURE_GRACE_MINUTES'] = int(os.getenv('CLEANUP_PRESSURE_GRACE_MINUTES', '30'))  # Disk baskısında biten işlerin korunma süresi
+app.config['VIDEO_ENCODE_THREADS'] = int(os.getenv('VIDEO_ENCODE_THREADS', '0'))  # ffmpeg video thread sayısı (0 = otomatik)
+app.config['VIDEO_ENCODE_PRESET'] = os.getenv('VIDEO_ENCODE_PRESET', 'veryfast')  # x264 hız/sıkıştırma dengesi
+app.config['DOCUMENT_RENDERER'] = os.getenv('DOCUMENT_RENDERER', 'auto')  # 'auto', 'libreoffice', 'msoffice' veya 'none'
+app.config['LIBREOFFICE_PATH'] = os.getenv('LIBREOFFICE_PATH', '')  # Boşsa PATH'te soffice aranır
+app.config['LIBREOFFICE_PYTHON'] = os.getenv('LIBREOFFICE_PYTHON', '')  # 'uno' modülü olan Python (boşsa LibreOffice'inki ve sistemdeki aranır)
+app.config['OFFICE_RENDERER_POOL_SIZE'] = int(os.getenv('OFFICE_RENDERER_POOL_SIZE', '2'))  # Sıcak tutulan LibreOffice process'i
+app.config['OFFICE_RENDERER_MAX_JOBS'] = int(os.getenv('OFFICE_RENDERER_MAX_JOBS', '200'))  # Renderer bu kadar işten sonra yeniden başlatılır
+app.config['OFFICE_CONVERT_TIMEOUT'] = int(os.getenv('OFFICE_CONVERT_TIMEOUT', '120'))  # Belge başına süre sınırı (saniye)
+app.config['PDF_RENDER_WORKERS'] = int(os.getenv('PDF_RENDER_WORKERS', str(min(4, os.cpu_count() or 1))))  # PDF sayfa render process'i
+app.config['TABULAR_CHUNK_ROWS'] = int(os.getenv('TABULAR_CHUNK_ROWS', '50000'))  # Tablo dönüştürmelerinde parça başına satır
+app.config['PDF_TO_WORD_CHUNK_PAGES'] = int(os.getenv('PDF_TO_WORD_CHUNK_PAGES', '5'))  # PDF -> Word'de process başına sayfa
+app.config['CONVERTER_WARMUP'] = os.getenv('CONVERTER_WARMUP', '')  # Önceden yüklenecek gruplar/dönüştürücüler ('all', 'pdf,image' ...)
+app.config['CONVERTER_IMPORT_REPORT'] = os.getenv('CONVERTER_IMPORT_REPORT', 'false').lower() == 'true'  # Başlangıçta import maliyetlerini ölç
+app.config['PIPELINE_MAX_STEPS'] = int(os.getenv('PIPELINE_MAX_STEPS', '4'))  # Çok adımlı dönüşümde en fazla adım
+app.config['RESULT_CACHE_FOLDER'] = '_cache'  # DOWNLOAD_FOLDER altında
+app.config['UPLOAD_SPOOL_FOLDER'] = '_incoming'  # DOWNLOAD_FOLDER altında, yarım yüklemeler
+app.config['RESULT_CACHE_MAX_MB'] = int(os.getenv('RESULT_CACHE_MAX_MB', '1024'))  # Sonuç önbelleği boyut sınırı
+app.config['SESSION_BACKEND'] = os.getenv('SESSION_BACKEND', 'sqlite')  # 'sqlite' (worker'lar arası paylaşılır) veya 'memory'
+app.config['SESSION_DB_PATH'] = os.getenv('SESSION_DB_PATH', os.path.join('instance', 'sessions.db'))
+app.config['METRICS_FOLDER'] = os.getenv('METRICS_FOLDER', os.path.join('instance', 'metrics'))  # Worker metrik dosyaları (worker'lar arası toplanır)
 
 # Rate limiting için Flask-Limiter
 try:
@@ -75,177 +133,3050 @@ if not os.path.exists(app.config['DOWNLOAD_FOLDER']):
 executor = ThreadPoolExecutor(max_workers=app.config['MAX_CONCURRENT_DOWNLOADS'])
 
 # Session yönetimi - TTL ile otomatik temizleme
-class SessionManager:
+# Session verisi değiştirilebilir bir backend'de tutulur. SQLite (WAL modu) tüm gunicorn
+# worker'ları tarafından paylaşılır ve yeniden başlatmalarda korunur; bellek içi backend
+# ise tek process'li geliştirme ortamı için harici bir şeye ihtiyaç duymayan yedektir.
+
+class MemorySessionBackend:
+    """
+    Process içi session deposu (tek worker / geliştirme ortamı için).
+    Son kullanma zamanları bir min-heap'te tutulur; süresi dolan session'lar her
+    işlemde heap'in başından tembel olarak atılır, tüm session'lar taranmaz.
+    """
     def __init__(self):
         self.sessions = {}
-        self.session_timestamps = {}
+        self.expires_at = {}
+        # Her session için heap'te tek bir (son kullanma, session_id) kaydı bulunur.
+        # Süre uzatıldığında kayıt güncellenmez; kayıt başa geldiğinde yeni süreyle geri eklenir.
+        self.expiry_heap = []
+        self.lock = threading.RLock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _evict_expired(self, now):
+        expired_sessions = []
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            _, sid = heapq.heappop(self.expiry_heap)
+            expires_at = self.expires_at.get(sid)
+            if expires_at is None:
+                continue  # Silinmiş session'a ait eski kayıt
+            if expires_at > now:
+                heapq.heappush(self.expiry_heap, (expires_at, sid))
+                continue
+            self.sessions.pop(sid, None)
+            self.expires_at.pop(sid, None)
+            self.stats['evictions'] += 1
+            expired_sessions.append(sid)
+        return expired_sessions
+
+    def load(self, session_id):
+        with self.lock:
+            now = time.time()
+            self._evict_expired(now)
+            if session_id in self.sessions and self.expires_at[session_id] <= now:
+                # Heap kaydı henüz başa gelmemiş olsa da süresi dolmuş session döndürülmez
+                self.delete(session_id)
+                self.stats['evictions'] += 1
+            if session_id not in self.sessions:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return json.loads(json.dumps(self.sessions[session_id]))
+
+    def save(self, session_id, data, expires_at):
+        with self.lock:
+            self._evict_expired(time.time())
+            if session_id not in self.expires_at:
+                heapq.heappush(self.expiry_heap, (expires_at, session_id))
+            self.sessions[session_id] = json.loads(json.dumps(data))
+            self.expires_at[session_id] = expires_at
+
+    def mutate(self, session_id, func, expires_at):
+        with self.lock:
+            data = self.load(session_id)
+            if data is None:
+                return None
+            func(data)
+            self.save(session_id, data, expires_at)
+            return data
+
+    def delete(self, session_id):
+        with self.lock:
+            self.sessions.pop(session_id, None)
+            self.expires_at.pop(session_id, None)
+
+    def cleanup(self):
+        with self.lock:
+            return self._evict_expired(time.time())
+
+    def count(self):
+        with self.lock:
+            self._evict_expired(time.time())
+            return len(self.sessions)
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+class SQLiteSessionBackend:
+    """
+    SQLite (WAL modu) üzerinde session deposu. Tüm worker'lar aynı dosyayı paylaşır,
+    güncellemeler BEGIN IMMEDIATE ile atomik yapılır.
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.local = threading.local()
+        # Sayaçlar bu process'e aittir
+        self.stats_lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        db_folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_folder, exist_ok=True)
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS sessions ('
+            'session_id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)')
+
+    def _connect(self):
+        # Her thread (ve fork sonrası her process) kendi bağlantısını kullanır
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA busy_timeout=10000')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def load(self, session_id):
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT data, expires_at FROM sessions WHERE session_id = ?', (session_id,)
+        ).fetchone()
+        if row is None:
+            self._count('misses')
+            return None
+        if row[1] <= time.time():
+            # Süresi dolmuş session'ı okunduğu anda tembel olarak sil
+            conn.execute('DELETE FROM sessions WHERE session_id = ? AND expires_at = ?', (session_id, row[1]))
+            self._count('misses')
+            self._count('evictions')
+            return None
+        self._count('hits')
+        return json.loads(row[0])
+
+    def save(self, session_id, data, expires_at):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO sessions (session_id, data, expires_at) VALUES (?, ?, ?)',
+            (session_id, json.dumps(data), expires_at)
+        )
+
+    def mutate(self, session_id, func, expires_at):
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            data = self.load(session_id)
+            if data is not None:
+                func(data)
+                self.save(session_id, data, expires_at)
+            conn.execute('COMMIT')
+            return data
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def delete(self, session_id):
+        self._connect().execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def cleanup(self):
+        conn = self._connect()
+        now = time.time()
+        expired_sessions = [row[0] for row in conn.execute(
+            'SELECT session_id FROM sessions WHERE expires_at <= ?', (now,)
+        )]
+        if expired_sessions:
+            conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (now,))
+            with self.stats_lock:
+                self.stats['evictions'] += len(expired_sessions)
+        return expired_sessions
+
+    def count(self):
+        return self._connect().execute(
+            'SELECT COUNT(*) FROM sessions WHERE expires_at > ?', (time.time(),)
+        ).fetchone()[0]
+
+    def get_stats(self):
+        with self.stats_lock:
+            return dict(self.stats)
+
+def create_session_backend():
+    """SESSION_BACKEND ayarına göre session deposunu oluştur"""
+    if app.config['SESSION_BACKEND'] == 'sqlite':
+        try:
+            return SQLiteSessionBackend(app.config['SESSION_DB_PATH'])
+        except sqlite3.Error as e:
+            logging.error(f"SQLite session deposu açılamadı: {e}. Bellek içi depo kullanılıyor.")
+    return MemorySessionBackend()
+
+class SessionManager:
+    def __init__(self, backend):
+        self.backend = backend
         self.max_session_age = timedelta(hours=2)  # 2 saat
-    
+
+    def _expires_at(self):
+        return time.time() + self.max_session_age.total_seconds()
+
     def create_session(self, session_id, data):
         """Yeni session oluştur"""
-        self.cleanup_expired_sessions()
-        self.sessions[session_id] = data
-        self.session_timestamps[session_id] = datetime.now()
-    
+        self.backend.save(session_id, data, self._expires_at())
+
     def get_session(self, session_id):
-        """Session'ı al, yoksa None döndür"""
-        self.cleanup_expired_sessions()
-        return self.sessions.get(session_id)
-    
+        """Session'ın bir kopyasını al, yoksa veya süresi dolmuşsa None döndür"""
+        return self.backend.load(session_id)
+
     def update_session(self, session_id, data):
         """Session'ı güncelle"""
-        if session_id in self.sessions:
-            self.sessions[session_id].update(data)
-            self.session_timestamps[session_id] = datetime.now()
-    
+        return self.mutate_session(session_id, lambda session: session.update(data))
+
+    def mutate_session(self, session_id, func):
+        """Session'ı atomik olarak değiştir; func session sözlüğünü yerinde günceller"""
+        return self.backend.mutate(session_id, func, self._expires_at())
+
+    def set_status(self, session_id, key, status):
+        """Session'daki bir öğenin durum metnini güncelle"""
+        def apply(session):
+            session['status'][key] = status
+        return self.mutate_session(session_id, apply)
+
+    def add_file(self, session_id, file_path):
+        """Session'a indirilen bir dosya ekle"""
+        return self.mutate_session(session_id, lambda session: session['files'].append(file_path))
+
     def delete_session(self, session_id):
         """Session'ı sil"""
-        self.sessions.pop(session_id, None)
-        self.session_timestamps.pop(session_id, None)
-    
+        self.backend.delete(session_id)
+
+    def count_sessions(self):
+        """Aktif session sayısı"""
+        return self.backend.count()
+
+    def get_stats(self):
+        """Session deposu sayaçları (hits, misses, evictions) ve aktif session sayısı"""
+        stats = self.backend.get_stats()
+        stats['active'] = self.count_sessions()
+        stats['backend'] = type(self.backend).__name__
+        return stats
+
     def cleanup_expired_sessions(self):
         """Süresi dolmuş session'ları temizle"""
-        current_time = datetime.now()
-        expired_sessions = [
-            sid for sid, timestamp in self.session_timestamps.items()
-            if current_time - timestamp > self.max_session_age
-        ]
-        for sid in expired_sessions:
-            self.delete_session(sid)
+        for sid in self.backend.cleanup():
             logging.info(f"Süresi dolmuş session silindi: {sid}")
 
 # Global session manager
-session_manager = SessionManager()
+session_manager = SessionManager(create_session_backend())
 
-# --- SİSTEM YÖNETİMİ FONKSİYONLARI ---
+# --- DÖNÜŞTÜRÜCÜ İŞLEM HAVUZU ---
 
-def check_disk_space():
-    """Disk kullanımını kontrol et"""
-    try:
-        disk_usage = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
-        used_percent = (disk_usage.used / disk_usage.total) * 100
-        
-        if used_percent >= app.config['DISK_USAGE_CRITICAL_PERCENT']:
-            raise Exception(f"Kritik disk kullanımı: %{used_percent:.1f}! İşlem durduruldu.")
-        elif used_percent >= app.config['DISK_USAGE_WARNING_PERCENT']:
-            logging.warning(f"Yüksek disk kullanımı: %{used_percent:.1f}")
-        
-        return used_percent
-    except Exception as e:
-        logging.error(f"Disk kullanımı kontrol edilemedi: {e}")
-        return 0
+def parse_concurrency_limits(text):
+    """'video=1,pdf=2' biçimindeki ayarı {'video': 1, 'pdf': 2} sözlüğüne çevir (eşzamanlılık ve süre sınırları)"""
+    limits = {}
+    for item in (text or '').split(','):
+        if '=' not in item:
+            continue
+        name, value = item.split('=', 1)
+        try:
+            limits[name.strip()] = max(1, int(value))
+        except ValueError:
+            logging.warning(f"Geçersiz eşzamanlılık limiti yok sayıldı: {item}")
+    return limits
 
-def cleanup_old_files():
-    """Eski dosyaları ve klasörleri temizle"""
-    try:
-        downloads_dir = app.config['DOWNLOAD_FOLDER']
-        cutoff_time = datetime.now() - timedelta(hours=app.config['FILE_RETENTION_HOURS'])
-        total_cleaned = 0
-        
-        for item_name in os.listdir(downloads_dir):
-            item_path = os.path.join(downloads_dir, item_name)
-            
-            if os.path.isdir(item_path):
-                # Klasör oluşturma zamanını kontrol et
+def child_process_context():
+    """
+    Alt process'ler için multiprocessing bağlamını seç. Çok thread'li bir process'ten fork güvenli
+    değildir: fork anında başka bir thread'in tuttuğu kilit child'da hiç bırakılmaz. Bu yüzden fork
+    yalnızca tek thread'li process'lerde (dönüştürücü worker'ı gibi), diğerlerinde forkserver/spawn kullanılır.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if 'fork' in methods and threading.active_count() == 1:
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+class ConverterLimitExceeded(RuntimeError):
+    """Dönüştürücü süre, bellek, CPU veya çıktı boyutu sınırını aştığında fırlatılır"""
+
+def converter_limits(conversion_type):
+    """
+    Dönüştürücünün görev sınırlarını ayarlardan hesapla. Süre sınırı önce dönüştürme türüne,
+    sonra havuz grubuna, yoksa 'default' değerine göre seçilir.
+    """
+    group = CONVERTERS.get(conversion_type, {}).get('pool')
+    timeout = converter_timeouts.get(conversion_type) or converter_timeouts.get(group) or converter_timeouts.get('default', 0)
+    return {
+        'timeout': timeout,
+        'memory_mb': app.config['CONVERTER_MEMORY_LIMIT_MB'],
+        'cpu_seconds': app.config['CONVERTER_CPU_LIMIT_SECONDS'] or timeout,
+        'max_output_mb': app.config['CONVERTER_MAX_OUTPUT_MB']
+    }
+
+def _apply_task_limits(limits):
+    """
+    Görev başlamadan önce worker process'in kaynak sınırlarını ayarla. Yalnızca soft sınırlar
+    değiştirilir, böylece sonraki görevler için yeniden yükseltilebilir. Alt process'ler
+    (ffmpeg, PDF sayfa process'leri) sınırları devralır.
+    """
+    if resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # CPU sınırı process'in toplam CPU süresine uygulanır; önceki görevlerin süresi eklenir
+    used_cpu = int(usage.ru_utime + usage.ru_stime) + 1
+    settings = (
+        (resource.RLIMIT_AS, limits.get('memory_mb', 0) * 1024 * 1024),
+        (resource.RLIMIT_CPU, used_cpu + limits['cpu_seconds'] if limits.get('cpu_seconds') else 0),
+        (resource.RLIMIT_FSIZE, limits.get('max_output_mb', 0) * 1024 * 1024),
+    )
+    for kind, value in settings:
+        _, hard = resource.getrlimit(kind)
+        soft = value if value > 0 else hard
+        if hard != resource.RLIM_INFINITY and soft > hard:
+            soft = hard
+        try:
+            resource.setrlimit(kind, (soft, hard))
+        except (ValueError, OSError) as e:
+            logging.warning(f"Dönüştürücü kaynak sınırı uygulanamadı ({kind}): {e}")
+
+def _converter_worker_main(conn):
+    """
+    Dönüştürücü worker process'i: görevleri pipe'tan alır, her görevden önce kaynak sınırlarını
+    uygular ve sonucu ya da hatayı geri gönderir. None alınca çıkar.
+    """
+    if hasattr(os, 'setsid'):
+        # Ayrı process grubu: worker öldürülürken başlattığı ffmpeg/PDF process'leri de sonlanır
+        os.setsid()
+    if hasattr(signal, 'SIGXFSZ'):
+        # Python bu sinyali yok sayar; dosya boyutu sınırı aşılınca worker sonlansın ki hata ayırt edilebilsin
+        signal.signal(signal.SIGXFSZ, signal.SIG_DFL)
+    warm_up_converter_process()
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        function, args, kwargs, limits = task
+        _apply_task_limits(limits)
+        try:
+            reply = ('ok', function(*args, **kwargs))
+        except MemoryError:
+            reply = ('error', ConverterLimitExceeded("Dönüştürme bellek sınırını aştı. Dosya çok büyük veya bozuk olabilir."))
+        except Exception as e:
+            reply = ('error', e)
+        try:
+            conn.send(reply)
+        except Exception:
+            # Pickle edilemeyen hatalar metin olarak iletilir
+            conn.send(('error', RuntimeError(str(reply[1]))))
+
+class _ConverterWorker:
+    """Havuzdaki tek bir dönüştürücü process'i ve ona bağlı pipe"""
+    def __init__(self, mp_context):
+        self.conn, child_conn = mp_context.Pipe()
+        # daemon değil: pdf2docx/PyMuPDF parçaları worker içinde kendi process'lerini açar
+        self.process = mp_context.Process(target=_converter_worker_main, args=(child_conn,), name='converter-worker')
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.retire = False
+
+    def kill(self):
+        """Worker'ı ve başlattığı tüm alt process'leri sonlandır"""
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            self.process.kill()
+        self.process.join(5)
+        self.conn.close()
+
+    def stop(self):
+        """Boştaki worker'ı kapat"""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+
+class ConverterProcessPool:
+    """
+    CPU yoğun dönüştürücüleri ayrı process'lerde çalıştırır (GIL'e takılmadan tüm çekirdekler kullanılır).
+    - Her dönüştürücü grubu ('video', 'pdf' vb.) için ayrı eşzamanlılık limiti uygulanır.
+    - Her görev kendi worker process'inde, görev başına süre, bellek (adres alanı), CPU ve dosya
+      boyutu sınırlarıyla çalışır. Süre aşılır, iş iptal edilir ya da check() hata döndürürse
+      yalnızca o worker (ve alt process'leri) öldürülür; diğer görevler etkilenmez.
+    - Worker'lar belirli sayıda işten sonra yenilenir; böylece bellek büyümesi sınırlı kalır.
+    """
+    POLL_SECONDS = 0.5
+
+    def __init__(self, max_workers, max_tasks_per_worker, limits):
+        self.max_workers = max(1, max_workers)
+        self.max_tasks_per_worker = max(1, max_tasks_per_worker)
+        self.limits = limits
+        self.semaphores = {name: threading.BoundedSemaphore(limit) for name, limit in limits.items()}
+        self.slots = threading.BoundedSemaphore(self.max_workers)
+        self.lock = threading.Lock()
+        self.idle = []
+        self.busy = 0
+        self.recycle_count = 0
+        self.crash_count = 0
+        self.killed = {'timeout': 0, 'cancelled': 0, 'limit': 0}
+        # Web process'i çok thread'li olduğu için worker'lar fork ile değil forkserver/spawn ile başlatılır;
+        # worker uygulama modülünü bir kez import eder ve görevler arasında yeniden kullanılır
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self.mp_context = multiprocessing.get_context(start_method)
+
+    def _acquire_worker(self):
+        with self.lock:
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.process.is_alive():
+                    self.busy += 1
+                    return worker
+        # Worker başlatılamazsa (forkserver hatası, EMFILE, ENOMEM) meşgul sayılmaz
+        worker = _ConverterWorker(self.mp_context)
+        with self.lock:
+            self.busy += 1
+        return worker
+
+    def _release_worker(self, worker):
+        with self.lock:
+            self.busy -= 1
+            if worker.process.is_alive() and not worker.retire and worker.tasks < self.max_tasks_per_worker:
+                self.idle.append(worker)
+                return
+            if worker.tasks >= self.max_tasks_per_worker:
+                self.recycle_count += 1
+                logging.info("Dönüştürücü process'i yenilendi.")
+        if worker.process.is_alive():
+            worker.stop()
+
+    def _worker_died(self, worker, group):
+        """Görev sırasında sonlanan worker'ın çıkış koduna göre hatayı oluştur"""
+        worker.process.join(5)
+        exit_signal = -(worker.process.exitcode or 0)
+        worker.retire = True
+        if exit_signal and exit_signal == getattr(signal, 'SIGXCPU', None):
+            self.killed['limit'] += 1
+            return ConverterLimitExceeded("Dönüştürme CPU süresi sınırını aştı ve durduruldu.")
+        if exit_signal and exit_signal == getattr(signal, 'SIGXFSZ', None):
+            self.killed['limit'] += 1
+            return ConverterLimitExceeded("Dönüştürme çıktısı boyut sınırını aştı ve durduruldu.")
+        self.crash_count += 1
+        logging.error(f"Dönüştürücü process'i beklenmedik şekilde sonlandı ({group}, çıkış kodu {worker.process.exitcode}).")
+        return RuntimeError("Dönüştürme işlemi beklenmedik şekilde sonlandı. Dosya bozuk veya çok büyük olabilir.")
+
+    def _supervise(self, worker, group, task, limits, check):
+        """Görevi worker'a gönder; sonucu beklerken süre sınırını ve check() sonucunu denetle"""
+        timeout = limits.get('timeout')
+        deadline = time.monotonic() + timeout if timeout else None
+        worker.conn.send(task)
+        worker.tasks += 1
+        while True:
+            wait_seconds = self.POLL_SECONDS if deadline is None else max(0, min(self.POLL_SECONDS, deadline - time.monotonic()))
+            # Worker'ın açtığı alt process'ler pipe'ı açık tutabileceği için canlılık ayrıca kontrol edilir
+            if worker.conn.poll(wait_seconds):
                 try:
-                    creation_time = datetime.fromtimestamp(os.path.getctime(item_path))
-                    if creation_time < cutoff_time:
-                        shutil.rmtree(item_path)
-                        total_cleaned += 1
-                        logging.info(f"Eski klasör silindi: {item_name}")
-                except Exception as e:
-                    logging.error(f"Klasör silinemedi {item_name}: {e}")
-            
-            elif os.path.isfile(item_path) and item_path.endswith('.zip'):
-                # ZIP dosyalarını kontrol et
+                    status, value = worker.conn.recv()
+                except (EOFError, OSError):
+                    raise self._worker_died(worker, group)
+                if status == 'ok':
+                    return value
+                if isinstance(value, ConverterLimitExceeded):
+                    worker.retire = True  # Bellek hatasından sonra process'e güvenilmez
+                    self.killed['limit'] += 1
+                raise value
+            if not worker.process.is_alive():
+                raise self._worker_died(worker, group)
+
+            error = check() if check else None
+            if error is None and deadline is not None and time.monotonic() >= deadline:
+                error = ConverterLimitExceeded(f"Dönüştürme süre sınırını ({timeout} sn) aştı ve durduruldu.")
+                self.killed['timeout'] += 1
+            elif isinstance(error, JobCancelled):
+                self.killed['cancelled'] += 1
+            elif error is not None:
+                self.killed['limit'] += 1
+            if error is not None:
+                logging.warning(f"Dönüştürücü process'i sonlandırılıyor ({group}): {str(error) or 'iş iptal edildi'}")
+                worker.kill()
+                raise error
+
+    def run(self, group, function, args=(), kwargs=None, limits=None, check=None):
+        """
+        Fonksiyonu grubun limiti dahilinde bir worker process'te çalıştır ve sonucunu döndür.
+        limits: converter_limits() sözlüğü. check: görev sürerken periyodik çağrılır; bir hata
+        (JobCancelled, ConverterLimitExceeded) döndürürse worker öldürülür ve bu hata fırlatılır.
+        """
+        semaphore = self.semaphores.get(group)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            with self.slots:
+                # Sıra beklerken iptal edilen iş hiç başlatılmaz
+                error = check() if check else None
+                if error is not None:
+                    raise error
+                worker = self._acquire_worker()
                 try:
-                    creation_time = datetime.fromtimestamp(os.path.getctime(item_path))
-                    if creation_time < cutoff_time:
-                        os.remove(item_path)
-                        total_cleaned += 1
-                        logging.info(f"Eski ZIP dosyası silindi: {item_name}")
-                except Exception as e:
-                    logging.error(f"ZIP dosyası silinemedi {item_name}: {e}")
-        
-        if total_cleaned > 0:
-            logging.info(f"Temizlik tamamlandı: {total_cleaned} eski öğe silindi")
-            
-        return total_cleaned
-    except Exception as e:
-        logging.error(f"Dosya temizleme hatası: {e}")
-        return 0
+                    return self._supervise(worker, group, (function, args, kwargs or {}, limits or {}), limits or {}, check)
+                finally:
+                    self._release_worker(worker)
+        finally:
+            if semaphore:
+                semaphore.release()
 
-def get_system_stats():
-    """Sistem istatistiklerini al"""
-    try:
-        memory = psutil.virtual_memory()
-        disk = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
-        
+    def get_stats(self):
+        """Havuz istatistiklerini döndür"""
+        with self.lock:
+            busy, idle = self.busy, len(self.idle)
         return {
-            'memory_percent': memory.percent,
-            'disk_percent': (disk.used / disk.total) * 100,
-            'active_sessions': len(session_manager.sessions),
-            'download_folder_size': sum(
-                os.path.getsize(os.path.join(dirpath, filename))
-                for dirpath, dirnames, filenames in os.walk(app.config['DOWNLOAD_FOLDER'])
-                for filename in filenames
-            ) / (1024 * 1024)  # MB cinsinden
+            'workers': self.max_workers,
+            'busy': busy,
+            'idle': idle,
+            'limits': self.limits,
+            'timeouts': converter_timeouts,
+            'recycle_count': self.recycle_count,
+            'crash_count': self.crash_count,
+            'killed': dict(self.killed)
         }
-    except Exception as e:
-        logging.error(f"Sistem istatistikleri alınamadı: {e}")
-        return {}
 
-def schedule_cleanup():
-    """Periyodik temizleme işlemini başlat"""
-    def cleanup_worker():
-        while True:
+    def shutdown(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.stop()
+        # Çalışmakta olan worker'lar process kapanırken beklenmez
+        for child in multiprocessing.active_children():
+            if child.name == 'converter-worker':
+                try:
+                    os.killpg(child.pid, signal.SIGKILL)
+                except (AttributeError, ProcessLookupError, PermissionError):
+                    child.kill()
+
+# Dönüştürücü/grup başına süre sınırları (saniye)
+converter_timeouts = parse_concurrency_limits(app.config['CONVERTER_TIMEOUTS'])
+
+# Global dönüştürücü process havuzu
+converter_pool = ConverterProcessPool(
+    app.config['CONVERTER_PROCESS_WORKERS'],
+    app.config['CONVERTER_MAX_TASKS_PER_WORKER'],
+    parse_concurrency_limits(app.config['CONVERTER_CONCURRENCY_LIMITS'])
+)
+
+# --- METRİKLER ---
+
+# Metrik adı -> (tür, açıklama, histogram sınırları)
+CONVERTER_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+HTTP_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+METRIC_DEFINITIONS = {
+    'allconvert_converter_duration_seconds': ('histogram', 'Dönüştürücü çağrısı süresi', CONVERTER_DURATION_BUCKETS),
+    'allconvert_converter_calls_total': ('counter', 'Dönüştürücü çağrıları (result: ok, error, cancelled)', None),
+    'allconvert_converter_input_bytes_total': ('counter', 'Başarılı dönüştürmelere giren bayt', None),
+    'allconvert_converter_output_bytes_total': ('counter', 'Başarılı dönüştürmelerden çıkan bayt', None),
+    'allconvert_job_queue_wait_seconds': ('histogram', 'İşin kuyrukta bekleme süresi', CONVERTER_DURATION_BUCKETS),
+    'allconvert_jobs_total': ('counter', 'Biten işler (status: done, error, cancelled, cached)', None),
+    'allconvert_jobs_in_flight': ('gauge', 'Şu anda çalışan işler', None),
+    'allconvert_http_request_duration_seconds': ('histogram', 'HTTP isteği süresi (yanıt gövdesi akışı hariç)', HTTP_DURATION_BUCKETS),
+    'allconvert_http_requests_total': ('counter', 'HTTP istekleri', None),
+    'allconvert_admission_rejections_total': ('counter', 'Aşırı yük nedeniyle reddedilen istekler (reason: disk, memory, queue, converter_queue)', None),
+}
+
+@contextmanager
+def file_lock(path, blocking=True):
+    """
+    path üzerinde process'ler arası özel kilit tutar; kilit alındıysa True, blocking=False iken
+    başka bir process tutuyorsa False verir. fcntl olmayan sistemlerde kilit hep alınmış sayılır.
+    """
+    if fcntl is None:
+        yield True
+        return
+    with open(path, 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+class MetricsRegistry:
+    """
+    Sayaç, gösterge (gauge) ve histogram metriklerini process içinde tutar. Her worker kendi
+    anlık görüntüsünü METRICS_FOLDER altında worker_<pid>_<başlangıç>.json dosyasına en fazla
+    saniyede bir yazar; /metrics isteği hangi worker'a düşerse düşsün tüm dosyalar toplanarak
+    Prometheus metin formatında döndürülür. Dosya adındaki process başlangıç zamanı sayesinde pid'i
+    yeniden kullanan yeni bir worker eskisinin dosyasını ezmez. Ölü worker'ların sayaç ve histogramları
+    worker_exited.json'a eklenip dosyaları silinir, göstergeleri sayılmaz.
+    """
+    FLUSH_INTERVAL = 1.0
+    EXITED_FILE = 'worker_exited.json'
+    LOCK_FILE = 'collect.lock'
+
+    def __init__(self, folder, definitions):
+        self.folder = folder
+        self.definitions = definitions
+        self.lock = threading.Lock()
+        self.values = {name: {} for name in definitions}
+        self.last_flush = 0.0
+        self.flush_timer = None
+        self.identity = None
+        os.makedirs(folder, exist_ok=True)
+
+    @staticmethod
+    def _started(process):
+        # Dosya adında ve karşılaştırmada aynı yuvarlanmış değer kullanılır
+        return round(process.create_time(), 2)
+
+    def _worker_identity(self):
+        """(pid, başlangıç zamanı); fork sonrası yeni process kendi kimliğini hesaplar"""
+        if self.identity is None or self.identity[0] != os.getpid():
+            import psutil
+            self.identity = (os.getpid(), self._started(psutil.Process()))
+        return self.identity
+
+    @staticmethod
+    def _label_key(labels):
+        return json.dumps(sorted(labels.items()))
+
+    def _changed(self):
+        # self.lock tutulurken çağrılır; yazımı en fazla FLUSH_INTERVAL'da bire indir
+        delay = self.last_flush + self.FLUSH_INTERVAL - time.time()
+        if delay <= 0:
+            return True
+        if self.flush_timer is None:
+            self.flush_timer = threading.Timer(delay, self.flush)
+            self.flush_timer.daemon = True
+            self.flush_timer.start()
+        return False
+
+    def inc(self, name, amount=1, **labels):
+        """Sayacı (veya göstergeyi) amount kadar artır"""
+        with self.lock:
+            series = self.values[name]
+            key = self._label_key(labels)
+            series[key] = series.get(key, 0) + amount
+            flush_now = self._changed()
+        if flush_now:
+            self.flush()
+
+    def observe(self, name, value, **labels):
+        """Histograma bir ölçüm ekle"""
+        buckets = self.definitions[name][2]
+        with self.lock:
+            series = self.values[name]
+            key = self._label_key(labels)
+            histogram = series.setdefault(key, {'buckets': [0] * (len(buckets) + 1), 'sum': 0.0, 'count': 0})
+            index = next((i for i, bound in enumerate(buckets) if value <= bound), len(buckets))
+            histogram['buckets'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+            flush_now = self._changed()
+        if flush_now:
+            self.flush()
+
+    @contextmanager
+    def in_flight(self, name, **labels):
+        """Blok süresince göstergeyi bir artır"""
+        self.inc(name, 1, **labels)
+        try:
+            yield
+        finally:
+            self.inc(name, -1, **labels)
+
+    def flush(self):
+        """Bu process'in anlık görüntüsünü atomik olarak dosyaya yaz"""
+        pid, started = self._worker_identity()
+        with self.lock:
+            self.flush_timer = None
+            self.last_flush = time.time()
+            snapshot = json.dumps({'pid': pid, 'started': started, 'updated': self.last_flush, 'values': self.values})
+        self._write(f"worker_{pid}_{int(started * 100)}.json", snapshot)
+
+    def _write(self, filename, text):
+        path = os.path.join(self.folder, filename)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Metrikler yazılamadı: {e}")
+            return False
+        return True
+
+    def _is_alive(self, snapshot):
+        """Dosyayı yazan worker hâlâ çalışıyor mu; aynı pid'i alan başka bir process sayılmaz"""
+        import psutil
+        started = snapshot.get('started')
+        if started is None:
+            return psutil.pid_exists(snapshot['pid'])  # Başlangıç zamanı yazmayan eski dosya
+        try:
+            return self._started(psutil.Process(snapshot['pid'])) == started
+        except psutil.Error:
+            return False
+
+    def _merge(self, merged, values, include_gauges):
+        for name, series in values.items():
+            if name not in self.definitions:
+                continue
+            kind = self.definitions[name][0]
+            if kind == 'gauge' and not include_gauges:
+                continue
+            target = merged[name]
+            for key, value in series.items():
+                if kind == 'histogram':
+                    current = target.setdefault(key, {'buckets': [0] * len(value['buckets']), 'sum': 0.0, 'count': 0})
+                    current['buckets'] = [a + b for a, b in zip(current['buckets'], value['buckets'])]
+                    current['sum'] += value['sum']
+                    current['count'] += value['count']
+                else:
+                    target[key] = target.get(key, 0) + value
+
+    def collect(self):
+        """
+        Tüm worker dosyalarını topla: sayaç/histogramlar toplanır, göstergeler yalnızca canlı worker'lardan.
+        Ölü worker dosyaları worker_exited.json'a katlanıp silinir; toplama ve katlama aynı dosya kilidi
+        altında yapıldığından iki /metrics isteği bir dosyayı iki kez saymaz.
+        """
+        self.flush()
+        merged = {name: {} for name in self.definitions}
+        with file_lock(os.path.join(self.folder, self.LOCK_FILE)):
+            exited = {name: {} for name in self.definitions}
+            dead_paths = []
+            for entry in os.scandir(self.folder):
+                if not (entry.name.startswith('worker_') and entry.name.endswith('.json')):
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if entry.name == self.EXITED_FILE:
+                    self._merge(exited, snapshot['values'], include_gauges=False)
+                elif self._is_alive(snapshot):
+                    self._merge(merged, snapshot['values'], include_gauges=True)
+                else:
+                    self._merge(exited, snapshot['values'], include_gauges=False)
+                    dead_paths.append(entry.path)
+            self._merge(merged, exited, include_gauges=False)
+            if dead_paths and self._write(self.EXITED_FILE, json.dumps({'values': exited})):
+                for path in dead_paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return merged
+
+    @staticmethod
+    def _format_labels(pairs):
+        if not pairs:
+            return ''
+        formatted = []
+        for name, value in pairs:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            formatted.append(f'{name}="{value}"')
+        return '{' + ','.join(formatted) + '}'
+
+    def render(self):
+        """Toplanmış metrikleri Prometheus metin formatında döndür"""
+        lines = []
+        for name, series in self.collect().items():
+            kind, help_text, buckets = self.definitions[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(series.items()):
+                pairs = [tuple(pair) for pair in json.loads(key)]
+                if kind != 'histogram':
+                    lines.append(f"{name}{self._format_labels(pairs)} {value}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(buckets) + ['+Inf'], value['buckets']):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{self._format_labels(pairs + [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{self._format_labels(pairs)} {value['sum']}")
+                lines.append(f"{name}_count{self._format_labels(pairs)} {value['count']}")
+        return '\n'.join(lines) + '\n'
+
+metrics = MetricsRegistry(app.config['METRICS_FOLDER'], METRIC_DEFINITIONS)
+
+# --- İŞ KUYRUĞU (DÖNÜŞTÜRME İŞLERİ) ---
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Yüklemeler 1 MB'lık parçalarla işlenir
+
+class JobCancelled(Exception):
+    """İş kullanıcı tarafından iptal edildiğinde dönüştürücü tarafından fırlatılır"""
+
+class JobManager:
+    """
+    Dönüştürme işlerini web isteğinden bağımsız bir worker havuzunda çalıştırır.
+    Her işin durumu kendi job klasöründeki job.json dosyasında tutulur; böylece
+    durum sorgusu farklı bir gunicorn worker'ına düşse bile aynı bilgi okunur.
+    """
+    STATUS_FILE = 'job.json'
+    CANCEL_FILE = 'cancel'  # İptal isteği işareti; job.json'dan ayrı olduğu için ilerleme yazımıyla çakışmaz
+    PROGRESS_FILE = 'progress.json'  # Dönüştürücü process'lerinin yazdığı ilerleme; job.json'a kilitsiz dokunulmaz
+    FINISHED_STATUSES = ('done', 'error', 'cancelled')
+    BATCH_WORK_FOLDER = 'work'
+    BATCH_RESULTS_FOLDER = 'results'
+    BATCH_MANIFEST_FILE = 'manifest.json'
+    JOB_ID_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+    def __init__(self, max_workers):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self.lock = threading.Lock()
+        # Bu process'te kuyrukta bekleyen ve çalışan işler (yük kontrolü için)
+        self.active_total = 0
+        self.active_groups = {}
+        # Eşzamanlılık limiti dolu gruplarda job thread'i tutmadan bekleyen işler
+        self.group_running = {}
+        self.group_waiting = {}
+
+    def _dispatch(self, group, function, *args):
+        """
+        İşi job thread havuzuna gönder. CONVERTER_CONCURRENCY_LIMITS'te limiti olan bir grubun limiti
+        doluysa iş bir thread tutmadan grubun kuyruğunda bekler; böylece sırası gelmeyen video işleri
+        diğer grupların işlerini bekletmez. Gruptaki bir iş bitince sıradaki gönderilir.
+        """
+        limit = converter_pool.limits.get(group)
+        with self.lock:
+            if limit and self.group_running.get(group, 0) >= limit:
+                self.group_waiting.setdefault(group, deque()).append((function, args))
+                return
+            self.group_running[group] = self.group_running.get(group, 0) + 1
+        self.executor.submit(self._run_in_group, group, function, args)
+
+    def _run_in_group(self, group, function, args):
+        try:
+            function(*args)
+        finally:
+            with self.lock:
+                waiting = self.group_waiting.get(group)
+                if waiting:
+                    next_task = waiting.popleft()
+                else:
+                    next_task = None
+                    self.group_running[group] -= 1
+            if next_task:
+                self.executor.submit(self._run_in_group, group, *next_task)
+
+    def _track(self, conversion_types, delta):
+        """Kuyruktaki/çalışan işleri toplamda ve dönüştürücü grubu bazında say"""
+        groups = {CONVERTERS.get(conversion_type, {}).get('pool') or conversion_type for conversion_type in conversion_types}
+        with self.lock:
+            self.active_total += delta
+            for group in groups:
+                self.active_groups[group] = self.active_groups.get(group, 0) + delta
+
+    def get_load(self):
+        """(toplam iş, {grup: iş}) olarak bu process'in kuyruk derinliğini döndür"""
+        with self.lock:
+            return self.active_total, dict(self.active_groups)
+
+    def create_job_folder(self, conversion_type):
+        """Yeni iş için benzersiz bir klasör oluştur, (job_id, job_folder) döndür"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Güvenli bir temel ad oluştur
+        base_name = re.sub(r'[^a-zA-Z0-9_.-]', '', f"job_{conversion_type}")
+        job_id = f"{timestamp}_{base_name}_{os.urandom(4).hex()}"
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        os.makedirs(job_folder, exist_ok=True)
+        cleanup_scheduler.schedule(job_id)
+        return job_id, job_folder
+
+    def get_job_folder(self, job_id):
+        """job_id'yi doğrula ve klasör yolunu döndür, geçersizse None"""
+        if not job_id or not self.JOB_ID_PATTERN.match(job_id) or job_id.startswith('.'):
+            return None
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        return job_folder if os.path.isdir(job_folder) else None
+
+    def submit(self, job_id, conversion_type, args, options=None, cache_key=None, steps=None):
+        """
+        İşi kuyruğa ekle. Dönüştürücü (*args, **options) ile çağrılır,
+        sonuç cache_key verilmişse önbelleğe alınır. steps verilirse iş çok adımlı
+        bir dönüşümdür ve args (girdi_yolu, job_klasörü) olmalıdır.
+        """
+        fields = {'steps': steps, 'step': None} if steps else {}
+        self._write_state(job_id, self._new_state(job_id, conversion_type, status='queued', **fields))
+        download_index.refresh(job_id)
+        self._track(steps or [conversion_type], 1)
+        group = CONVERTERS[steps[0] if steps else conversion_type].get('pool')
+        self._dispatch(group, self._run, job_id, conversion_type, args, options or {}, cache_key, steps, time.time())
+
+    def complete_from_cache(self, job_id, conversion_type, output_path):
+        """Önbellekten karşılanan işi doğrudan tamamlanmış olarak kaydet"""
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        now = datetime.now().isoformat()
+        self._write_state(job_id, self._new_state(
+            job_id, conversion_type, status='done', started_at=now, finished_at=now,
+            output_file=os.path.relpath(output_path, job_folder), cached=True
+        ))
+        download_index.refresh(job_id)
+        metrics.inc('allconvert_jobs_total', conversion_type=conversion_type, status='cached')
+        logging.info(f"İş önbellekten karşılandı ({job_id}): {output_path}")
+
+    def _new_state(self, job_id, conversion_type, **fields):
+        state = {
+            'job_id': job_id,
+            'conversion_type': conversion_type,
+            'status': 'queued',
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'output_file': None,
+            'cached': False,
+            'progress': None,
+            'error': None
+        }
+        state.update(fields)
+        return state
+
+    def get_job(self, job_id):
+        """İş durumunu oku, yoksa None döndür. Çalışan işte dönüştürücünün son ilerlemesi de eklenir."""
+        job_folder = self.get_job_folder(job_id)
+        if not job_folder:
+            return None
+        state = self._read_state(job_folder)
+        if state is not None and state['status'] == 'running':
+            try:
+                with open(os.path.join(job_folder, self.PROGRESS_FILE), 'r', encoding='utf-8') as f:
+                    state.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+        return state
+
+    def _read_state(self, job_folder):
+        try:
+            with open(os.path.join(job_folder, self.STATUS_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def update_job(self, job_id, **fields):
+        """
+        İş durumunu güncelle. İlerleme burada yazılırsa dönüştürücünün eski ilerlemesi silinir;
+        iş bitince dönüştürücünün son ilerlemesi job.json'a aktarılır.
+        """
+        with self.lock:
+            job_folder = self.get_job_folder(job_id)
+            state = self._read_state(job_folder) if job_folder else None
+            if state is None:
+                return None
+            progress_path = os.path.join(job_folder, self.PROGRESS_FILE)
+            finished = fields.get('status') in self.FINISHED_STATUSES
+            if finished and 'progress' not in fields:
+                try:
+                    with open(progress_path, 'r', encoding='utf-8') as f:
+                        state.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+            state.update(fields)
+            self._write_state(job_id, state)
+            if finished or 'progress' in fields:
+                try:
+                    os.remove(progress_path)
+                except FileNotFoundError:
+                    pass
+            return state
+
+    def write_progress(self, job_folder, fields):
+        """
+        Dönüştürücünün ilerlemesini ayrı bir dosyaya yaz. Dönüştürücü process havuzunda çalıştığı
+        için JobManager.lock'u ve job.json'u kullanmaz; get_job bu dosyayı duruma ekler.
+        Klasör bir job klasörü değilse (toplu işteki tek dosya gibi) hiçbir şey yazılmaz.
+        """
+        if not os.path.exists(os.path.join(job_folder, self.STATUS_FILE)):
+            return
+        progress_path = os.path.join(job_folder, self.PROGRESS_FILE)
+        temp_path = f"{progress_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(fields, f)
+        os.replace(temp_path, progress_path)
+
+    def cancel(self, job_id):
+        """
+        İşi iptal et. Kuyruktaki iş hiç başlamaz; process havuzunda çalışan dönüştürücünün worker'ı
+        en geç ConverterProcessPool.POLL_SECONDS içinde öldürülür, diğerleri iptali fark ettiğinde
+        (is_cancel_requested) durur. İş bulunamazsa None, bitmişse mevcut durumu döndürür.
+        """
+        job = self.get_job(job_id)
+        if job is None or job['status'] in self.FINISHED_STATUSES:
+            return job
+        with open(os.path.join(self.get_job_folder(job_id), self.CANCEL_FILE), 'w') as f:
+            f.write(datetime.now().isoformat())
+        logging.info(f"İş için iptal istendi ({job_id})")
+        return job
+
+    def is_cancel_requested(self, job_id):
+        """İş için iptal istenmiş mi?"""
+        return os.path.exists(os.path.join(app.config['DOWNLOAD_FOLDER'], job_id, self.CANCEL_FILE))
+
+    def supervision_check(self, job_id):
+        """
+        Process havuzunun görev sürerken çağırdığı kontrolü döndür: iş iptal edildiyse JobCancelled,
+        job klasörü başlangıca göre CONVERTER_MAX_OUTPUT_MB'den fazla büyüdüyse ConverterLimitExceeded.
+        """
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        max_bytes = app.config['CONVERTER_MAX_OUTPUT_MB'] * 1024 * 1024
+        # Girdi dosyaları sınıra sayılmaz
+        initial_bytes = download_index.folder_bytes(job_folder) if max_bytes else 0
+
+        def check():
+            if self.is_cancel_requested(job_id):
+                return JobCancelled()
+            if max_bytes and download_index.folder_bytes(job_folder) - initial_bytes > max_bytes:
+                return ConverterLimitExceeded(f"Dönüştürme çıktısı {app.config['CONVERTER_MAX_OUTPUT_MB']} MB "
+                                              "sınırını aştı ve durduruldu.")
+            return None
+        return check
+
+    def discard_job_files(self, job_id, keep=()):
+        """
+        İptal edilen ya da sınırı aştığı için durdurulan işin girdi ve (yarım) çıktılarını sil.
+        Durum sorgulanabilsin diye job.json ve keep'teki dosyalar kalır; klasör süresi dolunca silinir.
+        """
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        kept = {self.STATUS_FILE, self.CANCEL_FILE, *keep}
+        try:
+            entries = list(os.scandir(job_folder))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name in kept:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+            except OSError as e:
+                logging.warning(f"Durdurulan işin dosyası silinemedi ({job_id}, {entry.name}): {e}")
+        download_index.refresh(job_id)
+
+    def get_output_path(self, job_id):
+        """Tamamlanan işin çıktı dosyasının yolunu döndür"""
+        job = self.get_job(job_id)
+        if not job or job.get('status') != 'done' or not job.get('output_file'):
+            return None
+        job_folder = os.path.abspath(self.get_job_folder(job_id))
+        output_path = os.path.abspath(os.path.join(job_folder, job['output_file']))
+        # Çıktının job klasörü dışına taşmadığından emin ol
+        if not output_path.startswith(job_folder + os.sep) or not os.path.exists(output_path):
+            return None
+        return output_path
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+    def submit_batch(self, job_id, conversion_type, inputs, options=None):
+        """
+        Toplu işi kuyruğa ekle. inputs her dosya için {'file', 'path', 'hash'} ya da
+        kabul edilmeyen dosyalar için {'file', 'error'} sözlüklerinden oluşur.
+        """
+        self._write_state(job_id, self._new_state(
+            job_id, conversion_type, status='queued', batch=True,
+            files_total=len(inputs), files_done=0, files_failed=0
+        ))
+        download_index.refresh(job_id)
+        self._track([conversion_type], 1)
+        self._dispatch(CONVERTERS[conversion_type].get('pool'), self._run_batch, job_id, conversion_type, inputs,
+                       options or {}, time.time())
+
+    def _run_batch(self, job_id, conversion_type, inputs, options, queued_at=None):
+        """
+        Toplu işteki dosyaları BATCH_MAX_PARALLEL eşzamanlılıkla dönüştür. Başarısız dosyalar
+        işi durdurmaz; her dosyanın sonucu manifest.json'a yazılır. Çıktılar 'results'
+        klasöründe toplanır ve indirilirken tek bir ZIP olarak akıtılır.
+        """
+        try:
+            if queued_at:
+                metrics.observe('allconvert_job_queue_wait_seconds', time.time() - queued_at, conversion_type=conversion_type)
+            if self.is_cancel_requested(job_id):
+                self.update_job(job_id, status='cancelled', finished_at=datetime.now().isoformat())
+                self.discard_job_files(job_id)
+                metrics.inc('allconvert_jobs_total', conversion_type=conversion_type, status='cancelled')
+                return
+            with metrics.in_flight('allconvert_jobs_in_flight', conversion_type=conversion_type):
+                status = self._run_batch_files(job_id, conversion_type, inputs, options)
+            metrics.inc('allconvert_jobs_total', conversion_type=conversion_type, status=status)
+        finally:
+            self._track([conversion_type], -1)
+
+    def _run_batch_files(self, job_id, conversion_type, inputs, options):
+        """_run_batch'in dönüştürme kısmı; işin son durumunu döndürür"""
+        self.update_job(job_id, status='running', started_at=datetime.now().isoformat())
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        results_folder = os.path.join(job_folder, self.BATCH_RESULTS_FOLDER)
+        os.makedirs(results_folder, exist_ok=True)
+        used_names = set()
+        names_lock = threading.Lock()
+
+        def convert_one(item):
+            work_folder = os.path.dirname(item['path'])
+            base_name = item['file'].rsplit('.', 1)[0]
+            result = {'file': item['file'], 'status': 'error', 'output': None, 'cached': False, 'error': None}
+            try:
+                cache_key = result_cache.make_key(item['hash'], conversion_type, options)
+                output_path = result_cache.fetch(cache_key, work_folder, base_name)
+                result['cached'] = bool(output_path)
+                if not output_path:
+                    output_path = self._convert(job_id, conversion_type, (item['path'], work_folder), options)
+                    if output_path and os.path.exists(output_path):
+                        result_cache.store(cache_key, output_path)
+                if not output_path or not os.path.exists(output_path):
+                    result['error'] = "Dosya dönüştürülemedi."
+                    return result
+                # Aynı adlı çıktılar arşivde çakışmasın
+                with names_lock:
+                    arcname = os.path.basename(output_path)
+                    if arcname in used_names:
+                        arcname = f"{base_name}_{arcname}"
+                    while arcname in used_names:
+                        arcname = f"{len(used_names)}_{arcname}"
+                    used_names.add(arcname)
+                os.replace(output_path, os.path.join(results_folder, arcname))
+                result.update(status='done', output=arcname)
+            except JobCancelled:
+                result['status'] = 'cancelled'
+            except Exception as e:
+                logging.error(f"Toplu işte dosya dönüştürülemedi ({job_id}, {item['file']}): {e}")
+                result['error'] = get_user_error_message(e)
+            finally:
+                shutil.rmtree(work_folder, ignore_errors=True)
+            return result
+
+        results = [{'file': item['file'], 'status': 'skipped', 'output': None, 'cached': False, 'error': item['error']}
+                   if item.get('error') else None for item in inputs]
+        done = failed = sum(1 for result in results if result)
+        cancelled = False
+        batch_pool = ThreadPoolExecutor(max_workers=app.config['BATCH_MAX_PARALLEL'], thread_name_prefix='batch')
+        try:
+            futures = {batch_pool.submit(convert_one, item): index
+                       for index, item in enumerate(inputs) if not item.get('error')}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                results[futures[future]] = future.result()
+                done += 1
+                failed += results[futures[future]]['status'] != 'done'
+                self.update_job(job_id, files_done=done, files_failed=failed,
+                                progress=int(done / len(inputs) * 100))
+                if not cancelled and self.is_cancel_requested(job_id):
+                    # Başlamamış dosyalar bırakılır, process havuzunda çalışanlar durdurulur
+                    cancelled = True
+                    for pending in futures:
+                        pending.cancel()
+        finally:
+            batch_pool.shutdown(wait=True)
+            shutil.rmtree(os.path.join(job_folder, self.BATCH_WORK_FOLDER), ignore_errors=True)
+
+        manifest = [result or {'file': item['file'], 'status': 'cancelled', 'output': None, 'cached': False, 'error': None}
+                    for item, result in zip(inputs, results)]
+        with open(os.path.join(job_folder, self.BATCH_MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        succeeded = sum(1 for result in manifest if result['status'] == 'done')
+        if cancelled:
+            status, error = 'cancelled', None
+            self.discard_job_files(job_id, keep=(self.BATCH_MANIFEST_FILE,))
+        elif succeeded:
+            status, error = 'done', None
+        else:
+            status, error = 'error', "Toplu işteki hiçbir dosya dönüştürülemedi. Ayrıntılar manifest dosyasında."
+        self.update_job(job_id, status=status, error=error, output_file=self.BATCH_MANIFEST_FILE,
+                        files_done=done, files_failed=len(manifest) - succeeded,
+                        finished_at=datetime.now().isoformat())
+        download_index.refresh(job_id)
+        logging.info(f"Toplu iş bitti ({job_id}): {succeeded}/{len(manifest)} dosya dönüştürüldü.")
+        return status
+
+    def get_batch_entries(self, job_id):
+        """Toplu işin indirilecek ZIP girdilerini (arşiv_adı, yol) olarak döndür"""
+        job_folder = self.get_job_folder(job_id)
+        results_folder = os.path.join(job_folder, self.BATCH_RESULTS_FOLDER)
+        entries = [(entry.name, entry.path) for entry in sorted(os.scandir(results_folder), key=lambda e: e.name)
+                   if entry.is_file()]
+        entries.append((self.BATCH_MANIFEST_FILE, os.path.join(job_folder, self.BATCH_MANIFEST_FILE)))
+        return entries
+
+    def _write_state(self, job_id, state):
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz, sonra değiştir
+        job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+        status_path = os.path.join(job_folder, self.STATUS_FILE)
+        temp_path = f"{status_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, status_path)
+
+    def _convert(self, job_id, conversion_type, args, options):
+        """Dönüştürücüyü çalıştır ve çıktı yolunu döndür"""
+        converter_registry.require(conversion_type)
+        converter_info = CONVERTERS[conversion_type]
+        if converter_info.get('pool'):
+            # CPU yoğun dönüştürücüler process havuzunda, süre/bellek/çıktı sınırları altında çalışır
+            call = lambda: converter_pool.run(converter_info['pool'], converter_info['function'], args, options,
+                                              limits=converter_limits(conversion_type),
+                                              check=self.supervision_check(job_id))
+        else:
+            call = lambda: converter_info['function'](*args, **options)
+        return self._measure_converter(conversion_type, args[0], call)
+
+    def _measure_converter(self, label, input_path, call):
+        """Dönüştürücü çağrısının süresini, sonucunu ve giren/çıkan bayt sayısını metriklere yaz"""
+        started = time.perf_counter()
+        result = 'error'
+        output_path = None
+        try:
+            output_path = call()
+            if output_path and os.path.exists(output_path):
+                result = 'ok'
+            return output_path
+        except JobCancelled:
+            result = 'cancelled'
+            raise
+        finally:
+            metrics.observe('allconvert_converter_duration_seconds', time.perf_counter() - started, converter=label)
+            metrics.inc('allconvert_converter_calls_total', converter=label, result=result)
+            if result == 'ok':
+                # Çevrimiçi servislerde girdi dosyası yoktur (form verisi)
+                if isinstance(input_path, str) and os.path.isfile(input_path):
+                    metrics.inc('allconvert_converter_input_bytes_total', os.path.getsize(input_path), converter=label)
+                metrics.inc('allconvert_converter_output_bytes_total', os.path.getsize(output_path), converter=label)
+
+    def _convert_pipeline(self, job_id, steps, input_path, job_folder, options):
+        """
+        Çok adımlı dönüşümü aynı job klasöründe sırayla çalıştır ve son çıktının yolunu döndür.
+        Bellek içi çalışabilen ('memory_step') ardışık adımlar tek çağrıda birleştirilir, böylece
+        aralarında dosya yazılmaz. Diğer ara çıktılar bir sonraki adım bitince silinir.
+        Her adım options'tan yalnızca kendi tanımladığı alanları alır.
+        """
+        current_path = input_path
+        index = 0
+        while index < len(steps):
+            if self.is_cancel_requested(job_id):
+                raise JobCancelled()
+            group = [steps[index]]
+            while (index + len(group) < len(steps) and 'memory_step' in CONVERTERS[group[-1]]
+                   and 'memory_step' in CONVERTERS[steps[index + len(group)]]):
+                group.append(steps[index + len(group)])
+            self.update_job(job_id, step=index + 1, progress=int(index / len(steps) * 100))
+
+            if len(group) > 1:
+                output_path = self._measure_converter(
+                    '+'.join(group), current_path,
+                    lambda: converter_pool.run(CONVERTERS[group[0]]['pool'], run_image_pipeline,
+                                               (current_path, job_folder, group),
+                                               limits=converter_limits(group[0]), check=self.supervision_check(job_id))
+                )
+            else:
+                option_names = {option['name'] for option in CONVERTERS[group[0]].get('options', [])}
+                step_options = {name: value for name, value in options.items() if name in option_names}
+                output_path = self._convert(job_id, group[0], (current_path, job_folder), step_options)
+            if not output_path or not os.path.exists(output_path):
+                return None
+            if current_path != input_path:
+                os.remove(current_path)
+            current_path = output_path
+            index += len(group)
+
+            # Ara çıktı bir sonraki adımın kabul ettiği türde olmalı (örn: çok sayfalı PDF -> JPG bir ZIP üretir)
+            if index < len(steps):
+                extension = output_path.rsplit('.', 1)[-1].lower()
+                if extension not in CONVERTERS[steps[index]]['allowed_extensions']:
+                    raise ValueError(f"'{group[-1]}' adımı .{extension} dosyası üretti; "
+                                     f"'{steps[index]}' adımı bu dosyayı işleyemiyor.")
+        self.update_job(job_id, progress=100)
+        return current_path
+
+    def _run(self, job_id, conversion_type, args, options, cache_key=None, steps=None, queued_at=None):
+        """Worker thread'inde dönüştürücüyü çalıştır ve sonucu kaydet"""
+        try:
+            if queued_at:
+                metrics.observe('allconvert_job_queue_wait_seconds', time.time() - queued_at, conversion_type=conversion_type)
+            if self.is_cancel_requested(job_id):
+                self.update_job(job_id, status='cancelled', finished_at=datetime.now().isoformat())
+                self.discard_job_files(job_id)
+                metrics.inc('allconvert_jobs_total', conversion_type=conversion_type, status='cancelled')
+                return
+            with metrics.in_flight('allconvert_jobs_in_flight', conversion_type=conversion_type):
+                self._run_converter(job_id, conversion_type, args, options, cache_key, steps)
+            job = self.get_job(job_id)
+            metrics.inc('allconvert_jobs_total', conversion_type=conversion_type, status=job['status'] if job else 'error')
+        finally:
+            # Yük kontrolünün kuyruk sayacı
+            self._track(steps or [conversion_type], -1)
+
+    def _run_converter(self, job_id, conversion_type, args, options, cache_key, steps):
+        """_run'ın dönüştürme kısmı; sonucu job.json'a yazar"""
+        self.update_job(job_id, status='running', started_at=datetime.now().isoformat())
+        try:
+            if steps:
+                output_path = self._convert_pipeline(job_id, steps, *args, options)
+            else:
+                output_path = self._convert(job_id, conversion_type, args, options)
+            job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], job_id)
+
+            if output_path and os.path.exists(output_path):
+                self.update_job(job_id, status='done',
+                                output_file=os.path.relpath(output_path, job_folder),
+                                finished_at=datetime.now().isoformat())
+                logging.info(f"İş tamamlandı ({job_id}): {output_path}")
+                if cache_key:
+                    result_cache.store(cache_key, output_path)
+            else:
+                self.update_job(job_id, status='error',
+                                error="Dosya dönüştürme sırasında bir hata oluştu veya dönüştürücü bir dosya döndürmedi. Lütfen tekrar deneyin.",
+                                finished_at=datetime.now().isoformat())
+        except JobCancelled:
+            logging.info(f"İş iptal edildi ({job_id})")
+            self.update_job(job_id, status='cancelled', finished_at=datetime.now().isoformat())
+            self.discard_job_files(job_id)
+        except ConverterLimitExceeded as e:
+            logging.warning(f"İş sınırı aştığı için durduruldu ({job_id}): {e}")
+            self.update_job(job_id, status='error', error=str(e), finished_at=datetime.now().isoformat())
+            self.discard_job_files(job_id)
+        except Exception as e:
+            logging.error(f"İş sırasında beklenmedik bir hata oluştu ({job_id}): {e}")
+            import traceback
+            logging.error(traceback.format_exc())
+            self.update_job(job_id, status='error', error=get_user_error_message(e),
+                            finished_at=datetime.now().isoformat())
+        finally:
+            # Çıktılar ve silinen ara dosyalar dizine yansısın
+            download_index.refresh(job_id)
+
+# Global job manager
+job_manager = JobManager(app.config['MAX_CONCURRENT_JOBS'])
+
+# --- DÖNÜŞÜM SONUÇ ÖNBELLEĞİ ---
+
+class ResultCache:
+    """
+    Dönüştürme çıktılarını içerik özetine göre saklar. Anahtar; yüklenen dosyanın
+    SHA-256 özeti, dönüştürme türü ve dönüştürücü seçeneklerinden üretilir.
+    Aynı dosya aynı ayarlarla tekrar yüklendiğinde dönüştürücü hiç çalıştırılmaz.
+    Boyut sınırı aşılınca en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+    """
+    def __init__(self, cache_folder, max_bytes, max_age_hours):
+        self.cache_folder = cache_folder
+        self.max_bytes = max_bytes
+        self.max_age_hours = max_age_hours
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        os.makedirs(cache_folder, exist_ok=True)
+
+    def _count(self, key, amount=1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def make_key(self, content_hash, conversion_type, options=None):
+        """İçerik özeti + dönüştürme türü + seçeneklerden önbellek anahtarı üret"""
+        raw = json.dumps([content_hash, conversion_type, options or {}], sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def fetch(self, key, dest_folder, base_name):
+        """Önbellekteki çıktıyı dest_folder'a bağla/kopyala ve yolunu döndür, yoksa None"""
+        entry_folder = os.path.join(self.cache_folder, key)
+        try:
+            cached_name = os.listdir(entry_folder)[0]
+        except (OSError, IndexError):
+            self._count('misses')
+            return None
+
+        # Çıktı adı önbelleği dolduran kullanıcının dosya adından değil, mevcut yüklemeden türetilir
+        dest_path = os.path.join(dest_folder, base_name + os.path.splitext(cached_name)[1])
+        try:
+            _link_or_copy(os.path.join(entry_folder, cached_name), dest_path)
+            os.utime(entry_folder)  # LRU için son kullanım zamanını güncelle
+        except OSError as e:
+            logging.warning(f"Önbellek kaydı okunamadı ({key}): {e}")
+            self._count('misses')
+            return None
+        self._count('hits')
+        return dest_path
+
+    def store(self, key, output_path):
+        """Başarılı bir dönüştürmenin çıktısını önbelleğe ekle"""
+        entry_folder = os.path.join(self.cache_folder, key)
+        if os.path.isdir(entry_folder):
+            return
+        # Diğer worker'lar yarım kaydı görmesin diye geçici klasörde hazırlayıp taşı
+        temp_folder = f"{entry_folder}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+        try:
+            os.makedirs(temp_folder)
+            _link_or_copy(output_path, os.path.join(temp_folder, os.path.basename(output_path)))
+            os.rename(temp_folder, entry_folder)
+            self._count('stores')
+            # Hard link'li çıktının boyutu dizinde job klasörüne yazılır, önbellek yalnızca kopyaları sayar
+            stat = os.stat(output_path)
+            download_index.add(os.path.basename(self.cache_folder), stat.st_size if stat.st_nlink < 2 else 0,
+                               files=1, folders=1)
+        except OSError as e:
+            logging.warning(f"Sonuç önbelleğe eklenemedi ({key}): {e}")
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    def evict(self, free_bytes=0):
+        """
+        Süresi dolan kayıtları ve boyut sınırını aşan en eski kayıtları sil. free_bytes verilirse
+        (disk baskısı) diskte en az bu kadar yer açılana kadar en eski kayıtlar da silinir.
+        (silinen kayıt sayısı, diskte gerçekten açılan bayt) döndürür.
+        """
+        entries = []
+        now = time.time()
+        for entry in os.scandir(self.cache_folder):
+            try:
+                last_used = entry.stat().st_mtime
+                size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+            except OSError:
+                continue
+            entries.append((last_used, size, entry.path, entry.name.endswith('.tmp')))
+
+        removed = freed = 0
+        total_size = sum(entry[1] for entry in entries)
+        for last_used, size, path, is_temp in sorted(entries):
+            expired = now - last_used > self.max_age_hours * 3600
+            if not (expired or total_size > self.max_bytes or freed < free_bytes):
+                continue
+            if is_temp and now - last_used < 3600:
+                continue  # Hâlâ yazılıyor olabilir
+            total_size -= size
+            # Aynı kaydı silmeye çalışan diğer worker'larla yalnızca taşımayı başaran siler ve sayar
+            try:
+                claimed = claim_for_deletion(path)
+            except OSError as e:
+                logging.error(f"Önbellek kaydı silinemedi {path}: {e}")
+                continue
+            if claimed is None:
+                continue
+            # Job klasöründe hard link'i duran çıktı silinince yer açılmaz
+            freed += reclaimable_bytes(claimed)
+            shutil.rmtree(claimed, ignore_errors=True)
+            removed += 1
+
+        if removed:
+            self._count('evictions', removed)
+            # Silinen dosyaların bir kısmı job klasörlerinde hard link olarak kalır; önbellek yeniden ölçülür
+            download_index.refresh(os.path.basename(self.cache_folder))
+            logging.info(f"Sonuç önbelleğinden {removed} kayıt silindi")
+        return removed, freed
+
+    def get_stats(self):
+        """Önbellek isabet/ıska sayaçlarını döndür"""
+        with self.lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['max_mb'] = self.max_bytes // (1024 * 1024)
+        return stats
+
+def _link_or_copy(source, dest):
+    """Aynı dosya sisteminde hard link oluştur, olmazsa kopyala"""
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
+
+# Global sonuç önbelleği
+result_cache = ResultCache(
+    os.path.join(app.config['DOWNLOAD_FOLDER'], app.config['RESULT_CACHE_FOLDER']),
+    app.config['RESULT_CACHE_MAX_MB'] * 1024 * 1024,
+    app.config['FILE_RETENTION_HOURS']
+)
+
+# --- İNDİRME KLASÖRÜ DİZİNİ ---
+
+class DownloadFolderIndex:
+    """
+    DOWNLOAD_FOLDER'daki üst düzey öğelerin (job/session klasörleri, önbellek, spool) boyutunu,
+    dosya/klasör sayısını ve oluşturulma zamanını bellekte tutar. İşler yazdıkça ve temizlik
+    sildikçe güncellenir; durum ve kota sorguları klasörü taramadan toplamları okur.
+    Dışarıdan yapılan değişiklikler periyodik reconcile() ile tek bir os.scandir geçişinde düzeltilir.
+    Hard link'li dosyalar (önbellek ile job klasörünün paylaştığı çıktılar) (st_dev, st_ino) ile
+    tanınır ve boyutları yalnızca onları ilk sayan öğeye yazılır.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.inode_owners = {}  # (st_dev, st_ino) -> boyutu sayan öğenin adı
+        self.totals = {'bytes': 0, 'files': 0, 'folders': 0}
+        self.last_reconciled = None
+        self.last_drift_bytes = 0
+
+    def _scan_folder(self, path, owner=None, claimed=None):
+        """
+        Klasörü os.scandir ile özyinelemeli tara, (bayt, dosya, alt klasör, sayılan_inode'lar) döndür.
+        claimed verilirse başka bir öğenin saydığı hard link'li dosyaların boyutu eklenmez.
+        """
+        size = files = folders = 0
+        linked = []
+        stack = [path]
+        while stack:
+            try:
+                iterator = os.scandir(stack.pop())
+            except OSError:
+                continue  # Tarama sırasında silinen klasör
+            with iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            folders += 1
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files += 1
+                            size += self._file_bytes(entry.stat(follow_symlinks=False), owner, claimed, linked)
+                    except OSError:
+                        continue
+        return size, files, folders, linked
+
+    @staticmethod
+    def _file_bytes(stat, owner, claimed, linked):
+        if claimed is None or stat.st_nlink < 2:
+            return stat.st_size
+        inode = (stat.st_dev, stat.st_ino)
+        if claimed.setdefault(inode, owner) != owner:
+            return 0
+        linked.append(inode)
+        return stat.st_size
+
+    def folder_bytes(self, path):
+        """Dizindeki kaydı değiştirmeden klasörün güncel boyutunu ölç (hard link'ler dahil)"""
+        return self._scan_folder(path)[0]
+
+    def _measure(self, name, path, stat, is_dir, claimed):
+        if is_dir:
+            size, files, folders, linked = self._scan_folder(path, name, claimed)
+            folders += 1
+        else:
+            linked = []
+            size, files, folders = self._file_bytes(stat, name, claimed, linked), 1, 0
+        return {'bytes': size, 'files': files, 'folders': folders, 'created': stat.st_ctime, 'linked': linked}
+
+    def _replace(self, name, record):
+        # self.lock tutulurken çağrılır
+        old = self.entries.pop(name, None)
+        for key in self.totals:
+            self.totals[key] += (record[key] if record else 0) - (old[key] if old else 0)
+        for inode in (old or {}).get('linked', ()):
+            if self.inode_owners.get(inode) == name:
+                del self.inode_owners[inode]
+        if record:
+            self.entries[name] = record
+            for inode in record.get('linked', ()):
+                self.inode_owners[inode] = name
+
+    def refresh(self, name):
+        """Tek bir üst düzey öğeyi yeniden ölç (iş kuyruğa girince ve bitince çağrılır)"""
+        path = os.path.join(self.root, name)
+        with self.lock:
+            claimed = dict(self.inode_owners)
+        try:
+            stat = os.stat(path, follow_symlinks=False)
+            record = self._measure(name, path, stat, os.path.isdir(path), claimed)
+        except OSError:
+            record = None
+        with self.lock:
+            self._replace(name, record)
+
+    def add(self, name, size, files=0, folders=0):
+        """Bilinen bir yazımı (pozitif) veya silmeyi (negatif) öğeyi taramadan uygula"""
+        with self.lock:
+            record = dict(self.entries.get(name) or {'bytes': 0, 'files': 0, 'folders': 1, 'created': time.time()})
+            record['bytes'] = max(0, record['bytes'] + size)
+            record['files'] = max(0, record['files'] + files)
+            record['folders'] = max(1, record['folders'] + folders)
+            self._replace(name, record)
+
+    def forget(self, name):
+        """Silinen öğeyi dizinden çıkar"""
+        with self.lock:
+            self._replace(name, None)
+
+    def reconcile(self):
+        """Tüm klasörü tek geçişte tarayıp dizini diskle eşitle, düzeltilen bayt farkını döndür"""
+        entries = {}
+        claimed = {}
+        with os.scandir(self.root) as iterator:
+            for entry in iterator:
+                try:
+                    entries[entry.name] = self._measure(entry.name, entry.path, entry.stat(follow_symlinks=False),
+                                                        entry.is_dir(follow_symlinks=False), claimed)
+                except OSError:
+                    continue
+        with self.lock:
+            totals = {key: sum(record[key] for record in entries.values()) for key in self.totals}
+            drift = totals['bytes'] - self.totals['bytes']
+            self.entries, self.totals = entries, totals
+            self.inode_owners = {inode: name for name, record in entries.items() for inode in record['linked']}
+            self.last_reconciled = datetime.now().isoformat()
+            self.last_drift_bytes = drift
+        if drift:
+            logging.info(f"İndirme klasörü dizini diskle eşitlendi ({drift:+d} bayt fark)")
+        return drift
+
+    def items(self):
+        """(ad, kayıt) çiftlerinin kopyasını döndür"""
+        with self.lock:
+            return [(name, {key: value for key, value in record.items() if key != 'linked'})
+                    for name, record in self.entries.items()]
+
+    def get_stats(self):
+        """Toplam boyut/dosya sayısı ve son eşitleme bilgisini döndür"""
+        with self.lock:
+            return {
+                'total_bytes': self.totals['bytes'],
+                'total_files': self.totals['files'],
+                'total_folders': self.totals['folders'],
+                'entries': len(self.entries),
+                'last_reconciled': self.last_reconciled,
+                'last_drift_bytes': self.last_drift_bytes
+            }
+
+download_index = DownloadFolderIndex(app.config['DOWNLOAD_FOLDER'])
+
+# --- SİSTEM YÖNETİMİ FONKSİYONLARI ---
+
+def claim_for_deletion(path):
+    """
+    Silinecek dosya ya da klasörü aynı yerde bu process'e ait bir ada atomik olarak taşır ve yeni yolu
+    döndürür. Her gunicorn worker'ı aynı klasörü kendi zamanlayıcısıyla silmeye çalıştığından yalnızca
+    taşımayı başaran worker siler ve sayar; öğe artık yoksa (başka worker almış) None döndürür.
+    """
+    claimed = f"{path}.{os.getpid()}.deleting"
+    try:
+        os.rename(path, claimed)
+    except FileNotFoundError:
+        return None
+    return claimed
+
+def reclaimable_bytes(path):
+    """
+    Dosya ya da klasör silinince diskte açılacak bayt sayısı. Hard link'ler inode'a göre sayılır:
+    bağlantılarının hepsi bu yolun altında olmayan dosyalar silinse de yer kaplamaya devam eder.
+    """
+    inodes = {}  # (st_dev, st_ino) -> [boyut, bağlantı sayısı, buradaki bağlantı]
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            stat = os.stat(current, follow_symlinks=False)
+        except OSError:
+            continue
+        if os.path.isdir(current) and not os.path.islink(current):
+            try:
+                stack.extend(entry.path for entry in os.scandir(current))
+            except OSError:
+                pass
+            continue
+        record = inodes.setdefault((stat.st_dev, stat.st_ino), [stat.st_size, stat.st_nlink, 0])
+        record[2] += 1
+    return sum(size for size, links, seen in inodes.values() if seen >= links)
+
+class CleanupScheduler:
+    """
+    Job ve session klasörlerinin son kullanma zamanlarını oluşturuldukları anda zaman sıralı bir
+    yığında (heap) tutar. Arka plan thread'i süresi dolan öğeleri klasörü listelemeden, küçük
+    partiler halinde siler. Disk kullanımı DISK_USAGE_WARNING_PERCENT'e ulaşınca önce sonuç önbelleği,
+    ardından süresi dolmamış öğeler en eskiden başlanarak silinir; böylece kritik sınıra varmadan yer açılır.
+    Çalışmakta olan işler ve tamamlanmamış Spotify oturumları hiçbir zaman, son CLEANUP_PRESSURE_GRACE_MINUTES
+    içinde biten işler ise disk baskısında silinmez. Yer açmayan bir parti sonrasında disk baskısı turu durur.
+    Her gunicorn worker'ı kendi yığınını tutar; bir öğeyi claim_for_deletion ile ilk alan worker siler ve sayar.
+    """
+    NEW_ITEM_GRACE_SECONDS = 600
+    PRESSURE_WAKEUP_INTERVAL = 30  # İstekler disk uyarısında zamanlayıcıyı en fazla bu sıklıkta uyandırır
+
+    def __init__(self, root, retention_seconds, batch_size, poll_seconds):
+        self.root = root
+        self.retention_seconds = retention_seconds
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.heap = []
+        self.scheduled = {}  # ad -> son kullanma; yığındaki eski kayıtlar bununla ayıklanır
+        self.lock = threading.Lock()
+        self.run_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.last_pressure_wakeup = 0
+        self.stats = {'runs': 0, 'removed': 0, 'reclaimed_bytes': 0, 'pressure_evictions': 0, 'last_run': None}
+        self.thread = None
+
+    def schedule(self, name, created_at=None):
+        """Öğeyi oluşturulma zamanı + saklama süresinde silinmek üzere kaydet"""
+        expires_at = (created_at or time.time()) + self.retention_seconds
+        with self.lock:
+            self.scheduled[name] = expires_at
+            heapq.heappush(self.heap, (expires_at, name))
+            is_earliest = self.heap[0][1] == name
+        if is_earliest:
+            self.wakeup.set()  # Yeni en erken son kullanma; bekleme süresini yeniden hesapla
+
+    def seed(self, entries):
+        """Dizinde olup henüz kaydedilmemiş öğeleri (örn: yeniden başlatma öncesinden) ekle"""
+        skipped = {app.config['RESULT_CACHE_FOLDER'], app.config['UPLOAD_SPOOL_FOLDER']}
+        for name, record in entries:
+            if name not in skipped and name not in self.scheduled:
+                self.schedule(name, record['created'])
+
+    def pending_count(self):
+        with self.lock:
+            return len(self.scheduled)
+
+    def wake_for_pressure(self):
+        """Disk baskısında zamanlayıcıyı erken uyandır; her istekte değil PRESSURE_WAKEUP_INTERVAL'de bir"""
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_pressure_wakeup < self.PRESSURE_WAKEUP_INTERVAL:
+                return
+            self.last_pressure_wakeup = now
+        self.wakeup.set()
+
+    def _pop(self, due_before=None):
+        """En erken son kullanmalı öğeyi çıkar; due_before verilmişse yalnızca süresi dolmuşsa"""
+        with self.lock:
+            while self.heap:
+                expires_at, name = self.heap[0]
+                if self.scheduled.get(name) != expires_at:
+                    heapq.heappop(self.heap)  # Yeniden planlanmış ya da silinmiş öğenin eski kaydı
+                    continue
+                if due_before is not None and expires_at > due_before:
+                    return None
+                heapq.heappop(self.heap)
+                del self.scheduled[name]
+                return expires_at, name
+            return None
+
+    def _is_busy(self, name, expires_at):
+        """Öğe hâlâ kullanılıyor mu (kuyrukta/çalışan iş, süren Spotify oturumu ya da yeni açılmış klasör)?"""
+        job = job_manager.get_job(name)
+        if job is not None:
+            return job['status'] not in JobManager.FINISHED_STATUSES
+        session = session_manager.get_session(name)
+        if session is not None:
+            return not session.get('is_complete')
+        # job.json'u henüz yazılmamış (yükleme süren) klasörler disk baskısında da silinmez
+        return expires_at - self.retention_seconds > time.time() - self.NEW_ITEM_GRACE_SECONDS
+
+    def _recently_finished(self, name):
+        """İş son CLEANUP_PRESSURE_GRACE_MINUTES içinde mi bitti? (kullanıcı sonucu henüz indirmemiş olabilir)"""
+        job = job_manager.get_job(name)
+        if job is None or not job.get('finished_at'):
+            return False
+        try:
+            finished_at = datetime.fromisoformat(job['finished_at']).timestamp()
+        except ValueError:
+            return False
+        return time.time() - finished_at < app.config['CLEANUP_PRESSURE_GRACE_MINUTES'] * 60
+
+    def _delete(self, name):
+        """
+        Öğeyi diskten sil; (bu process mi sildi, diskte gerçekten açılan bayt) döndürür. Öğeyi başka bir
+        worker önce aldıysa (False, 0) döner. Silinemezse None döner ve öğe daha sonra yeniden denenir.
+        """
+        try:
+            claimed = claim_for_deletion(os.path.join(self.root, name))
+            if claimed is None:
+                download_index.forget(name)
+                return False, 0
+            reclaimed = reclaimable_bytes(claimed)
+            if os.path.isdir(claimed):
+                shutil.rmtree(claimed)
+            else:
+                os.remove(claimed)
+        except OSError as e:
+            logging.error(f"Öğe silinemedi {name}: {e}")
+            return None
+        download_index.forget(name)
+        return True, reclaimed
+
+    def bytes_over_warning(self):
+        """Disk kullanımını DISK_USAGE_WARNING_PERCENT'in altına indirmek için açılması gereken bayt"""
+        disk_usage = shutil.disk_usage(self.root)
+        return disk_usage.used - int(disk_usage.total * app.config['DISK_USAGE_WARNING_PERCENT'] / 100)
+
+    def run_once(self):
+        """
+        Bir temizlik turu: önce süresi dolan öğeler batch_size'lık partilerle, ardından disk baskısı
+        varsa önce sonuç önbelleği, sonra en eski öğeler silinir. {'removed', 'reclaimed_bytes', ...} raporunu döndürür.
+        """
+        with self.run_lock:
+            started = time.time()
+            report = {'removed': 0, 'reclaimed_bytes': 0, 'expired': 0, 'pressure_evictions': 0,
+                      'cache_evictions': 0, 'skipped_busy': 0, 'skipped_recent': 0, 'claimed_elsewhere': 0}
+            deferred = []
+
+            def remove(item, reason):
+                """Öğeyi sil, açılan bayt sayısını döndür (silinmediyse 0)"""
+                if self._is_busy(item[1], item[0]):
+                    report['skipped_busy'] += 1
+                    deferred.append(item)
+                    return 0
+                if reason == 'pressure_evictions' and self._recently_finished(item[1]):
+                    report['skipped_recent'] += 1
+                    deferred.append(item)
+                    return 0
+                result = self._delete(item[1])
+                if result is None:
+                    deferred.append(item)
+                    return 0
+                deleted, reclaimed = result
+                if not deleted:
+                    report['claimed_elsewhere'] += 1
+                    return 0
+                report['removed'] += 1
+                report[reason] += 1
+                report['reclaimed_bytes'] += reclaimed
+                return reclaimed
+
+            # Süresi dolanlar: her partiden sonra kilit bırakılır, yeni işler beklemez
+            while True:
+                batch = []
+                for _ in range(self.batch_size):
+                    item = self._pop(due_before=time.time())
+                    if item is None:
+                        break
+                    batch.append(item)
+                for item in batch:
+                    remove(item, 'expired')
+                if len(batch) < self.batch_size:
+                    break
+
+            # Disk baskısı: kritik sınıra varmadan önce yeniden üretilebilen önbellek, sonra en eski öğeler silinir
+            needed = self.bytes_over_warning()
+            if needed > 0:
+                removed, freed = result_cache.evict(free_bytes=needed)
+                report['removed'] += removed
+                report['cache_evictions'] += removed
+                report['reclaimed_bytes'] += freed
+            while True:
+                attempted = freed = 0
+                while attempted < self.batch_size and self.bytes_over_warning() > 0:
+                    item = self._pop()
+                    if item is None:
+                        break
+                    attempted += 1
+                    freed += remove(item, 'pressure_evictions')
+                # Yer açmayan parti: disk bu klasör dışındaki dosyalarla dolu ya da kalanlar korunuyor
+                if attempted < self.batch_size or not freed:
+                    break
+
+            # Kullanımdaki öğeler yerine geri konur; süresi dolmuş olanlar poll_seconds sonra yeniden denenir
+            now = time.time()
+            with self.lock:
+                for expires_at, name in deferred:
+                    if name not in self.scheduled:
+                        expires_at = expires_at if expires_at > now else now + self.poll_seconds
+                        self.scheduled[name] = expires_at
+                        heapq.heappush(self.heap, (expires_at, name))
+
+            report['duration_ms'] = int((time.time() - started) * 1000)
+            report['finished_at'] = datetime.now().isoformat()
+            with self.lock:
+                self.stats['runs'] += 1
+                self.stats['removed'] += report['removed']
+                self.stats['reclaimed_bytes'] += report['reclaimed_bytes']
+                self.stats['pressure_evictions'] += report['pressure_evictions'] + report['cache_evictions']
+                self.stats['last_run'] = report
+            if report['removed']:
+                logging.info(f"Temizlik: {report['removed']} öğe silindi ({report['expired']} süresi dolan, "
+                             f"{report['pressure_evictions']} disk baskısı, {report['cache_evictions']} önbellek), "
+                             f"{report['reclaimed_bytes'] / (1024 * 1024):.1f} MB geri kazanıldı")
+            return report
+
+    def _worker(self):
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logging.error(f"Temizlik zamanlayıcı hatası: {e}")
+            # Bir sonraki son kullanmaya kadar (en fazla poll_seconds) bekle; disk uyarısı erken uyandırır
+            with self.lock:
+                next_due = self.heap[0][0] if self.heap else None
+            timeout = self.poll_seconds if next_due is None else min(self.poll_seconds, max(1, next_due - time.time()))
+            self.wakeup.wait(timeout)
+            self.wakeup.clear()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._worker, name='cleanup-scheduler', daemon=True)
+        self.thread.start()
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['scheduled'] = len(self.scheduled)
+            stats['next_expiry'] = datetime.fromtimestamp(self.heap[0][0]).isoformat() if self.heap else None
+        return stats
+
+cleanup_scheduler = CleanupScheduler(
+    app.config['DOWNLOAD_FOLDER'],
+    app.config['FILE_RETENTION_HOURS'] * 3600,
+    app.config['CLEANUP_BATCH_SIZE'],
+    app.config['CLEANUP_POLL_SECONDS']
+)
+
+def get_user_error_message(e):
+    """Beklenmeyen bir hatayı kullanıcıya gösterilecek mesaja çevir"""
+    error_message = "Beklenmedik bir sunucu hatası oluştu. Lütfen yönetici ile iletişime geçin."
+    if "unrar' programı sisteminizde bulunamadı" in str(e):
+        error_message = "RAR dönüştürme başarısız: 'unrar' programı sistemde kurulu veya erişilebilir değil."
+    elif isinstance(e, (ValueError, ConverterUnavailable, ConverterLimitExceeded)):
+        error_message = str(e)
+    return error_message
+
+class ServiceOverloaded(Exception):
+    """Sunucu aşırı yüklüyken yeni iş reddedilirken fırlatılır; retry_after saniye sonra tekrar denenmeli"""
+    def __init__(self, message, retry_after, reason):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.reason = reason
+
+class JobTooLarge(ValueError):
+    """İş bu sunucunun bellek veya disk kapasitesini aşıyor; beklemekle kabul edilmez (HTTP 413)"""
+
+def check_disk_space(required_bytes=0):
+    """
+    Disk kullanımını kontrol et. Kullanım kritik sınırdaysa ya da işin yazacağı tahmini
+    required_bytes sonrasında ADMISSION_DISK_HEADROOM_MB'den az yer kalacaksa ServiceOverloaded fırlatır.
+    """
+    try:
+        disk_usage = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
+    except OSError as e:
+        logging.error(f"Disk kullanımı kontrol edilemedi: {e}")
+        return 0
+    used_percent = (disk_usage.used / disk_usage.total) * 100
+
+    if (used_percent >= app.config['DISK_USAGE_CRITICAL_PERCENT']
+            or disk_usage.free - required_bytes < app.config['ADMISSION_DISK_HEADROOM_MB'] * 1024 * 1024):
+        logging.error(f"Disk alanı yetersiz (%{used_percent:.1f} dolu, {disk_usage.free // (1024 * 1024)} MB boş). "
+                      "Yeni işler reddediliyor.")
+        cleanup_scheduler.wake_for_pressure()
+        # Temizlik zamanlayıcısı en geç CLEANUP_POLL_SECONDS içinde yer açar
+        raise ServiceOverloaded("Sunucu diski dolu. Lütfen biraz sonra tekrar deneyin.",
+                                retry_after=app.config['CLEANUP_POLL_SECONDS'], reason='disk')
+    elif used_percent >= app.config['DISK_USAGE_WARNING_PERCENT']:
+        logging.warning(f"Yüksek disk kullanımı: %{used_percent:.1f}")
+        # Kritik sınıra varmadan eski öğeleri sildir
+        cleanup_scheduler.wake_for_pressure()
+
+    return used_percent
+
+def cleanup_old_files():
+    """
+    Süresi dolan job/session klasörlerini, yarıda kalmış spool dosyalarını ve eski önbellek
+    kayıtlarını temizle. Klasörler CleanupScheduler ile silinir; temizlik raporunu döndürür.
+    """
+    try:
+        report = cleanup_scheduler.run_once()
+
+        # Klasörün kendisi değil, yarıda kalmış eski spool dosyaları silinir
+        spool_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], app.config['UPLOAD_SPOOL_FOLDER'])
+        if os.path.isdir(spool_folder):
+            report['removed'] += cleanup_stale_spool_files(spool_folder)
+            download_index.refresh(app.config['UPLOAD_SPOOL_FOLDER'])
+
+        # Önbellek kendi LRU kuralıyla temizlenir
+        report['removed'] += result_cache.evict()[0]
+        return report
+    except Exception as e:
+        logging.error(f"Dosya temizleme hatası: {e}")
+        return {'removed': 0, 'reclaimed_bytes': 0}
+
+def cleanup_stale_spool_files(spool_folder, max_age_seconds=3600):
+    """Bir saatten eski, yarıda kalmış yükleme spool dosyalarını sil"""
+    removed = 0
+    now = time.time()
+    for entry in os.scandir(spool_folder):
+        try:
+            if now - entry.stat().st_mtime > max_age_seconds:
+                os.remove(entry.path)
+                removed += 1
+        except OSError as e:
+            logging.error(f"Spool dosyası silinemedi {entry.name}: {e}")
+    return removed
+
+def get_system_stats():
+    """Sistem istatistiklerini al"""
+    try:
+        import psutil  # Sistem kaynaklarını takip etmek için
+        memory = psutil.virtual_memory()
+        disk = shutil.disk_usage(app.config['DOWNLOAD_FOLDER'])
+        
+        return {
+            'memory_percent': memory.percent,
+            'disk_percent': (disk.used / disk.total) * 100,
+            'active_sessions': session_manager.count_sessions(),
+            'download_folder_size': download_index.get_stats()['total_bytes'] / (1024 * 1024)  # MB cinsinden
+        }
+    except Exception as e:
+        logging.error(f"Sistem istatistikleri alınamadı: {e}")
+        return {}
+
+def schedule_cleanup():
+    """Periyodik temizleme işlemini başlat"""
+    def cleanup_worker():
+        while True:
+            try:
+                # Dosya temizleme
+                cleanup_old_files()
+
+                # Dizini diskle eşitle (dışarıdan silinen/eklenen dosyalar)
+                download_index.reconcile()
+                # Zamanlayıcıda kaydı olmayan öğeleri (örn: yeniden başlatma öncesinden) ekle
+                cleanup_scheduler.seed(download_index.items())
+                
+                # Session temizleme
+                session_manager.cleanup_expired_sessions()
+                
+                # Sistem durumu logla
+                stats = get_system_stats()
+                if stats:
+                    logging.info(f"Sistem durumu - RAM: %{stats.get('memory_percent', 0):.1f}, "
+                               f"Disk: %{stats.get('disk_percent', 0):.1f}, "
+                               f"Aktif Sessions: {stats.get('active_sessions', 0)}, "
+                               f"Downloads Boyutu: {stats.get('download_folder_size', 0):.1f}MB")
+                
+                # Bir sonraki temizliğe kadar bekle
+                time.sleep(app.config['CLEANUP_INTERVAL_HOURS'] * 3600)
+                
+            except Exception as e:
+                logging.error(f"Periyodik temizleme hatası: {e}")
+                time.sleep(300)  # Hata durumunda 5 dakika bekle
+
+    # Arka plan thread'ini başlat
+    cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+    cleanup_thread.start()
+    logging.info("Periyodik temizleme sistemi başlatıldı")
+
+_background_state = {'started': False}
+_background_lock = threading.Lock()
+
+def start_background_services():
+    """
+    Temizlik thread'lerini, web process'i ısındırmayı ve import maliyeti raporunu ilk istekte başlat.
+    Import sırasında başlatılmadıkları için hiç istek almayan worker'lar ve dönüştürücü
+    process'leri bu maliyeti ödemez.
+    """
+    with _background_lock:
+        # Dönüştürücü process'leri modülü yeniden yüklerse ikinci bir temizlik thread'i açılmasın
+        if _background_state['started'] or multiprocessing.parent_process() is not None:
+            return
+        _background_state['started'] = True
+    # Dizin ve zamanlayıcı ilk saatlik reconcile'ı beklemeden diskteki mevcut öğelerle doldurulur
+    download_index.reconcile()
+    cleanup_scheduler.seed(download_index.items())
+    schedule_cleanup()
+    cleanup_scheduler.start()
+    if isinstance(document_renderer, LibreOfficeRendererPool):
+        # Sıcak havuz kurulamıyorsa ilk belgeyi beklemeden başlangıçta uyar
+        threading.Thread(target=document_renderer.resolve_mode, name='office-mode', daemon=True).start()
+    if app.config['CONVERTER_WARMUP']:
+        converter_registry.warm_up(app.config['CONVERTER_WARMUP'].split(','), pooled=False)
+    if app.config['CONVERTER_IMPORT_REPORT']:
+        converter_registry.start_import_measurement()
+
+@app.before_request
+def ensure_background_services():
+    if not _background_state['started']:
+        start_background_services()
+
+# Uygulama kapanırken temizlik yap
+def cleanup_on_exit():
+    """Uygulama kapanırken temizlik yap"""
+    if multiprocessing.parent_process() is not None:
+        return  # Uygulamayı import eden dönüştürücü process'leri temizlik yapmaz
+    logging.info("Uygulama kapanıyor, temizlik yapılıyor...")
+    cleanup_old_files()
+    executor.shutdown(wait=False)
+    job_manager.shutdown()
+    converter_pool.shutdown()
+    spotify_pipeline.shutdown()
+    if document_renderer is not None:
+        document_renderer.shutdown()
+
+atexit.register(cleanup_on_exit)
+
+# --- YÜK KONTROLÜ (ADMISSION CONTROL) ---
+
+class AdmissionController:
+    """
+    Yeni işleri kabul etmeden önce bu process'in kuyruk derinliğini (toplam ve dönüştürücü grubu
+    bazında), boş belleği, disk payını ve işin girdi boyutundan tahmin edilen maliyetini denetler.
+    Geçici aşırı yükte işi kuyruğa almak yerine ServiceOverloaded fırlatır (HTTP 503 + Retry-After);
+    sunucu boşken bile sığmayacak işler için JobTooLarge fırlatır (HTTP 413).
+    Kuyruğun ve belleğin bir kısmı ucuz işlere ayrılır: pahalı işler reddedilirken küçük
+    dönüştürmeler kabul edilmeye devam eder, böylece sunucu swap'e düşmeden yavaşlar.
+    Kuyruk sayaçları process başınadır: gunicorn'da toplam sınır ADMISSION_MAX_QUEUE x worker sayısıdır.
+    """
+    # Tahmini çıktı boyutu = girdi boyutu x bu çarpan (disk kontrolü için)
+    OUTPUT_SIZE_FACTOR = 3
+
+    def __init__(self, max_queue, queue_per_slot, cheap_reserve_percent, cheap_cost,
+                 min_free_memory_mb, retry_after, cost_weights, group_limits):
+        self.max_queue = max(1, max_queue)
+        self.cheap_reserve = min(self.max_queue - 1, self.max_queue * cheap_reserve_percent // 100)
+        self.queue_per_slot = max(1, queue_per_slot)
+        self.cheap_cost = cheap_cost
+        self.min_free_memory_mb = min_free_memory_mb
+        self.retry_after = max(1, retry_after)
+        self.cost_weights = cost_weights
+        self.group_limits = group_limits
+        self.lock = threading.Lock()
+        self.stats = {'admitted': 0, 'rejected': {}}
+
+    def estimate_cost(self, conversion_types, input_bytes):
+        """
+        Tahmini maliyet: her adımın grup ağırlığı x girdi MB'ı (en az 1 MB sayılır). Bellek kontrolünde
+        işin kaba bellek ihtiyacı (MB) olarak da kullanılır (bkz. estimate_memory_mb).
+        """
+        input_mb = max(1.0, (input_bytes or 0) / (1024 * 1024))
+        weights = [self.cost_weights.get(CONVERTERS.get(conversion_type, {}).get('pool'), self.cost_weights.get('default', 1))
+                   for conversion_type in conversion_types] or [self.cost_weights.get('default', 1)]
+        return sum(weights) * input_mb
+
+    @staticmethod
+    def estimate_memory_mb(cost):
+        """İşin bellek ihtiyacı; havuzdaki dönüştürücü CONVERTER_MEMORY_LIMIT_MB'den fazlasını kullanamaz"""
+        return min(cost, app.config['CONVERTER_MEMORY_LIMIT_MB']) if app.config['CONVERTER_MEMORY_LIMIT_MB'] else cost
+
+    def _count_rejection(self, reason):
+        with self.lock:
+            self.stats['rejected'][reason] = self.stats['rejected'].get(reason, 0) + 1
+        metrics.inc('allconvert_admission_rejections_total', reason=reason)
+
+    def _reject(self, reason, message, retry_after):
+        self._count_rejection(reason)
+        logging.warning(f"İstek aşırı yük nedeniyle reddedildi ({reason}): {message}")
+        raise ServiceOverloaded(message, retry_after=retry_after, reason=reason)
+
+    def _reject_too_large(self, message):
+        self._count_rejection('too_large')
+        logging.warning(f"İş sunucu kapasitesini aştığı için reddedildi: {message}")
+        raise JobTooLarge(message)
+
+    def _memory_mb(self):
+        """(kullanılabilir, toplam) bellek MB; psutil yoksa None"""
+        try:
+            import psutil
+        except ImportError:
+            return None  # psutil yoksa bellek kontrolü yapılmaz
+        memory = psutil.virtual_memory()
+        return memory.available / (1024 * 1024), memory.total / (1024 * 1024)
+
+    def admit(self, conversion_types, input_bytes):
+        """
+        İşi kabul et ya da ServiceOverloaded fırlat. conversion_types boşsa (istek gövdesi okunmadan
+        önceki ön kontrol) yalnızca disk, bellek ve toplam kuyruk varsayılan maliyetle denetlenir.
+        """
+        cost = self.estimate_cost(conversion_types, input_bytes)
+        cheap = cost <= self.cheap_cost
+        required_bytes = (input_bytes or 0) * self.OUTPUT_SIZE_FACTOR
+
+        # Boş bir sunucuya bile sığmayacak iş için tekrar denemek anlamsızdır: 503 değil 413
+        try:
+            disk_total = shutil.disk_usage(app.config['DOWNLOAD_FOLDER']).total
+        except OSError:
+            disk_total = None
+        if disk_total and required_bytes > disk_total - app.config['ADMISSION_DISK_HEADROOM_MB'] * 1024 * 1024:
+            self._reject_too_large("Dosya bu sunucunun disk kapasitesi için çok büyük. Daha küçük bir dosya deneyin.")
+
+        try:
+            check_disk_space(required_bytes)
+        except ServiceOverloaded as e:
+            self._reject('disk', str(e), e.retry_after)
+
+        memory = self._memory_mb()
+        if memory is not None:
+            free_memory_mb, total_memory_mb = memory
+            # Ucuz işler bellek payının yarısına kadar inebilir
+            required_mb = self.min_free_memory_mb / 2 if cheap else self.min_free_memory_mb + self.estimate_memory_mb(cost)
+            if required_mb > total_memory_mb:
+                self._reject_too_large("Dosya bu sunucunun belleği için çok büyük. Daha küçük bir dosya deneyin.")
+            if free_memory_mb < required_mb:
+                self._reject('memory', "Sunucu belleği şu anda yetersiz. Lütfen biraz sonra tekrar deneyin.",
+                             self.retry_after * 2)
+
+        total, groups = job_manager.get_load()
+        # Gecikme tahmini: her MAX_CONCURRENT_JOBS iş bir taban bekleme süresi kadar sürer
+        retry_after = self.retry_after * max(1, total // max(1, app.config['MAX_CONCURRENT_JOBS']))
+        if total >= (self.max_queue if cheap else self.max_queue - self.cheap_reserve):
+            self._reject('queue', "Sunucu şu anda çok yoğun. Lütfen biraz sonra tekrar deneyin.", retry_after)
+        for conversion_type in conversion_types:
+            group = CONVERTERS.get(conversion_type, {}).get('pool') or conversion_type
+            if group in self.group_limits and groups.get(group, 0) >= self.group_limits[group] * self.queue_per_slot:
+                self._reject('converter_queue', "Bu dönüştürme türü için kuyruk dolu. Lütfen biraz sonra tekrar deneyin.",
+                             retry_after)
+
+        if conversion_types:
+            with self.lock:
+                self.stats['admitted'] += 1
+
+    def get_stats(self):
+        total, groups = job_manager.get_load()
+        with self.lock:
+            return {
+                'queue': total,
+                'queue_by_group': groups,
+                'max_queue': self.max_queue,
+                'cheap_reserve': self.cheap_reserve,
+                'admitted': self.stats['admitted'],
+                'rejected': dict(self.stats['rejected'])
+            }
+
+admission_controller = AdmissionController(
+    app.config['ADMISSION_MAX_QUEUE'],
+    app.config['ADMISSION_QUEUE_PER_SLOT'],
+    app.config['ADMISSION_CHEAP_RESERVE_PERCENT'],
+    app.config['ADMISSION_CHEAP_COST'],
+    app.config['ADMISSION_MIN_FREE_MEMORY_MB'],
+    app.config['ADMISSION_RETRY_AFTER_SECONDS'],
+    parse_concurrency_limits(app.config['CONVERTER_COST_WEIGHTS']),
+    converter_pool.limits
+)
+
+def overloaded_response(error):
+    """ServiceOverloaded için 503 + Retry-After JSON yanıtı"""
+    response = jsonify({'error': str(error), 'retry_after': error.retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+# --- AKAN (STREAMING) ZIP ---
+# ZIP arşivleri, girdiler üretildikçe parça parça yazılır. Aynı üretici hem HTTP yanıtına
+# (diskte ara arşiv olmadan) hem de job çıktısı olan tek bir ZIP dosyasına yazmak için kullanılır.
+
+# Zaten sıkıştırılmış formatlar tekrar sıkıştırılmaz (STORED), diğerleri DEFLATE ile yazılır
+ZIP_STORED_EXTENSIONS = {'mp3', 'mp4', 'avi', 'jpg', 'jpeg', 'png', 'gif', 'zip', 'rar', 'docx', 'xlsx', 'pptx', 'pdf', 'parquet'}
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024
+
+class _ZipStreamBuffer:
+    """zipfile'ın yazdığı baytları toplayan, konum desteği olmayan (unseekable) çıktı nesnesi"""
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def safe_zip_arcname(name):
+    """Arşiv içi yolu '..' ve mutlak yol içermeyecek şekilde temizle"""
+    parts = [part for part in name.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+    return '/'.join(parts)
+
+def iter_zip_stream(entries):
+    """
+    (arşiv_adı, kaynak) çiftlerinden ZIP baytları üretir. Kaynak; bytes, dosya yolu veya
+    okunabilir bir dosya nesnesi döndüren fonksiyon olabilir. Her girdi yazıldıkça
+    biriken baytlar hemen verilir, arşivin tamamı bellekte veya diskte tutulmaz.
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w') as zipf:
+        for arcname, source in entries:
+            arcname = safe_zip_arcname(arcname)
+            if not arcname:
+                continue
+            extension = arcname.rsplit('.', 1)[-1].lower() if '.' in arcname else ''
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+            zinfo.compress_type = zipfile.ZIP_STORED if extension in ZIP_STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+            if isinstance(source, bytes):
+                zipf.writestr(zinfo, source)
+                yield buffer.drain()
+                continue
+
+            if isinstance(source, str):
+                size = os.path.getsize(source)
+                open_source = lambda path=source: open(path, 'rb')
+            else:
+                size = None
+                open_source = source
+            # Boyutu bilinmeyen veya 2 GB'tan büyük girdiler için ZIP64 başlığı kullan
+            force_zip64 = size is None or size >= zipfile.ZIP64_LIMIT
+            with open_source() as src, zipf.open(zinfo, 'w', force_zip64=force_zip64) as dest:
+                while True:
+                    chunk = src.read(ZIP_STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
+
+def write_zip_file(zip_path, entries):
+    """iter_zip_stream çıktısını tek geçişte bir ZIP dosyasına yaz"""
+    with open(zip_path, 'wb') as f:
+        for chunk in iter_zip_stream(entries):
+            f.write(chunk)
+    return zip_path
+
+def zip_stream_response(entries, download_name):
+    """Girdileri akan bir ZIP indirme yanıtı olarak gönder"""
+    return app.response_class(
+        stream_with_context(chunk for chunk in iter_zip_stream(entries) if chunk),
+        mimetype='application/zip',
+        headers={
+            'Content-Disposition': f'attachment; filename="{download_name}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+# --- FFmpeg Motoru ---
+# Ses/video dönüştürmeleri dosyayı Python belleğine açmadan doğrudan ffmpeg alt sürecine
+# yaptırılır. İlerleme, ffmpeg'in '-progress' çıktısından okunur. pydub yalnızca örnek
+# (sample) erişimi gereken işlemler için, ihtiyaç olduğu yerde import edilmelidir.
+
+FFMPEG_PIPE_CHUNK_SIZE = 256 * 1024
+FFMPEG_DURATION_PATTERN = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+FFMPEG_STREAM_PATTERN = re.compile(r'Stream #\d+:(\d+)(?:\[\w+\])?(?:\(\w+\))?: (Video|Audio|Subtitle|Data): (\w+)')
+
+# Hedef ses formatı -> ffmpeg codec argümanları
+AUDIO_CODEC_ARGS = {
+    'mp3': ['-codec:a', 'libmp3lame'],
+    'wav': ['-codec:a', 'pcm_s16le'],
+    'ogg': ['-codec:a', 'libvorbis'],
+    'flac': ['-codec:a', 'flac'],
+    'm4a': ['-codec:a', 'aac'],
+    'aac': ['-codec:a', 'aac'],
+}
+LOSSLESS_AUDIO_FORMATS = {'wav', 'flac'}
+
+_ffmpeg_state = {'path': None, 'resolved': False}
+
+def find_ffmpeg():
+    """
+    FFmpeg'in yolunu ilk ihtiyaçta bulur ve saklar, yoksa None.
+    imageio-ffmpeg'in paketlediği program önceliklidir, yoksa PATH'teki ffmpeg kullanılır.
+    """
+    if not _ffmpeg_state['resolved']:
+        try:
+            import imageio_ffmpeg
+            path = imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception as e:
+            path = shutil.which('ffmpeg')
+            if not path:
+                logging.warning(f"imageio-ffmpeg aracılığıyla FFmpeg bulunamadı: {e}. Ses/video dönüştürme işlemleri başarısız olabilir.")
+        _ffmpeg_state.update(path=path, resolved=True)
+        if path:
+            logging.info(f"FFmpeg bulundu: {path}")
+    return _ffmpeg_state['path']
+
+def get_ffmpeg_executable():
+    """Kullanılacak ffmpeg programının yolunu döndür"""
+    executable = find_ffmpeg()
+    if not executable:
+        raise RuntimeError("Bu işlem için sunucuda FFmpeg'in kurulu olması gerekmektedir.")
+    return executable
+
+def probe_media(input_path):
+    """
+    Medya dosyasının süresini ve akışlarını ffmpeg çıktısından okur.
+    Örnek: {'duration': 62.5, 'streams': [{'index': 0, 'type': 'video', 'codec': 'h264'}]}
+    """
+    result = subprocess.run([get_ffmpeg_executable(), '-hide_banner', '-nostdin', '-i', input_path],
+                            capture_output=True, text=True, errors='replace')
+    info = {'duration': None, 'streams': []}
+    duration_match = FFMPEG_DURATION_PATTERN.search(result.stderr)
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        info['duration'] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    for index, stream_type, codec in FFMPEG_STREAM_PATTERN.findall(result.stderr):
+        info['streams'].append({'index': int(index), 'type': stream_type.lower(), 'codec': codec})
+    return info
+
+def run_ffmpeg(args, duration=None, progress_callback=None, stdin_file=None, stdout_file=None):
+    """
+    ffmpeg'i verilen argümanlarla çalıştırır.
+    - duration verilirse ilerleme yüzdesi progress_callback(percent) ile bildirilir.
+    - stdin_file / stdout_file verilirse girdi 'pipe:0', çıktı 'pipe:1' olarak akıtılır;
+      veri sabit boyutlu parçalarla aktarıldığı için bellek kullanımı dosya boyutundan bağımsızdır.
+    Hata durumunda ffmpeg'in son hata satırlarıyla RuntimeError fırlatır.
+    """
+    cmd = [get_ffmpeg_executable(), '-hide_banner', '-y', '-loglevel', 'error',
+           '-nostats', '-progress', 'pipe:2']
+    if stdin_file is None:
+        cmd.append('-nostdin')
+    cmd += args
+
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if stdin_file is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE if stdout_file is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    pumps = []
+    if stdin_file is not None:
+        def feed_stdin():
+            try:
+                _copy_stream(stdin_file, process.stdin)
+            except BrokenPipeError:
+                pass  # ffmpeg girdiyi okumayı erken bıraktı; hata varsa çıkış kodunda görünür
+            finally:
+                process.stdin.close()
+        pumps.append(threading.Thread(target=feed_stdin, daemon=True))
+    if stdout_file is not None:
+        pumps.append(threading.Thread(target=_copy_stream, args=(process.stdout, stdout_file), daemon=True))
+    for pump in pumps:
+        pump.start()
+
+    error_lines = []
+    last_percent = None
+    for raw_line in process.stderr:
+        line = raw_line.decode('utf-8', errors='replace').strip()
+        key, _, value = line.partition('=')
+        if key == 'out_time_us' or key == 'out_time_ms':
+            # ffmpeg her iki alanı da mikro saniye cinsinden yazar
+            if duration and progress_callback and value.isdigit():
+                percent = min(100, int(int(value) / 1_000_000 / duration * 100))
+                if percent != last_percent:
+                    last_percent = percent
+                    progress_callback(percent)
+        elif key == 'progress':
+            if value == 'end' and progress_callback and last_percent != 100:
+                progress_callback(100)
+        elif '=' not in line and line:
+            error_lines = (error_lines + [line])[-5:]
+
+    return_code = process.wait()
+    for pump in pumps:
+        pump.join()
+    if return_code != 0:
+        raise RuntimeError(f"FFmpeg hatası: {' '.join(error_lines) or f'çıkış kodu {return_code}'}")
+
+def _copy_stream(source, destination):
+    """Kaynaktan hedefe sabit boyutlu parçalarla veri aktar"""
+    while True:
+        chunk = source.read(FFMPEG_PIPE_CHUNK_SIZE)
+        if not chunk:
+            break
+        destination.write(chunk)
+
+# Hedef video kapsayıcısı -> kopyalanabilen (yeniden kodlanmadan taşınabilen) codec'ler
+VIDEO_CONTAINER_CODECS = {
+    'mp4': {'video': {'h264', 'hevc', 'mpeg4', 'av1'}, 'audio': {'aac', 'mp3', 'ac3', 'alac', 'opus'}},
+    'mov': {'video': {'h264', 'hevc', 'mpeg4', 'mjpeg', 'prores'}, 'audio': {'aac', 'mp3', 'alac', 'pcm_s16le'}},
+    'mkv': {'video': {'h264', 'hevc', 'mpeg4', 'vp8', 'vp9', 'av1'}, 'audio': {'aac', 'mp3', 'ac3', 'opus', 'vorbis', 'flac'}},
+    'webm': {'video': {'vp8', 'vp9', 'av1'}, 'audio': {'opus', 'vorbis'}},
+    'avi': {'video': {'mpeg4', 'msmpeg4v2', 'msmpeg4v3', 'mjpeg'}, 'audio': {'mp3', 'mp2', 'ac3', 'pcm_s16le'}},
+}
+# Kopyalanamayan akışlar için hedef kapsayıcıya göre kodlama argümanları
+VIDEO_ENCODE_ARGS = {
+    'mp4': {'video': ['-c:v', 'libx264', '-pix_fmt', 'yuv420p'], 'audio': ['-c:a', 'aac', '-b:a', '192k']},
+    'mov': {'video': ['-c:v', 'libx264', '-pix_fmt', 'yuv420p'], 'audio': ['-c:a', 'aac', '-b:a', '192k']},
+    'mkv': {'video': ['-c:v', 'libx264'], 'audio': ['-c:a', 'aac', '-b:a', '192k']},
+    'webm': {'video': ['-c:v', 'libvpx-vp9', '-row-mt', '1', '-b:v', '0', '-crf', '32'], 'audio': ['-c:a', 'libopus', '-b:a', '128k']},
+    'avi': {'video': ['-c:v', 'mpeg4', '-vtag', 'xvid', '-q:v', '4'], 'audio': ['-c:a', 'libmp3lame', '-b:a', '192k']},
+}
+X264_PRESETS = ('ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow')
+
+def build_video_args(probe, target_format, threads=0, preset='veryfast'):
+    """
+    probe_media sonucuna göre ffmpeg codec argümanlarını oluşturur.
+    Hedef kapsayıcıyla uyumlu akışlar kopyalanır (remux), yalnızca uyumsuz olanlar
+    yeniden kodlanır. (argümanlar, remux_mi) döndürür.
+    """
+    compatible = VIDEO_CONTAINER_CODECS[target_format]
+    encode_args = VIDEO_ENCODE_ARGS[target_format]
+    video = next((s for s in probe['streams'] if s['type'] == 'video'), None)
+    audio = next((s for s in probe['streams'] if s['type'] == 'audio'), None)
+    if video is None:
+        raise ValueError("Dosyada dönüştürülecek bir video akışı bulunamadı.")
+
+    args = ['-map', f"0:{video['index']}"]
+    if audio is not None:
+        args += ['-map', f"0:{audio['index']}"]
+
+    copy_video = video['codec'] in compatible['video']
+    if copy_video:
+        args += ['-c:v', 'copy']
+    else:
+        args += encode_args['video']
+        if 'libx264' in encode_args['video']:
+            args += ['-preset', preset]
+        args += ['-threads', str(threads)]
+
+    copy_audio = audio is None or audio['codec'] in compatible['audio']
+    if audio is not None:
+        args += ['-c:a', 'copy'] if copy_audio else encode_args['audio']
+
+    if target_format in ('mp4', 'mov'):
+        args += ['-movflags', '+faststart']
+    return args, copy_video and copy_audio
+
+def job_progress_reporter(output_folder):
+    """
+    Dönüştürücünün ilerlemesini iş klasörüne yazan bir fonksiyon döndürür.
+    Dönüştürücü process havuzunda çalışsa da job klasörü paylaşıldığı için durum sorgusunda görünür.
+    """
+    def report(percent, **details):
+        try:
+            job_manager.write_progress(output_folder, dict(details, progress=percent))
+        except OSError as e:
+            logging.warning(f"İş ilerlemesi yazılamadı ({output_folder}): {e}")
+    return report
+
+def raise_if_job_cancelled(output_folder):
+    """Dönüştürücülerin uzun işlemler arasında çağırdığı iptal kontrolü"""
+    if job_manager.is_cancel_requested(os.path.basename(os.path.normpath(output_folder))):
+        raise JobCancelled()
+
+# --- OFİS BELGE RENDER HAVUZU ---
+# Word/Excel/PowerPoint -> PDF dönüştürmeleri değiştirilebilir bir render arka ucu üzerinden yapılır.
+# - LibreOfficeRendererPool: Linux/macOS'ta sürekli açık headless LibreOffice process'leri (UNO listener)
+# - MSOfficeRenderer: Windows'ta Office COM uygulamalarını process başına bir kez açıp yeniden kullanır
+
+OFFICE_PDF_FILTERS = {
+    'word': 'writer_pdf_Export',
+    'excel': 'calc_pdf_Export',
+    'powerpoint': 'impress_pdf_Export',
+}
+
+# 'uno' modülü uygulamanın Python'unda yoksa (pip venv'i) LibreOffice'in ya da sistemin Python'unda çalışan
+# köprü. LibreOffice listener'ına bağlı kalır; stdin'den satır başına bir JSON istek alır, stdout'a yanıt yazar.
+UNO_BRIDGE_SCRIPT = r"""
+import json, sys, time, uno
+from com.sun.star.beans import PropertyValue
+
+def prop(name, value):
+    item = PropertyValue()
+    item.Name, item.Value = name, value
+    return item
+
+def reply(**fields):
+    sys.stdout.write(json.dumps(fields) + '\n')
+    sys.stdout.flush()
+
+pipe_name, deadline = sys.argv[1], time.time() + float(sys.argv[2])
+local_context = uno.getComponentContext()
+resolver = local_context.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local_context)
+while True:
+    try:
+        context = resolver.resolve('uno:pipe,name=%s;urp;StarOffice.ComponentContext' % pipe_name)
+        desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+        break
+    except Exception as e:
+        if time.time() > deadline:
+            reply(ok=False, error=str(e))
+            sys.exit(1)
+        time.sleep(0.25)
+reply(ok=True)
+
+for line in sys.stdin:
+    request = json.loads(line)
+    document = None
+    try:
+        if request['action'] == 'ping':
+            desktop.getComponents()
+        else:
+            document = desktop.loadComponentFromURL(uno.systemPathToFileUrl(request['input']), '_blank', 0,
+                                                    (prop('Hidden', True), prop('ReadOnly', True)))
+            if document is None:
+                raise RuntimeError('Belge LibreOffice tarafından açılamadı.')
+            document.storeToURL(uno.systemPathToFileUrl(request['output']), (prop('FilterName', request['filter']),))
+        reply(ok=True)
+    except Exception as e:
+        reply(ok=False, error=str(e))
+    finally:
+        if document is not None:
+            try:
+                document.close(True)
+            except Exception:
+                pass
+
+try:
+    desktop.terminate()  # stdin kapandı: renderer durduruluyor
+except Exception:
+    pass
+"""
+
+def find_uno_python(binary):
+    """
+    'import uno' yapabilen bir Python yorumlayıcısı arar: LIBREOFFICE_PYTHON, LibreOffice'in kendi
+    Python'u (resmi paketler) ve sistem python3'ü (Debian/Ubuntu python3-uno). Bulunamazsa None.
+    """
+    program_dir = os.path.dirname(os.path.realpath(binary))
+    candidates = [app.config['LIBREOFFICE_PYTHON'],
+                  os.path.join(program_dir, 'python'),
+                  os.path.join(program_dir, 'python.exe'),
+                  os.path.join(program_dir, os.pardir, 'Resources', 'python'),  # macOS uygulama paketi
+                  shutil.which('python3'),
+                  '/usr/bin/python3']
+    for candidate in dict.fromkeys(filter(None, candidates)):
+        if not os.path.isfile(candidate):
+            continue
+        try:
+            result = subprocess.run([candidate, '-c', 'import uno'], stdin=subprocess.DEVNULL,
+                                    capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            return candidate
+    return None
+
+class LibreOfficeRenderer:
+    """
+    Tek bir headless LibreOffice process'i. Kendi profil klasörü ve UNO pipe'ı vardır,
+    böylece aynı anda çalışan birden çok renderer (ve gunicorn worker'ı) çakışmaz.
+    mode:
+    - 'listener': UNO bağlantısı bu process'te tutulur ('uno' modülü import edilebiliyorsa)
+    - 'bridge': UNO bağlantısını uno_python ile çalışan uzun ömürlü bir köprü process'i tutar
+    - 'cold': process açık tutulamaz; her belge kendi profiliyle 'soffice --convert-to' ile dönüştürülür
+    """
+    def __init__(self, binary, slot, max_jobs, start_timeout, mode='listener', uno_python=None):
+        self.binary = binary
+        self.slot = slot
+        self.max_jobs = max_jobs
+        self.start_timeout = start_timeout
+        self.mode = mode
+        self.uno_python = uno_python
+        self.pipe_name = f"allconvert_{os.getpid()}_{slot}"
+        self.profile_dir = os.path.join(tempfile.gettempdir(), f"allconvert-office-{os.getpid()}-{slot}")
+        self.process = None
+        self.desktop = None
+        self.bridge = None
+        self.job_count = 0
+        self.restart_count = 0
+
+    @staticmethod
+    def uno_available():
+        try:
+            import uno  # noqa: F401  (LibreOffice'in python3-uno paketi)
+            return True
+        except ImportError:
+            return False
+
+    def _profile_arg(self):
+        return f"-env:UserInstallation=file://{os.path.abspath(self.profile_dir)}"
+
+    def start(self):
+        """LibreOffice'i listener modunda başlat ve UNO bağlantısı kur (bu process'te ya da köprüde)"""
+        self.stop()
+        self.process = subprocess.Popen(
+            [self.binary, '--headless', '--invisible', '--nologo', '--norestore', '--nodefault',
+             '--nolockcheck', self._profile_arg(),
+             f'--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if self.mode == 'bridge':
+            self._start_bridge()
+        else:
+            self._connect()
+        self.job_count = 0
+        logging.info(f"LibreOffice renderer #{self.slot} başlatıldı (pid {self.process.pid}, {self.mode}).")
+
+    def _connect(self):
+        import uno
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            'com.sun.star.bridge.UnoUrlResolver', local_context)
+        deadline = time.time() + self.start_timeout
+        while True:
+            try:
+                context = resolver.resolve(f'uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext')
+                self.desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+                break
+            except Exception:
+                if self.process.poll() is not None or time.time() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice başlatılamadı.")
+                time.sleep(0.25)
+
+    def _start_bridge(self):
+        self.bridge = subprocess.Popen(
+            [self.uno_python, '-c', UNO_BRIDGE_SCRIPT, self.pipe_name, str(self.start_timeout)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
+        try:
+            reply = self._bridge_call(None, self.start_timeout + 10)
+        except (RuntimeError, TimeoutError):
+            reply = {'ok': False}
+        if not reply.get('ok'):
+            self.stop()
+            raise RuntimeError("LibreOffice başlatılamadı.")
+
+    def _bridge_call(self, request, timeout):
+        """
+        Köprüye bir istek gönderip yanıtını döndürür (request None ise yalnızca yanıt beklenir).
+        Süre aşılırsa köprü ve LibreOffice öldürülür ve TimeoutError fırlatılır; bir sonraki işte yeniden başlatılır.
+        """
+        timed_out = threading.Event()
+        bridge, process = self.bridge, self.process
+
+        def kill_stuck_processes():
+            timed_out.set()
+            bridge.kill()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, kill_stuck_processes)
+        watchdog.start()
+        try:
+            if request is not None:
+                bridge.stdin.write(json.dumps(request) + '\n')
+                bridge.stdin.flush()
+            line = bridge.stdout.readline()
+        except (OSError, ValueError):
+            line = ''
+        finally:
+            watchdog.cancel()
+        if timed_out.is_set():
+            raise TimeoutError()
+        if not line:
+            raise RuntimeError("LibreOffice köprüsü yanıt vermedi.")
+        return json.loads(line)
+
+    def is_healthy(self):
+        """Process ayakta ve UNO bağlantısı cevap veriyor mu?"""
+        if self.process is None or self.process.poll() is not None:
+            return False
+        if self.mode == 'bridge':
+            if self.bridge is None or self.bridge.poll() is not None:
+                return False
+            try:
+                return self._bridge_call({'action': 'ping'}, self.start_timeout).get('ok', False)
+            except (RuntimeError, TimeoutError, ValueError):
+                return False
+        if self.desktop is None:
+            return False
+        try:
+            self.desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def stop(self):
+        if self.bridge is not None:
+            # Köprü stdin kapanınca LibreOffice'i kapatıp çıkar
+            try:
+                self.bridge.stdin.close()
+                self.bridge.wait(timeout=5)
+            except Exception:
+                self.bridge.kill()
+                self.bridge.wait()
+            self.bridge = None
+        if self.process is not None and self.process.poll() is None:
+            try:
+                if self.desktop is not None:
+                    self.desktop.terminate()
+                self.process.wait(timeout=5)
+            except Exception:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        self.desktop = None
+
+    def convert(self, input_path, output_path, kind, timeout):
+        """Belgeyi PDF'e dönüştür; gerekirse process'i yeniden başlat"""
+        if self.mode == 'cold':
+            return self._convert_once(input_path, output_path, timeout)
+
+        if self.job_count >= self.max_jobs or not self.is_healthy():
+            if self.process is not None:
+                self.restart_count += 1
+            self.start()
+        self.job_count += 1
+
+        if self.mode == 'bridge':
+            try:
+                reply = self._bridge_call({'action': 'convert', 'input': os.path.abspath(input_path),
+                                           'output': os.path.abspath(output_path),
+                                           'filter': OFFICE_PDF_FILTERS[kind]}, timeout)
+            except TimeoutError:
+                raise RuntimeError(f"Belge dönüştürme {timeout} saniyede tamamlanamadı.")
+            if not reply.get('ok'):
+                raise RuntimeError(f"LibreOffice dönüştürme hatası: {reply.get('error')}")
+            return
+
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            item = PropertyValue()
+            item.Name, item.Value = name, value
+            return item
+
+        # Takılan belge process'i öldürülerek kurtarılır; bir sonraki işte yeniden başlatılır
+        timed_out = threading.Event()
+        process = self.process
+
+        def kill_stuck_process():
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, kill_stuck_process)
+        watchdog.start()
+        document = None
+        try:
+            document = self.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(input_path)), '_blank', 0,
+                (prop('Hidden', True), prop('ReadOnly', True)))
+            if document is None:
+                raise RuntimeError("Belge LibreOffice tarafından açılamadı.")
+            document.storeToURL(uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                                (prop('FilterName', OFFICE_PDF_FILTERS[kind]),))
+        except Exception as e:
+            if timed_out.is_set():
+                raise RuntimeError(f"Belge dönüştürme {timeout} saniyede tamamlanamadı.")
+            raise RuntimeError(f"LibreOffice dönüştürme hatası: {e}")
+        finally:
+            watchdog.cancel()
+            if document is not None:
+                try:
+                    document.close(True)
+                except Exception:
+                    pass
+
+    def _convert_once(self, input_path, output_path, timeout):
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        try:
+            result = subprocess.run(
+                [self.binary, '--headless', '--norestore', '--nolockcheck', self._profile_arg(),
+                 '--convert-to', 'pdf', '--outdir', output_dir, os.path.abspath(input_path)],
+                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Belge dönüştürme {timeout} saniyede tamamlanamadı.")
+        produced = os.path.join(output_dir, os.path.basename(input_path).rsplit('.', 1)[0] + '.pdf')
+        if result.returncode != 0 or not os.path.exists(produced):
+            raise RuntimeError(f"LibreOffice dönüştürme hatası: {result.stderr.strip() or result.returncode}")
+        if os.path.abspath(produced) != os.path.abspath(output_path):
+            os.replace(produced, output_path)
+        self.job_count += 1
+
+class LibreOfficeRendererPool:
+    """
+    Sabit sayıda LibreOffice renderer'ını sıcak tutar ve işlere sırayla dağıtır.
+    Renderer'lar ilk ihtiyaçta başlatılır, sağlık kontrolünden geçemeyen veya
+    max_jobs işi dolduran renderer yeniden başlatılır. Havuz web process'inde yaşar;
+    dönüştürmeyi LibreOffice yaptığı için iş thread'i yalnızca bekler (process havuzu gerekmez).
+    Mod (bkz. LibreOfficeRenderer) ilk ihtiyaçta bir kez belirlenir; 'cold' modda havuz sıcak tutulamaz.
+    """
+    name = 'libreoffice'
+    pool_group = None
+
+    def __init__(self, binary, size, max_jobs, convert_timeout, start_timeout=30):
+        self.binary = binary
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        self.convert_timeout = convert_timeout
+        self.start_timeout = start_timeout
+        self.lock = threading.Lock()
+        self.pid = None
+        self.idle = None
+        self.renderers = []
+        self.mode = None
+        self.uno_python = None
+
+    def resolve_mode(self):
+        """Sıcak havuzun nasıl tutulacağını belirle; mümkün değilse bir kez uyarı logla"""
+        with self.lock:
+            if self.mode is None:
+                if LibreOfficeRenderer.uno_available():
+                    self.mode = 'listener'
+                else:
+                    self.uno_python = find_uno_python(self.binary)
+                    self.mode = 'bridge' if self.uno_python else 'cold'
+                if self.mode == 'cold':
+                    logging.warning("'uno' modülü olan bir Python bulunamadı; LibreOffice sıcak tutulamıyor, her belge "
+                                    "yeni bir 'soffice --convert-to' ile dönüştürülecek. LIBREOFFICE_PYTHON ile "
+                                    "python3-uno kurulu bir Python gösterin.")
+                else:
+                    logging.info(f"LibreOffice render havuzu modu: {self.mode}"
+                                 + (f" ({self.uno_python})" if self.uno_python else ''))
+            return self.mode
+
+    def _ensure_pool(self):
+        mode = self.resolve_mode()
+        # fork sonrası child, parent'ın LibreOffice process'lerini kullanmamalı
+        with self.lock:
+            if self.pid != os.getpid():
+                self.pid = os.getpid()
+                self.renderers = [LibreOfficeRenderer(self.binary, slot, self.max_jobs, self.start_timeout,
+                                                      mode, self.uno_python)
+                                  for slot in range(self.size)]
+                self.idle = queue.Queue()
+                for renderer in self.renderers:
+                    self.idle.put(renderer)
+
+    def convert(self, input_path, output_path, kind):
+        self._ensure_pool()
+        try:
+            renderer = self.idle.get(timeout=self.convert_timeout)
+        except queue.Empty:
+            raise RuntimeError("Belge dönüştürücüler şu anda meşgul. Lütfen biraz sonra tekrar deneyin.")
+        try:
+            renderer.convert(input_path, output_path, kind, self.convert_timeout)
+        finally:
+            self.idle.put(renderer)
+
+    def get_stats(self):
+        return {
+            'backend': self.name,
+            'mode': self.resolve_mode(),
+            'size': self.size,
+            'running': sum(1 for r in self.renderers if r.process is not None and r.process.poll() is None),
+            'jobs': sum(r.job_count for r in self.renderers),
+            'restarts': sum(r.restart_count for r in self.renderers)
+        }
+
+    def shutdown(self):
+        if self.pid != os.getpid():
+            return
+        for renderer in self.renderers:
+            renderer.stop()
+            shutil.rmtree(renderer.profile_dir, ignore_errors=True)
+
+class MSOfficeRenderer:
+    """
+    Windows'ta Office COM uygulamalarını (Word, Excel, PowerPoint) process başına bir kez açar
+    ve sonraki işlerde yeniden kullanır. Uygulama cevap vermezse yeniden açılır.
+    Dönüştürücü process havuzunda ('office' grubu) çalışır.
+    """
+    name = 'msoffice'
+    pool_group = 'office'
+    APPLICATIONS = {'word': 'Word.Application', 'excel': 'Excel.Application', 'powerpoint': 'PowerPoint.Application'}
+
+    def __init__(self):
+        self.applications = {}
+        self.pid = None
+
+    def _get_application(self, kind):
+        import win32com.client
+        import multiprocessing.util
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.applications = {}
+            # Process havuzu worker'ı kapanırken açık Office uygulamalarını da kapat
+            multiprocessing.util.Finalize(self, MSOfficeRenderer._quit_all, args=(self.applications,), exitpriority=10)
+        application = self.applications.get(kind)
+        if application is not None:
             try:
-                # Dosya temizleme
-                cleanup_old_files()
-                
-                # Session temizleme
-                session_manager.cleanup_expired_sessions()
-                
-                # Sistem durumu logla
-                stats = get_system_stats()
-                if stats:
-                    logging.info(f"Sistem durumu - RAM: %{stats.get('memory_percent', 0):.1f}, "
-                               f"Disk: %{stats.get('disk_percent', 0):.1f}, "
-                               f"Aktif Sessions: {stats.get('active_sessions', 0)}, "
-                               f"Downloads Boyutu: {stats.get('download_folder_size', 0):.1f}MB")
-                
-                # Bir sonraki temizliğe kadar bekle
-                time.sleep(app.config['CLEANUP_INTERVAL_HOURS'] * 3600)
-                
-            except Exception as e:
-                logging.error(f"Periyodik temizleme hatası: {e}")
-                time.sleep(300)  # Hata durumunda 5 dakika bekle
+                application.Name  # sağlık kontrolü
+                return application
+            except Exception:
+                logging.warning(f"{self.APPLICATIONS[kind]} cevap vermiyor, yeniden açılıyor.")
+        application = win32com.client.DispatchEx(self.APPLICATIONS[kind])
+        if kind != 'powerpoint':
+            application.Visible = False
+            application.DisplayAlerts = False
+        self.applications[kind] = application
+        return application
 
-    # Arka plan thread'ini başlat
-    cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-    cleanup_thread.start()
-    logging.info("Periyodik temizleme sistemi başlatıldı")
+    @staticmethod
+    def _quit_all(applications):
+        for application in applications.values():
+            try:
+                application.Quit()
+            except Exception:
+                pass
 
-# Uygulama başlatıldığında temizleme sistemini başlat
-schedule_cleanup()
+    def convert(self, input_path, output_path, kind):
+        application = self._get_application(kind)
+        source, target = os.path.abspath(input_path), os.path.abspath(output_path)
+        if kind == 'word':
+            document = application.Documents.Open(source, ReadOnly=True)
+            try:
+                document.SaveAs2(target, FileFormat=17)  # 17 = wdFormatPDF
+            finally:
+                document.Close(False)
+        elif kind == 'excel':
+            workbook = application.Workbooks.Open(source, ReadOnly=True)
+            try:
+                workbook.ExportAsFixedFormat(0, target)  # 0 = xlTypePDF
+            finally:
+                workbook.Close(False)
+        else:
+            presentation = application.Presentations.Open(source, ReadOnly=True, WithWindow=False)
+            try:
+                presentation.SaveAs(target, 32)  # 32 = ppFormatPDF
+            finally:
+                presentation.Close()
 
-# Uygulama kapanırken temizlik yap
-def cleanup_on_exit():
-    """Uygulama kapanırken temizlik yap"""
-    logging.info("Uygulama kapanıyor, temizlik yapılıyor...")
-    cleanup_old_files()
-    executor.shutdown(wait=False)
+    def get_stats(self):
+        return {'backend': self.name, 'open_applications': sorted(self.applications)}
 
-atexit.register(cleanup_on_exit)
+    def shutdown(self):
+        pass
+
+def find_libreoffice():
+    """LibreOffice programının yolunu bul, yoksa None"""
+    return app.config['LIBREOFFICE_PATH'] or shutil.which('soffice') or shutil.which('libreoffice')
+
+def create_document_renderer():
+    """DOCUMENT_RENDERER ayarına göre ofis render arka ucunu oluştur, kullanılamıyorsa None"""
+    backend = app.config['DOCUMENT_RENDERER']
+    if backend in ('auto', 'msoffice') and platform.system() == "Windows":
+        try:
+            # Modül burada import edilmez; COM ilk dönüştürmede process havuzunda yüklenir
+            if importlib.util.find_spec('win32com') is None:
+                raise ImportError('win32com')
+            return MSOfficeRenderer()
+        except ImportError:
+            logging.warning("'pypiwin32' bulunamadı, Office COM arka ucu kullanılamıyor.")
+    if backend in ('auto', 'libreoffice'):
+        binary = find_libreoffice()
+        if binary:
+            return LibreOfficeRendererPool(
+                binary,
+                app.config['OFFICE_RENDERER_POOL_SIZE'],
+                app.config['OFFICE_RENDERER_MAX_JOBS'],
+                app.config['OFFICE_CONVERT_TIMEOUT']
+            )
+        logging.warning("LibreOffice bulunamadı. Excel/PowerPoint -> PDF dönüştürücüleri devre dışı.")
+    return None
+
+# Global belge render arka ucu (yoksa None)
+document_renderer = create_document_renderer()
+
+def render_office_to_pdf(input_path, output_folder, kind):
+    """Ofis belgesini seçili render arka ucu ile PDF'e dönüştür"""
+    if document_renderer is None:
+        raise RuntimeError("Bu sunucuda ofis belgesi dönüştürücüsü (LibreOffice veya Microsoft Office) bulunamadı.")
+    output_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + ".pdf")
+    logging.info(f"'{input_path}' dosyası {document_renderer.name} ile PDF'e dönüştürülüyor...")
+    document_renderer.convert(input_path, output_path, kind)
+    if not os.path.exists(output_path):
+        raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+    return output_path
 
 # --- DÖNÜŞTÜRÜCÜ FONKSİYONLARI ---
 
+PDF_RENDER_BATCH_PAGES = 8  # Bir render process'ine tek seferde verilen sayfa sayısı
+
 def convert_word_to_pdf(input_path, output_folder):
     """
     Word belgesini (.docx) PDF formatına dönüştürür.
-    Gerekli Kütüphane: pip install docx2pdf
+    Ofis render arka ucu (LibreOffice / Microsoft Office) varsa onu kullanır,
+    yoksa docx2pdf'e (Word yüklü macOS) düşer.
+    Gerekli Kütüphane: pip install docx2pdf (yalnızca yedek yol için)
     """
     try:
+        if document_renderer is not None:
+            output_path = render_office_to_pdf(input_path, output_folder, 'word')
+            logging.info("Dönüştürme başarılı.")
+            return output_path
+
         from docx2pdf import convert
         output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".docx", ".pdf"))
         logging.info(f"'{input_path}' dosyası '{output_path}' olarak dönüştürülüyor...")
@@ -262,26 +3193,76 @@ def convert_word_to_pdf(input_path, output_folder):
         logging.error(traceback.format_exc())
         return None
 
-def convert_pdf_to_word(input_path, output_folder):
+def _parse_pdf_pages_for_word(input_path, page_numbers):
+    """Verilen sayfaları pdf2docx ile çözümler ve sayfa düzenini sözlük olarak döndürür (ayrı process'te çalışır)."""
+    from pdf2docx import Converter
+    cv = Converter(input_path)
+    try:
+        # parse() varsayılan ayarları kendisi eklemez (yalnızca convert() ekler); eksik anahtarlar KeyError verir
+        cv.parse(pages=page_numbers, **cv.default_settings)
+        return cv.store()
+    finally:
+        cv.close()
+
+def convert_pdf_to_word(input_path, output_folder, pages=None):
     """
     PDF dosyasını Word belgesine (.docx) dönüştürür.
+    Sayfalar PDF_TO_WORD_CHUNK_PAGES'lik parçalara bölünüp PDF_RENDER_WORKERS process'te çözümlenir;
+    her parça bitince ilerleme (sayfa sayısıyla) iş durumuna yazılır. İş iptal edilirse bekleyen
+    parçalar bırakılır. pages ('1-3,5') seçeneği yalnızca istenen sayfaları dönüştürür.
     Gerekli Kütüphane: pip install pdf2docx
     """
     try:
+        import fitz  # PyMuPDF (pdf2docx bağımlılığı)
         from pdf2docx import Converter
+        with fitz.open(input_path) as doc:
+            page_count = len(doc)
+        if page_count == 0:
+            raise Exception("PDF dosyasında dönüştürülecek sayfa bulunamadı.")
+    except Exception as e:
+        logging.error(f"PDF'ten Word'e dönüştürme hatası: {e}")
+        import traceback
+        logging.error(traceback.format_exc())
+        return None
+
+    page_numbers = parse_page_range(pages, page_count)
+    chunk_size = app.config['PDF_TO_WORD_CHUNK_PAGES']
+    chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+    workers = min(app.config['PDF_RENDER_WORKERS'], len(chunks))
+    report_progress = job_progress_reporter(output_folder)
+
+    try:
         output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".pdf", ".docx"))
-        logging.info(f"'{input_path}' dosyası '{output_path}' olarak dönüştürülüyor...")
-        
-        # PDF'i dönüştür
+        logging.info(f"'{input_path}' dosyası '{output_path}' olarak dönüştürülüyor ({len(page_numbers)} sayfa, {len(chunks)} parça)...")
+
         cv = Converter(input_path)
-        cv.convert(output_path, start=0, end=None)
-        cv.close()
-        
+        try:
+            pages_done = 0
+            parse_pool = ProcessPoolExecutor(max_workers=max(1, workers), mp_context=child_process_context())
+            try:
+                pending = {parse_pool.submit(_parse_pdf_pages_for_word, input_path, chunk): chunk for chunk in chunks}
+                while pending:
+                    finished, _ = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+                    raise_if_job_cancelled(output_folder)
+                    for future in finished:
+                        # Parçaların çözümlenmiş sayfaları ana dönüştürücüde birleştirilir
+                        cv.restore(future.result())
+                        pages_done += len(pending.pop(future))
+                        report_progress(int(pages_done / len(page_numbers) * 100),
+                                        pages_done=pages_done, pages_total=len(page_numbers))
+            finally:
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+            cv.make_docx(output_path, **cv.default_settings)
+        finally:
+            cv.close()
+
         if os.path.exists(output_path):
             logging.info("Dönüştürme başarılı.")
             return output_path
         else:
             raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+    except JobCancelled:
+        raise
     except Exception as e:
         logging.error(f"PDF'ten Word'e dönüştürme hatası: {e}")
         import traceback
@@ -291,42 +3272,12 @@ def convert_pdf_to_word(input_path, output_folder):
 def convert_excel_to_pdf(input_path, output_folder):
     """
     Excel dosyasını (.xlsx) PDF formatına dönüştürür.
-    Bu basit dönüştürücü, Excel'in ilk sayfasını bir HTML tablosuna çevirir
-    ve bunu PDF yapar. Karmaşık formatlamayı korumayabilir.
-    Gerekli Kütüphaneler: pip install pandas openpyxl
+    Linux/macOS'ta LibreOffice, Windows'ta Microsoft Office render arka ucu kullanılır.
     """
     try:
-        import pandas as pd
-        output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".xlsx", ".pdf"))
-        
-        # Excel dosyasını oku ve HTML'e dönüştür (daha iyi bir PDF çıktısı için)
-        df = pd.read_excel(input_path)
-        html_content = df.to_html(index=False, border=1)
-
-        # Geçici bir HTML dosyası oluştur
-        temp_html_path = os.path.join(output_folder, "temp.html")
-        with open(temp_html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-            
-        # Bu kısım için WeasyPrint gibi bir kütüphane gerekir. 
-        # Alternatif olarak, Windows'ta COM otomasyonu kullanılabilir.
-        # Şimdilik basit bir yer tutucu olarak bırakalım ve COM kullanalım.
-        if platform.system() == "Windows":
-            import win32com.client
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = False
-            
-            workbook = excel.Workbooks.Open(os.path.abspath(input_path))
-            workbook.ActiveSheet.ExportAsFixedFormat(0, os.path.abspath(output_path))
-            workbook.Close(False)
-            excel.Quit()
-            
-            if os.path.exists(output_path):
-                logging.info("Excel -> PDF dönüştürme başarılı (COM).")
-                return output_path
-
-        raise NotImplementedError("Excel'den PDF'e dönüştürme şu anda sadece Windows'ta ve Microsoft Office yüklü ise desteklenmektedir.")
-
+        output_path = render_office_to_pdf(input_path, output_folder, 'excel')
+        logging.info(f"Excel -> PDF dönüştürme başarılı ({document_renderer.name}).")
+        return output_path
     except Exception as e:
         logging.error(f"Excel'den PDF'e dönüştürme hatası: {e}")
         import traceback
@@ -336,23 +3287,12 @@ def convert_excel_to_pdf(input_path, output_folder):
 def convert_powerpoint_to_pdf(input_path, output_folder):
     """
     PowerPoint dosyasını (.pptx) PDF formatına dönüştürür.
-    Sadece Windows'ta ve Microsoft Office yüklü ise çalışır.
-    Gerekli Kütüphane: pip install pypiwin32
+    Linux/macOS'ta LibreOffice, Windows'ta Microsoft Office render arka ucu kullanılır.
     """
     try:
-        output_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + ".pdf")
-        
-        powerpoint = win32com.client.Dispatch("PowerPoint.Application")
-        presentation = powerpoint.Presentations.Open(os.path.abspath(input_path), WithWindow=False)
-        presentation.SaveAs(os.path.abspath(output_path), 32) # 32 = ppFormatPDF
-        presentation.Close()
-        powerpoint.Quit()
-
-        if os.path.exists(output_path):
-            logging.info("PowerPoint -> PDF dönüştürme başarılı (COM).")
-            return output_path
-        else:
-            raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+        output_path = render_office_to_pdf(input_path, output_folder, 'powerpoint')
+        logging.info(f"PowerPoint -> PDF dönüştürme başarılı ({document_renderer.name}).")
+        return output_path
     except Exception as e:
         logging.error(f"PowerPoint'ten PDF'e dönüştürme hatası: {e}")
         import traceback
@@ -391,7 +3331,7 @@ def convert_txt_to_word(input_path, output_folder):
         import docx
         output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".txt", ".docx"))
         doc = docx.Document()
-        with open(input_path, "r", encoding="utf-8") as f:
+        with open(input_path, "r", encoding=text_file_encoding(input_path)) as f:
             doc.add_paragraph(f.read())
         doc.save(output_path)
 
@@ -405,41 +3345,121 @@ def convert_txt_to_word(input_path, output_folder):
         logging.error(traceback.format_exc())
         return None
 
-def convert_pdf_to_jpg(input_path, output_folder):
+def parse_page_range(page_range, page_count):
+    """
+    '1-3,5,8-' biçimindeki sayfa aralığını 0 tabanlı sıralı sayfa listesine çevirir.
+    Boş değer tüm sayfalar demektir. Geçersiz aralıkta ValueError fırlatır.
+    """
+    if not page_range:
+        return list(range(page_count))
+    pages = set()
+    try:
+        for part in page_range.replace(' ', '').split(','):
+            if not part:
+                continue
+            if '-' in part:
+                start, end = part.split('-', 1)
+                start = int(start) if start else 1
+                end = int(end) if end else page_count
+            else:
+                start = end = int(part)
+            if start < 1 or end < start:
+                raise ValueError
+            pages.update(range(start - 1, min(end, page_count)))
+    except ValueError:
+        raise ValueError(f"Geçersiz sayfa aralığı: '{page_range}'. Örnek: 1-3,5")
+    if not pages:
+        raise ValueError(f"Sayfa aralığı belgede bulunmuyor. Belge {page_count} sayfa.")
+    return sorted(pages)
+
+def parse_int_option(value, name, default, minimum, maximum):
+    """Formdan gelen sayısal seçeneği doğrula"""
+    if value in (None, ''):
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} bir sayı olmalıdır.")
+    if not minimum <= number <= maximum:
+        raise ValueError(f"{name} {minimum} ile {maximum} arasında olmalıdır.")
+    return number
+
+def _render_pdf_pages(input_path, page_numbers, dpi, quality):
+    """Verilen PDF sayfalarını JPEG baytlarına çevirir (ayrı process'te çalışır)."""
+    import fitz  # PyMuPDF
+    zoom = dpi / 72
+    rendered = []
+    with fitz.open(input_path) as doc:
+        for page_num in page_numbers:
+            pix = doc.load_page(page_num).get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            rendered.append((page_num, pix.tobytes(output="jpeg", jpg_quality=quality)))
+    return rendered
+
+def iter_rendered_pdf_pages(input_path, page_numbers, dpi, quality):
+    """
+    Sayfaları sırayla (sayfa_no, jpeg_bytes) olarak üretir. Çok sayfalı belgelerde
+    sayfalar küçük gruplar halinde process'lere dağıtılır, sonuçlar sırası bozulmadan akar.
+    """
+    batch_size = PDF_RENDER_BATCH_PAGES
+    batches = [page_numbers[i:i + batch_size] for i in range(0, len(page_numbers), batch_size)]
+    workers = min(app.config['PDF_RENDER_WORKERS'], len(batches))
+
+    if workers <= 1:
+        for batch in batches:
+            yield from _render_pdf_pages(input_path, batch, dpi, quality)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=child_process_context()) as render_pool:
+        for rendered in render_pool.map(_render_pdf_pages, [input_path] * len(batches), batches,
+                                        [dpi] * len(batches), [quality] * len(batches)):
+            yield from rendered
+
+def convert_pdf_to_jpg(input_path, output_folder, dpi=None, quality=None, pages=None):
     """
     PDF dosyasının her sayfasını JPG resmine dönüştürür ve bir ZIP dosyası olarak sunar.
+    dpi (36-300, varsayılan 72), quality (1-100, varsayılan 95) ve pages ('1-3,5')
+    seçenekleri formdan gelir. JPEG'ler geçici dosyaya yazılmadan doğrudan ZIP'e eklenir.
     Gerekli Kütüphane: pip install PyMuPDF Pillow
     """
+    dpi = parse_int_option(dpi, 'DPI', 72, 36, 300)
+    quality = parse_int_option(quality, 'JPEG kalitesi', 95, 1, 100)
     try:
         import fitz  # PyMuPDF
         
-        doc = fitz.open(input_path)
-        image_paths = []
+        with fitz.open(input_path) as doc:
+            page_count = len(doc)
         
         # Eğer hiç sayfa yoksa hata ver
-        if len(doc) == 0:
+        if page_count == 0:
             raise Exception("PDF dosyasında dönüştürülecek sayfa bulunamadı.")
+    except Exception as e:
+        logging.error(f"PDF'ten JPG'ye dönüştürme hatası: {e}")
+        import traceback
+        logging.error(traceback.format_exc())
+        return None
 
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            pix = page.get_pixmap()
-            image_path = os.path.join(output_folder, f"sayfa_{page_num + 1}.jpg")
-            pix.save(image_path, "jpeg")
-            image_paths.append(image_path)
-        doc.close()
+    page_numbers = parse_page_range(pages, page_count)
+
+    try:
+        base_name = os.path.basename(input_path).rsplit('.', 1)[0]
 
         # Tek bir resim varsa doğrudan gönder, birden çoksa ZIP'le
-        if len(image_paths) == 1:
+        if len(page_numbers) == 1:
+            page_num, image_bytes = next(iter_rendered_pdf_pages(input_path, page_numbers, dpi, quality))
+            image_path = os.path.join(output_folder, f"sayfa_{page_num + 1}.jpg")
+            with open(image_path, 'wb') as f:
+                f.write(image_bytes)
             logging.info("PDF -> JPG (tek sayfa) dönüştürme başarılı.")
-            return image_paths[0]
-        else:
-            zip_path = os.path.join(output_folder, os.path.basename(input_path).replace(".pdf", ".zip"))
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
-                for file in image_paths:
-                    zipf.write(file, os.path.basename(file))
-            
-            logging.info(f"PDF -> JPG (çoklu sayfa) dönüştürme başarılı. '{zip_path}' oluşturuldu.")
-            return zip_path
+            return image_path
+
+        zip_path = write_zip_file(
+            os.path.join(output_folder, f"{base_name}.zip"),
+            ((f"sayfa_{page_num + 1}.jpg", image_bytes)
+             for page_num, image_bytes in iter_rendered_pdf_pages(input_path, page_numbers, dpi, quality))
+        )
+
+        logging.info(f"PDF -> JPG ({len(page_numbers)} sayfa, {dpi} DPI) dönüştürme başarılı. '{zip_path}' oluşturuldu.")
+        return zip_path
             
     except Exception as e:
         logging.error(f"PDF'ten JPG'ye dönüştürme hatası: {e}")
@@ -473,6 +3493,13 @@ def convert_jpg_to_pdf(input_path, output_folder):
         logging.error(traceback.format_exc())
         return None
 
+# Pillow'un kayıt formatı adları ve ek kayıt ayarları
+IMAGE_SAVE_FORMATS = {
+    'jpg': ('JPEG', {}),
+    'png': ('PNG', {}),
+    'pdf': ('PDF', {'resolution': 100.0}),
+}
+
 def convert_image_format(input_path, output_folder, target_format):
     """
     Bir resim formatını diğerine dönüştürür (örn: JPG -> PNG).
@@ -488,7 +3515,8 @@ def convert_image_format(input_path, output_folder, target_format):
         if image.mode != 'RGB' and target_format.lower() == 'jpg':
              image = image.convert('RGB')
              
-        image.save(output_path, format=target_format.upper())
+        # Pillow JPG formatını 'JPEG' adıyla tanır
+        image.save(output_path, format=IMAGE_SAVE_FORMATS[target_format.lower()][0])
         
         if os.path.exists(output_path):
             logging.info(f"Resim formatı {target_format.upper()} olarak dönüştürüldü.")
@@ -507,23 +3535,79 @@ def convert_jpg_to_png(input_path, output_folder):
 def convert_png_to_jpg(input_path, output_folder):
     return convert_image_format(input_path, output_folder, 'JPG')
 
+# --- Bellek İçi Resim Adımları (çok adımlı dönüşümler için) ---
+# CONVERTERS kayıtlarındaki 'memory_step' fonksiyonları açık bir PIL görüntüsünü alır ve
+# dönüştürülmüş görüntüyü döndürür; ardışık resim adımları böylece ara dosya yazmadan zincirlenir.
+
+def _image_keep(image):
+    return image
+
+def _image_to_rgb(image):
+    # JPG alfa kanalı taşımaz
+    return image if image.mode == 'RGB' else image.convert('RGB')
+
+def _image_drop_alpha(image):
+    # PDF CMYK veya RGB'yi destekler
+    return image.convert('RGB') if image.mode == 'RGBA' else image
+
+def run_image_pipeline(input_path, output_folder, conversion_types):
+    """
+    Ardışık resim dönüşümlerini tek bir bellek içi görüntü üzerinde uygular (örn: PNG -> JPG -> PDF).
+    Görüntü bir kez çözülür, yalnızca son format diske yazılır; ara JPEG kodlaması ve
+    ara dosya okuma/yazma atlanır.
+    Gerekli Kütüphane: pip install Pillow
+    """
+    try:
+        from PIL import Image
+        target_format = CONVERTERS[conversion_types[-1]]['output_format']
+        save_format, save_options = IMAGE_SAVE_FORMATS[target_format]
+        base_name = os.path.basename(input_path).rsplit('.', 1)[0]
+        output_path = os.path.join(output_folder, f"{base_name}.{target_format}")
+
+        with Image.open(input_path) as image:
+            for conversion_type in conversion_types:
+                image = CONVERTERS[conversion_type]['memory_step'](image)
+            image.save(output_path, save_format, **save_options)
+
+        if os.path.exists(output_path):
+            logging.info(f"Bellek içi resim zinciri tamamlandı: {' -> '.join(conversion_types)}")
+            return output_path
+        raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+    except Exception as e:
+        logging.error(f"Bellek içi resim zinciri hatası: {e}")
+        import traceback
+        logging.error(traceback.format_exc())
+        return None
+
 # --- Ses, Video, Veri ve Arşiv Dönüştürücüleri ---
 
-def convert_audio(input_path, output_folder, target_format):
+def convert_audio(input_path, output_folder, target_format, bitrate=None, sample_rate=None, channels=None):
     """
-    Ses dosyalarını dönüştürür (örn: MP3 -> WAV).
-    Gerekli Kütüphane: pip install pydub
+    Ses dosyalarını dönüştürür (örn: WAV -> MP3).
+    Dosya Python belleğine açılmaz; ffmpeg dosyadan dosyaya akıtarak dönüştürür,
+    bu yüzden bellek kullanımı ses süresinden bağımsızdır. bitrate (32-320 kbps),
+    sample_rate (8000-192000 Hz) ve channels (1-2) seçenekleri formdan gelir.
     Gerekli Program: ffmpeg
     """
+    bitrate = parse_int_option(bitrate, 'Bit hızı', 192, 32, 320)
+    sample_rate = parse_int_option(sample_rate, 'Örnekleme hızı', None, 8000, 192000)
+    channels = parse_int_option(channels, 'Kanal sayısı', None, 1, 2)
     try:
-        from pydub import AudioSegment
         output_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + f".{target_format}")
-        
-        logging.info(f"Ses dosyası okunuyor: {input_path}")
-        audio = AudioSegment.from_file(input_path)
-        
-        logging.info(f"Ses dosyası {target_format} formatına dışa aktarılıyor...")
-        audio.export(output_path, format=target_format)
+
+        args = ['-i', input_path, '-vn', '-map_metadata', '0']
+        args += AUDIO_CODEC_ARGS.get(target_format, [])
+        if target_format not in LOSSLESS_AUDIO_FORMATS:
+            args += ['-b:a', f'{bitrate}k']
+        if sample_rate:
+            args += ['-ar', str(sample_rate)]
+        if channels:
+            args += ['-ac', str(channels)]
+        args.append(output_path)
+
+        logging.info(f"Ses dosyası {target_format} formatına dönüştürülüyor: {input_path}")
+        run_ffmpeg(args, duration=probe_media(input_path)['duration'],
+                   progress_callback=job_progress_reporter(output_folder))
 
         if os.path.exists(output_path):
             logging.info(f"Ses dönüştürme başarılı: -> {output_path}")
@@ -535,47 +3619,144 @@ def convert_audio(input_path, output_folder, target_format):
         logging.error(traceback.format_exc())
         return None
 
-def convert_video(input_path, output_folder, target_format):
+def convert_video(input_path, output_folder, target_format, preset=None):
     """
     Video dosyalarını dönüştürür (örn: MP4 -> AVI).
-    Gerekli Kütüphane: pip install moviepy
+    Önce akışlar incelenir; codec'ler hedef kapsayıcıyla uyumluysa video yeniden
+    kodlanmadan kopyalanır (remux). Aksi halde tek bir ffmpeg süreci yalnızca uyumsuz
+    akışları kodlar. Thread sayısı VIDEO_ENCODE_THREADS, x264 hızı preset seçeneği ile
+    (varsayılan VIDEO_ENCODE_PRESET) ayarlanır.
     Gerekli Program: ffmpeg
     """
+    preset = (preset or app.config['VIDEO_ENCODE_PRESET']).strip().lower()
+    if preset not in X264_PRESETS:
+        raise ValueError(f"Geçersiz hız ayarı. Seçenekler: {', '.join(X264_PRESETS)}")
     try:
-        from moviepy.editor import VideoFileClip
         output_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + f".{target_format}")
-        
-        logging.info(f"Video dosyası işleniyor: {input_path}")
-        with VideoFileClip(input_path) as video:
-            video.write_videofile(output_path, codec='libxvid' if target_format == 'avi' else None)
+
+        probe = probe_media(input_path)
+        codec_args, remux = build_video_args(probe, target_format, app.config['VIDEO_ENCODE_THREADS'], preset)
+        logging.info(f"Video dosyası işleniyor ({'remux' if remux else 'kodlama'}): {input_path}")
+        run_ffmpeg(['-i', input_path] + codec_args + ['-sn', '-dn', output_path],
+                   duration=probe['duration'], progress_callback=job_progress_reporter(output_folder))
 
         if os.path.exists(output_path):
             logging.info(f"Video dönüştürme başarılı: -> {output_path}")
             return output_path
         raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+    except ValueError:
+        raise
     except Exception as e:
         logging.error(f"Video dönüştürme hatası: {e}")
         import traceback
         logging.error(traceback.format_exc())
         return None
 
+DATA_STREAM_BUFFER_SIZE = 1024 * 1024  # Akan veri dönüştürmelerinde dosya yazma tamponu
+XML_NAME_PATTERN = re.compile(r'^[^\W\d][\w.\-]*$')
+XML_EXTRA_ENTITIES = {'"': '&quot;', "'": '&apos;'}
+TEXT_BOMS = (b'\xff\xfe', b'\xfe\xff')  # UTF-16 LE / BE bayt sırası işaretleri
+
+def text_file_encoding(path):
+    """Metin dosyasının kodlamasını BOM'undan belirle (UTF-16 değilse UTF-8)"""
+    with open(path, 'rb') as f:
+        return 'utf-16' if f.read(2) in TEXT_BOMS else 'utf-8-sig'
+
+class _Utf8Reader:
+    """Metin akışını okunurken UTF-8 baytlarına çeviren dosya nesnesi (ijson bayt okur)"""
+    def __init__(self, text_stream):
+        self.text_stream = text_stream
+
+    def read(self, size=-1):
+        return self.text_stream.read(size).encode('utf-8')
+
+    def __iter__(self):
+        return (line.encode('utf-8') for line in self.text_stream)
+
+    def seek(self, offset, whence=0):
+        return self.text_stream.seek(offset, whence)
+
+    def close(self):
+        self.text_stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_text_source(path):
+    """Metin dosyasını UTF-8 bayt akışı olarak aç; UTF-16 dosyalar okunurken UTF-8'e çevrilir"""
+    encoding = text_file_encoding(path)
+    if encoding == 'utf-16':
+        return _Utf8Reader(open(path, 'r', encoding=encoding))
+    return open(path, 'rb')
+
+def xml_element_name(key):
+    """
+    JSON anahtarını XML etiket adına çevirir (dicttoxml ile aynı kurallar):
+    geçerli ad aynen, sayısal ad 'n' önekiyle, boşluklu ad '_' ile kullanılır;
+    aksi halde <key name="..."> biçimine düşülür. ':' içeren adlar ad alanı öneki sayılacağı için
+    (bildirilmemiş önek XML'i bozar) her zaman <key name="..."> olarak yazılır. (etiket, öznitelik_metni) döndürür.
+    """
+    key = str(key)
+    if XML_NAME_PATTERN.match(key):
+        return key, ''
+    if key.isdigit():
+        return f"n{key}", ''
+    if XML_NAME_PATTERN.match(key.replace(' ', '_')):
+        return key.replace(' ', '_'), ''
+    return 'key', f' name={quoteattr(key)}'
+
+def _xml_scalar_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return xml_escape(str(value), XML_EXTRA_ENTITIES)
+
 def convert_json_to_xml(input_path, output_folder):
     """
     JSON dosyasını XML dosyasına dönüştürür.
-    Gerekli Kütüphaneler: pip install dicttoxml
+    Dosya belleğe yüklenmez; ijson ile olay olay okunur ve XML etiketleri okundukça yazılır,
+    böylece yüzlerce MB'lık dosyalar sabit bellekle dönüştürülür. Çıktı biçimi önceki
+    dicttoxml çıktısıyla aynıdır (kök 'root', liste elemanları 'item').
+    Gerekli Kütüphane: pip install ijson
     """
     try:
-        import json
-        from dicttoxml import dicttoxml
+        import ijson
         output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".json", ".xml"))
 
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        xml_data = dicttoxml(data, custom_root='root', attr_type=False)
-        
-        with open(output_path, 'wb') as f:
-            f.write(xml_data)
+        with open_text_source(input_path) as source, \
+                open(output_path, 'w', encoding='utf-8', buffering=DATA_STREAM_BUFFER_SIZE) as out:
+            out.write('<?xml version="1.0" encoding="UTF-8" ?><root>')
+            # Her açık kapsayıcı için [tür, kapanış etiketi, sıradaki anahtar]
+            stack = [['array', None, None]]  # Kök değer dicttoxml'deki gibi <item> içinde yazılır
+
+            def open_tag():
+                parent = stack[-1]
+                if parent[0] == 'map':
+                    name, attrs = xml_element_name(parent[2])
+                    return f'<{name}{attrs}>', f'</{name}>'
+                return '<item>', '</item>'
+
+            for _, event, value in ijson.parse(source, use_float=True):
+                if event == 'map_key':
+                    stack[-1][2] = value
+                elif event in ('start_map', 'start_array'):
+                    if len(stack) == 1:
+                        # Kök nesne/dizinin elemanları doğrudan <root> altına yazılır
+                        stack.append(['map' if event == 'start_map' else 'array', '', None])
+                        continue
+                    start, end = open_tag()
+                    out.write(start)
+                    stack.append(['map' if event == 'start_map' else 'array', end, None])
+                elif event in ('end_map', 'end_array'):
+                    out.write(stack.pop()[1])
+                else:
+                    start, end = open_tag()
+                    out.write(f'{start}{_xml_scalar_text(value)}{end}')
+            out.write('</root>')
 
         if os.path.exists(output_path):
             logging.info("JSON -> XML dönüştürme başarılı.")
@@ -587,23 +3768,169 @@ def convert_json_to_xml(input_path, output_folder):
         logging.error(traceback.format_exc())
         return None
 
-def convert_xml_to_json(input_path, output_folder):
+class _IrregularXml(Exception):
+    """Akan XML -> JSON dönüşümünün aynı çıktıyı üretemeyeceği belge yapısı"""
+
+class _RootTextGuard:
+    """
+    xmltodict.parse'a expat modülü yerine verilir ve oluşturulan ayrıştırıcının olaylarını izler.
+    item_depth=2 akışında kökün doğrudan içindeki metin ilk çocuğun metnine yapışır ya da kaybolur;
+    böyle bir metin görülünce _IrregularXml fırlatılır ve belge tamamen okunur.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, 'parser', None)
+        object.__setattr__(self, 'depth', 0)
+
+    def ParserCreate(self, *args):
+        from xml.parsers import expat
+        object.__setattr__(self, 'parser', expat.ParserCreate(*args))
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self.parser, name)
+
+    def __setattr__(self, name, value):
+        if name == 'StartElementHandler':
+            value = self._on_start(value)
+        elif name == 'EndElementHandler':
+            value = self._on_end(value)
+        elif name == 'CharacterDataHandler':
+            value = self._on_characters(value)
+        setattr(self.parser, name, value)
+
+    def _on_start(self, handler):
+        def start(*args):
+            object.__setattr__(self, 'depth', self.depth + 1)
+            handler(*args)
+        return start
+
+    def _on_end(self, handler):
+        def end(*args):
+            handler(*args)
+            object.__setattr__(self, 'depth', self.depth - 1)
+        return end
+
+    def _on_characters(self, handler):
+        def characters(data):
+            if self.depth == 1:
+                if data.strip():
+                    raise _IrregularXml()
+                return  # Kökteki girinti boşlukları da çocuğun metnine yapışmasın
+            handler(data)
+        return characters
+
+def _write_json_value(out, value, indent, level):
+    """Tek bir değeri, içinde bulunduğu seviyenin girintisiyle yaz"""
+    if indent:
+        text = json.dumps(value, indent=indent)
+        out.write(text.replace('\n', '\n' + ' ' * indent * level))
+    else:
+        out.write(json.dumps(value, separators=(',', ':')))
+
+def _stream_xml_to_json(source, out, indent):
+    """
+    Kök elemanın çocuklarını xmltodict'in item_depth=2 akışıyla tek tek okuyup yazar.
+    Aynı adlı ardışık elemanlar xmltodict'teki gibi listeye toplanır; bunun için yalnızca
+    bir önceki eleman bellekte tutulur. Aynı ad ardışık olmayan yerlerde tekrar ederse,
+    kökün doğrudan içinde metin varsa veya kökün hiç çocuğu yoksa _IrregularXml fırlatır.
+    """
+    import xmltodict
+    newline = '\n' if indent else ''
+    pad = lambda level: ' ' * (indent * level)  # noqa: E731
+    colon = ': ' if indent else ':'
+    state = {'root': None, 'tag': None, 'pending': None, 'in_list': False, 'seen': set(), 'first': True}
+
+    def write_key(level, key):
+        out.write(('' if state['first'] else ',') + newline + pad(level) + json.dumps(key) + colon)
+        state['first'] = False
+
+    def flush(final=False):
+        # Bekleyen elemanı, listenin devamı mı yoksa tek değer mi olduğu belli olunca yaz
+        if state['pending'] is None:
+            return
+        _, item = state['pending']
+        if state['in_list']:
+            out.write(',' + newline + pad(3))
+            _write_json_value(out, item, indent, 3)
+            if final:
+                out.write(newline + pad(2) + ']')
+        else:
+            _write_json_value(out, item, indent, 2)
+        state['pending'] = None
+
+    def on_item(path, item):
+        (root_name, root_attrs), (tag, attrs) = path[0], path[-1]
+        if isinstance(item, str):
+            item = item.strip() or None  # xmltodict'in tam okumada yaptığı gibi
+        if attrs:
+            # Akış modunda xmltodict elemanın özniteliklerini yalnızca path'te verir
+            with_attrs = {f'@{name}': value for name, value in attrs.items()}
+            if isinstance(item, dict):
+                with_attrs.update(item)
+            elif item is not None:
+                with_attrs['#text'] = item
+            item = with_attrs
+        if state['root'] is None:
+            state['root'] = root_name
+            out.write('{' + newline + pad(1) + json.dumps(root_name) + colon + '{')
+            for attr, attr_value in (root_attrs or {}).items():
+                write_key(2, f'@{attr}')
+                out.write(json.dumps(attr_value))
+        if tag == state['tag']:
+            # Aynı ad tekrar etti: listeye çevir veya listeye ekle
+            if not state['in_list']:
+                out.write('[' + newline + pad(3))
+                _write_json_value(out, state['pending'][1], indent, 3)
+                state['in_list'] = True
+                state['pending'] = None
+            else:
+                flush()
+        else:
+            if state['in_list']:
+                flush(final=True)
+            else:
+                flush()
+            if tag in state['seen']:
+                raise _IrregularXml()
+            state['seen'].add(tag)
+            state['tag'], state['in_list'] = tag, False
+            write_key(2, tag)
+        state['pending'] = (tag, item)
+        return True
+
+    xmltodict.parse(source, expat=_RootTextGuard(), item_depth=2, item_callback=on_item)
+    if state['root'] is None:
+        raise _IrregularXml()  # Çocuksuz kök; tek değerli küçük belge
+    flush(final=True)
+    out.write(newline + pad(1) + '}' + newline + '}')
+
+def convert_xml_to_json(input_path, output_folder, indent=None):
     """
     XML dosyasını JSON dosyasına dönüştürür.
+    Kökün çocukları okundukça yazılır, bellek kullanımı en büyük tek kayıtla sınırlıdır.
+    Alışılmadık yapıdaki belgeler (aynı etiketin dağınık tekrarı, kökte metin, çocuksuz kök) için
+    tüm belge xmltodict ile okunur. indent (0-8, varsayılan 4) 0 verilirse sıkışık JSON yazılır.
     Gerekli Kütüphane: pip install xmltodict
     """
+    indent = parse_int_option(indent, 'Girinti', 4, 0, 8)
     try:
-        import json
         import xmltodict
         output_path = os.path.join(output_folder, os.path.basename(input_path).replace(".xml", ".json"))
 
-        with open(input_path, 'r', encoding='utf-8') as f:
-            xml_content = f.read()
-            
-        data_dict = xmltodict.parse(xml_content)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data_dict, f, indent=4)
+        try:
+            with open(input_path, 'rb') as source, \
+                    open(output_path, 'w', encoding='utf-8', buffering=DATA_STREAM_BUFFER_SIZE) as out:
+                _stream_xml_to_json(source, out, indent)
+        except _IrregularXml:
+            logging.info("XML yapısı akan dönüşüme uygun değil, belge tamamen okunuyor.")
+            with open(input_path, 'rb') as source:
+                data_dict = xmltodict.parse(source)
+            with open(output_path, 'w', encoding='utf-8', buffering=DATA_STREAM_BUFFER_SIZE) as out:
+                if indent:
+                    json.dump(data_dict, out, indent=indent)
+                else:
+                    json.dump(data_dict, out, separators=(',', ':'))
 
         if os.path.exists(output_path):
             logging.info("XML -> JSON dönüştürme başarılı.")
@@ -615,56 +3942,368 @@ def convert_xml_to_json(input_path, output_folder):
         logging.error(traceback.format_exc())
         return None
 
+# --- Tablo Verisi Dönüştürücüleri (CSV / XLSX / JSON / Parquet) ---
+# Tablolar TABULAR_CHUNK_ROWS satırlık parçalar halinde okunup yazılır, bellek kullanımı dosya
+# boyutundan bağımsızdır. Sütun tipleri ilk parçadan bir kez çıkarılır ve tüm parçalara uygulanır;
+# böylece parçalar arasında tip kayması olmaz. pyarrow kuruluysa CSV <-> Parquet doğrudan Arrow ile yapılır.
+
+XLSX_MAX_ROWS = 1048576  # Excel sayfa başına satır sınırı (başlık dahil)
+
+class _TableSchemaMismatch(Exception):
+    """İlk parçadan çıkarılan sütun tipleri sonraki bir parçaya uymadı; columns: {sütun: genişletilmiş tip}"""
+    def __init__(self, columns):
+        super().__init__(', '.join(f"{column} -> {dtype}" for column, dtype in columns.items()))
+        self.columns = columns
+
+def _nullable_dtype(dtype):
+    """Çıkarılan sütun tipini, eksik değerlere izin veren pandas tipine çevir"""
+    import pandas as pd
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'boolean'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'Int64'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'float64'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return dtype
+    return 'string'
+
+def _unique_columns(names):
+    """Boş ve tekrar eden sütun adlarını düzelt"""
+    columns, seen = [], {}
+    for index, name in enumerate(names):
+        name = str(name) if name not in (None, '') else f"Sütun{index + 1}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+def _widen_dtype(dtype, series):
+    """Parçaya uymayan sütun tipini genişlet: tam sayı ondalığa, diğerleri metne"""
+    if dtype == 'Int64':
+        try:
+            series.astype('float64')
+            return 'float64'
+        except (ValueError, TypeError):
+            pass
+    return 'string'
+
+def _apply_schema(frames, overrides, schema=None):
+    """
+    DataFrame parçalarına ilk parçadan çıkarılan (veya verilen) şemayı uygula; overrides'taki
+    sütun tipleri çıkarılanın yerine geçer. Uymayan sütunlar _TableSchemaMismatch ile bildirilir.
+    """
+    for frame in frames:
+        if schema is None:
+            schema = {column: _nullable_dtype(dtype) for column, dtype in frame.convert_dtypes().dtypes.items()}
+            schema.update(overrides)
+        try:
+            yield frame.astype(schema)
+        except (ValueError, TypeError):
+            widened = {}
+            for column, dtype in schema.items():
+                try:
+                    frame[column].astype(dtype)
+                except (ValueError, TypeError):
+                    widened[column] = _widen_dtype(dtype, frame[column])
+            raise _TableSchemaMismatch(widened)
+
+def _iter_csv_chunks(input_path, chunk_rows, overrides):
+    import pandas as pd
+    encoding = text_file_encoding(input_path)
+    # Tipler yalnızca ilk parçadan çıkarılır; metin sütunları metin olarak okunur (baştaki sıfırlar
+    # kaybolmasın), diğerleri her parçada çıkarılıp şemaya çevrilir
+    sample = pd.read_csv(input_path, nrows=chunk_rows, encoding=encoding)
+    schema = {column: _nullable_dtype(dtype) for column, dtype in sample.dtypes.items()}
+    schema.update(overrides)
+    text_columns = {column: 'string' for column, dtype in schema.items() if dtype == 'string'}
+    with pd.read_csv(input_path, chunksize=chunk_rows, dtype=text_columns or None, encoding=encoding) as reader:
+        yield from _apply_schema(reader, overrides, schema)
+
+def _iter_xlsx_chunks(input_path, chunk_rows, overrides):
+    import pandas as pd
+    from openpyxl import load_workbook
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _unique_columns(header)
+
+        def frames():
+            batch = []
+            for row in rows:
+                # read_only modunda satır sonundaki boş hücreler gelmeyebilir
+                batch.append(row[:len(columns)] + (None,) * (len(columns) - len(row)))
+                if len(batch) >= chunk_rows:
+                    yield pd.DataFrame.from_records(batch, columns=columns)
+                    batch = []
+            if batch:
+                yield pd.DataFrame.from_records(batch, columns=columns)
+
+        yield from _apply_schema(frames(), overrides)
+    finally:
+        workbook.close()
+
+def _iter_json_records(input_path):
+    """JSON dizisi ([{...}, ...]) veya JSON Lines dosyasındaki kayıtları tek tek üret"""
+    import ijson
+    with open_text_source(input_path) as f:
+        first = f.read(1024).lstrip()[:1]
+        f.seek(0)
+        if first == b'[':
+            yield from ijson.items(f, 'item', use_float=True)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def _iter_json_chunks(input_path, chunk_rows, overrides):
+    import pandas as pd
+    # Kayıtlar farklı alanlara sahip olabilir; sütunlar dosya bir kez taranarak belirlenir
+    columns = {}
+    for record in _iter_json_records(input_path):
+        if not isinstance(record, dict):
+            raise ValueError("JSON dosyası kayıt (nesne) listesi olmalıdır.")
+        columns.update(dict.fromkeys(record))
+    columns = list(columns)
+
+    def frames():
+        batch = []
+        for record in _iter_json_records(input_path):
+            batch.append(record)
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame.from_records(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame.from_records(batch, columns=columns)
+
+    yield from _apply_schema(frames(), overrides)
+
+def _iter_parquet_chunks(input_path, chunk_rows, overrides):
+    import pyarrow.parquet as pq
+    # Parquet şemayı dosyada taşır, tip çıkarımı ve kayması olmaz
+    parquet_file = pq.ParquetFile(input_path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+        yield batch.to_pandas()
+
+TABLE_READERS = {
+    'csv': _iter_csv_chunks,
+    'xlsx': _iter_xlsx_chunks,
+    'json': _iter_json_chunks,
+    'parquet': _iter_parquet_chunks,
+}
+
+class _CsvTableWriter:
+    def __init__(self, output_path):
+        self.file = open(output_path, 'w', encoding='utf-8', newline='', buffering=DATA_STREAM_BUFFER_SIZE)
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.file, index=False, header=self.header)
+        self.header = False
+
+    def close(self):
+        self.file.close()
+
+class _XlsxTableWriter:
+    def __init__(self, output_path):
+        from openpyxl import Workbook
+        self.output_path = output_path
+        # write_only modunda satırlar belleğe değil geçici dosyaya yazılır
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        self.rows = 0
+
+    def write(self, frame):
+        if self.rows == 0:
+            self.sheet.append(list(frame.columns))
+            self.rows = 1
+        self.rows += len(frame)
+        if self.rows > XLSX_MAX_ROWS:
+            raise ValueError(f"Excel sayfası en fazla {XLSX_MAX_ROWS - 1} satır alabilir. CSV veya Parquet formatını deneyin.")
+        for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None):
+            self.sheet.append(row)
+
+    def close(self):
+        self.workbook.save(self.output_path)
+
+class _JsonTableWriter:
+    def __init__(self, output_path):
+        self.file = open(output_path, 'w', encoding='utf-8', buffering=DATA_STREAM_BUFFER_SIZE)
+        self.file.write('[')
+        self.first = True
+
+    def write(self, frame):
+        records = frame.to_json(orient='records', date_format='iso', force_ascii=False, double_precision=15)[1:-1]
+        if records:
+            self.file.write(records if self.first else ',' + records)
+            self.first = False
+
+    def close(self):
+        self.file.write(']')
+        self.file.close()
+
+class _ParquetTableWriter:
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.writer = None
+        self.schema = None
+
+    def write(self, frame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self.writer is None:
+            self.schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            self.writer = pq.ParquetWriter(self.output_path, self.schema)
+        self.writer.write_table(pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+TABLE_WRITERS = {
+    'csv': _CsvTableWriter,
+    'xlsx': _XlsxTableWriter,
+    'json': _JsonTableWriter,
+    'parquet': _ParquetTableWriter,
+}
+
+def _convert_table_with_arrow(input_path, output_path, source_format, target_format):
+    """CSV <-> Parquet için pandas'a uğramadan Arrow kayıt grupları ile dönüştür"""
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    if source_format == 'csv':
+        # open_csv tipleri ilk bloktan çıkarır ve dosyayı blok blok okur
+        reader = pa_csv.open_csv(input_path, read_options=pa_csv.ReadOptions(block_size=DATA_STREAM_BUFFER_SIZE * 8))
+        with pq.ParquetWriter(output_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    else:
+        parquet_file = pq.ParquetFile(input_path)
+        with pa_csv.CSVWriter(output_path, parquet_file.schema_arrow) as writer:
+            for batch in parquet_file.iter_batches(batch_size=app.config['TABULAR_CHUNK_ROWS']):
+                writer.write_batch(batch)
+
+def convert_table(input_path, output_folder, source_format, target_format):
+    """
+    Tablo verisini CSV, XLSX, JSON (kayıt listesi veya JSON Lines) ve Parquet arasında dönüştürür.
+    Gerekli Kütüphaneler: pip install pandas openpyxl ijson (Parquet için: pip install pyarrow)
+    """
+    try:
+        output_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + f".{target_format}")
+        chunk_rows = app.config['TABULAR_CHUNK_ROWS']
+
+        if {source_format, target_format} == {'csv', 'parquet'}:
+            try:
+                _convert_table_with_arrow(input_path, output_path, source_format, target_format)
+                logging.info(f"{source_format.upper()} -> {target_format.upper()} dönüştürme başarılı (Arrow).")
+                return output_path
+            except Exception as e:
+                # Örn. ilk bloktan çıkarılan tip sonraki blokta tutmadı; pandas yoluna düş
+                logging.info(f"Arrow ile dönüştürülemedi, pandas ile devam ediliyor: {e}")
+
+        # Tipi dosyanın ilerisinde tutmayan sütunlar genişletilir (Int64 -> float64 -> metin) ve
+        # yazılan parçaların tipi değiştiği için dosya baştan okunur; diğer sütunların tipi korunur
+        overrides = {}
+        while True:
+            writer = TABLE_WRITERS[target_format](output_path)
+            try:
+                for frame in TABLE_READERS[source_format](input_path, chunk_rows, overrides):
+                    raise_if_job_cancelled(output_folder)
+                    writer.write(frame)
+                break
+            except _TableSchemaMismatch as e:
+                if all(overrides.get(column) == dtype for column, dtype in e.columns.items()):
+                    raise
+                logging.info(f"Sütun tipleri dosya boyunca tutarlı değil ({e}), bu sütunlar genişletilerek yeniden okunuyor.")
+                overrides.update(e.columns)
+            finally:
+                writer.close()
+
+        if os.path.exists(output_path):
+            logging.info(f"{source_format.upper()} -> {target_format.upper()} dönüştürme başarılı.")
+            return output_path
+        raise Exception("Dönüştürme sonrası çıktı dosyası bulunamadı.")
+    except UnicodeDecodeError:
+        raise ValueError("Dosya UTF-8 ile kodlanmış olmalıdır.")
+    except (ValueError, JobCancelled):
+        raise
+    except Exception as e:
+        logging.error(f"Tablo dönüştürme hatası: {e}")
+        import traceback
+        logging.error(traceback.format_exc())
+        return None
+
+def convert_csv_to_xlsx(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'csv', 'xlsx')
+
+def convert_xlsx_to_csv(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'xlsx', 'csv')
+
+def convert_csv_to_json(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'csv', 'json')
+
+def convert_json_to_csv(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'json', 'csv')
+
+def convert_xlsx_to_json(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'xlsx', 'json')
+
+def convert_csv_to_parquet(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'csv', 'parquet')
+
+def convert_parquet_to_csv(input_path, output_folder):
+    return convert_table(input_path, output_folder, 'parquet', 'csv')
+
 def convert_rar_to_zip(input_path, output_folder):
     """
-    RAR arşivini ZIP formatına dönüştürür.
+    RAR arşivini ZIP formatına dönüştürür. Arşivdeki dosyalar geçici bir klasöre
+    çıkarılmadan doğrudan ZIP'e akıtılır.
+    Gerekli Kütüphane: pip install rarfile
     Sistemde 'unrar' komutunun yüklü olmasını gerektirir.
     """
+    try:
+        import rarfile
+    except ImportError:
+        logging.error("RAR dönüştürme hatası: 'rarfile' kütüphanesi yüklü değil.")
+        return None
+
     try:
         # Çıktı için ZIP dosyasının yolu
         output_zip_path = os.path.join(output_folder, os.path.basename(input_path).rsplit('.', 1)[0] + '.zip')
-        
-        # RAR dosyasını geçici bir klasöre çıkar
-        temp_extract_folder = os.path.join(output_folder, 'temp_unrar')
-        os.makedirs(temp_extract_folder, exist_ok=True)
-        
-        # unrar komutunu çalıştır
-        # Not: Bu komutun sistemde PATH içinde olması gerekir.
+
+        # Not: unrar komutunun sistemde PATH içinde olması gerekir.
         # Windows için: https://www.rarlab.com/rar/unrarw32.exe
         # Linux için: sudo apt-get install unrar
-        cmd = ['unrar', 'x', '-o+', input_path, temp_extract_folder]
-        
-        # subprocess.run daha modern bir yaklaşımdır
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        logging.info(f"unrar çıktısı: {result.stdout}")
-
-        # Çıkarılan dosyaları ZIP'le
-        with zipfile.ZipFile(output_zip_path, 'w') as zipf:
-            for root, _, files in os.walk(temp_extract_folder):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, temp_extract_folder)
-                    zipf.write(file_path, arcname)
-
-        # Geçici klasörü temizle
-        shutil.rmtree(temp_extract_folder)
+        with rarfile.RarFile(input_path) as rf:
+            entries = [
+                (info.filename, lambda info=info: rf.open(info))
+                for info in rf.infolist() if not info.is_dir()
+            ]
+            write_zip_file(output_zip_path, entries)
 
+        logging.info(f"RAR -> ZIP dönüştürme başarılı: {len(entries)} dosya")
         return output_zip_path
-    except FileNotFoundError:
+    except rarfile.RarCannotExec:
         logging.error("RAR dönüştürme hatası: 'unrar' programı sisteminizde bulunamadı veya PATH içinde değil.")
         raise RuntimeError("Sistemde 'unrar' programı bulunamadığı için RAR dosyaları dönüştürülemiyor.")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"unrar çalıştırılırken hata: {e.stderr}")
-        raise RuntimeError(f"RAR dosyası işlenirken hata oluştu: {e.stderr}")
+    except rarfile.Error as e:
+        logging.error(f"unrar çalıştırılırken hata: {e}")
+        raise RuntimeError(f"RAR dosyası işlenirken hata oluştu: {e}")
     except Exception as e:
         logging.error(f"RAR'dan ZIP'e dönüştürme sırasında genel hata: {e}")
         import traceback
         logging.error(traceback.format_exc())
         return None
 
-def convert_wav_to_mp3(input_path, output_folder):
+def convert_wav_to_mp3(input_path, output_folder, **options):
     """WAV'ı MP3'e dönüştürür."""
-    return convert_audio(input_path, output_folder, "mp3")
+    return convert_audio(input_path, output_folder, "mp3", **options)
 
 def convert_mp4_to_avi(input_path, output_folder):
     return convert_video(input_path, output_folder, 'avi')
@@ -676,11 +4315,12 @@ def handle_youtube_download(form_data, output_folder):
     if not youtube_url:
         raise ValueError("YouTube URL'si sağlanmadı.")
 
+    import yt_dlp
     ydl_opts = {
         'format': 'bestaudio/best',
         'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': '192'}],
         'outtmpl': os.path.join(output_folder, '%(title)s.%(ext)s'),
-        'ffmpeg_location': ffmpeg_path
+        'ffmpeg_location': find_ffmpeg()
     }
 
     try:
@@ -712,79 +4352,166 @@ CONVERTERS = {
         'display_name': "Word'den PDF'e (.docx → .pdf)",
         'function': convert_word_to_pdf,
         'allowed_extensions': {'docx'},
-        'output_format': 'pdf'
+        'output_format': 'pdf',
+        # LibreOffice havuzu web process'inde yaşar; COM ve docx2pdf process havuzunda çalışır
+        'pool': document_renderer.pool_group if document_renderer else 'office'
     },
     'pdf-to-word': {
         'display_name': "PDF'ten Word'e (.pdf → .docx)",
         'function': convert_pdf_to_word,
         'allowed_extensions': {'pdf'},
-        'output_format': 'docx'
+        'output_format': 'docx',
+        'pool': 'pdf',
+        'requires': ('pdf2docx', 'fitz'),
+        'options': [
+            {'name': 'pages', 'label': 'Sayfa Aralığı', 'placeholder': 'Tümü (örn: 1-3,5)'}
+        ]
     },
     'word-to-txt': {
         'display_name': "Word'den Metine (.docx → .txt)",
         'function': convert_word_to_txt,
         'allowed_extensions': {'docx'},
-        'output_format': 'txt'
+        'output_format': 'txt',
+        'pool': 'document',
+        'requires': ('docx',)
     },
     'txt-to-word': {
         'display_name': "Metinden Word'e (.txt → .docx)",
         'function': convert_txt_to_word,
         'allowed_extensions': {'txt'},
-        'output_format': 'docx'
+        'output_format': 'docx',
+        'pool': 'document',
+        'requires': ('docx',)
     },
     'pdf-to-jpg': {
         'display_name': "PDF'ten JPG'ye (.pdf → .jpg/.zip)",
         'function': convert_pdf_to_jpg,
         'allowed_extensions': {'pdf'},
-        'output_format': 'zip' # Çoklu sayfalar için ZIP dönebilir
+        'output_format': 'zip', # Çoklu sayfalar için ZIP dönebilir
+        'produces': ('jpg', 'zip'), # Dönüşüm grafiğinde tek sayfalık JPG hedefi olarak da kullanılır
+        'pool': 'pdf',
+        'requires': ('fitz', 'PIL'),
+        'options': [
+            {'name': 'dpi', 'label': 'Çözünürlük (DPI)', 'placeholder': '72'},
+            {'name': 'quality', 'label': 'JPEG Kalitesi (1-100)', 'placeholder': '95'},
+            {'name': 'pages', 'label': 'Sayfa Aralığı', 'placeholder': 'Tümü (örn: 1-3,5)'}
+        ]
     },
     'jpg-to-pdf': {
         'display_name': "JPG'den PDF'e (.jpg → .pdf)",
         'function': convert_jpg_to_pdf,
         'allowed_extensions': {'jpg', 'jpeg'},
-        'output_format': 'pdf'
+        'output_format': 'pdf',
+        'pool': 'image',
+        'requires': ('PIL',),
+        'memory_step': _image_drop_alpha
     },
     'jpg-to-png': {
         'display_name': "JPG'den PNG'ye (.jpg → .png)",
         'function': convert_jpg_to_png,
         'allowed_extensions': {'jpg', 'jpeg'},
-        'output_format': 'png'
+        'output_format': 'png',
+        'pool': 'image',
+        'requires': ('PIL',),
+        'memory_step': _image_keep
     },
     'png-to-jpg': {
         'display_name': "PNG'den JPG'ye (.png → .jpg)",
         'function': convert_png_to_jpg,
         'allowed_extensions': {'png'},
-        'output_format': 'jpg'
+        'output_format': 'jpg',
+        'pool': 'image',
+        'requires': ('PIL',),
+        'memory_step': _image_to_rgb
     },
     'wav-to-mp3': {
         'display_name': "WAV'dan MP3'e (.wav → .mp3)",
         'function': convert_wav_to_mp3,
         'allowed_extensions': {'wav'},
-        'output_format': 'mp3'
+        'output_format': 'mp3',
+        'pool': 'audio',
+        'programs': ('ffmpeg',),
+        'options': [
+            {'name': 'bitrate', 'label': 'Bit Hızı (kbps)', 'placeholder': '192'},
+            {'name': 'sample_rate', 'label': 'Örnekleme Hızı (Hz)', 'placeholder': 'Kaynakla aynı'},
+            {'name': 'channels', 'label': 'Kanal Sayısı (1-2)', 'placeholder': 'Kaynakla aynı'}
+        ]
     },
     'mp4-to-avi': {
         'display_name': "MP4'ten AVI'ye (.mp4 → .avi)",
         'function': convert_mp4_to_avi,
         'allowed_extensions': {'mp4'},
-        'output_format': 'avi'
+        'output_format': 'avi',
+        'pool': 'video',
+        'programs': ('ffmpeg',)
     },
     'json-to-xml': {
         'display_name': "JSON'dan XML'e (.json → .xml)",
         'function': convert_json_to_xml,
         'allowed_extensions': {'json'},
-        'output_format': 'xml'
+        'output_format': 'xml',
+        'pool': 'data',
+        'requires': ('ijson',)
     },
     'xml-to-json': {
         'display_name': "XML'den JSON'a (.xml → .json)",
         'function': convert_xml_to_json,
         'allowed_extensions': {'xml'},
-        'output_format': 'json'
+        'output_format': 'json',
+        'pool': 'data',
+        'requires': ('xmltodict',),
+        'options': [
+            {'name': 'indent', 'label': 'Girinti (0 = sıkışık)', 'placeholder': '4'}
+        ]
+    },
+    'csv-to-xlsx': {
+        'display_name': "CSV'den Excel'e (.csv → .xlsx)",
+        'function': convert_csv_to_xlsx,
+        'allowed_extensions': {'csv'},
+        'output_format': 'xlsx',
+        'pool': 'data',
+        'requires': ('pandas', 'openpyxl')
+    },
+    'xlsx-to-csv': {
+        'display_name': "Excel'den CSV'ye (.xlsx → .csv)",
+        'function': convert_xlsx_to_csv,
+        'allowed_extensions': {'xlsx'},
+        'output_format': 'csv',
+        'pool': 'data',
+        'requires': ('pandas', 'openpyxl')
+    },
+    'csv-to-json': {
+        'display_name': "CSV'den JSON'a (.csv → .json)",
+        'function': convert_csv_to_json,
+        'allowed_extensions': {'csv'},
+        'output_format': 'json',
+        'pool': 'data',
+        'requires': ('pandas',)
+    },
+    'json-to-csv': {
+        'display_name': "JSON'dan CSV'ye (.json → .csv)",
+        'function': convert_json_to_csv,
+        'allowed_extensions': {'json'},
+        'output_format': 'csv',
+        'pool': 'data',
+        'requires': ('pandas', 'ijson')
+    },
+    'xlsx-to-json': {
+        'display_name': "Excel'den JSON'a (.xlsx → .json)",
+        'function': convert_xlsx_to_json,
+        'allowed_extensions': {'xlsx'},
+        'output_format': 'json',
+        'pool': 'data',
+        'requires': ('pandas', 'openpyxl')
     },
     'rar-to-zip': {
         'display_name': "RAR'dan ZIP'e",
         'allowed_extensions': ["rar"],
         'function': convert_rar_to_zip,
-        'output_format': 'zip'
+        'output_format': 'zip',
+        'pool': 'archive',
+        'requires': ('rarfile',),
+        'programs': ('unrar',)
     },
     # --- Çevrimiçi Medya İndiricileri ---
     "spotify-downloader": {
@@ -792,6 +4519,8 @@ CONVERTERS = {
         "is_online_service": True,
         # Bu fonksiyon doğrudan route üzerinden yönetiliyor, burada bir işlem yapmasına gerek yok.
         "function": None, 
+        "requires": ('yt_dlp', 'requests'),
+        "programs": ('ffmpeg',),
         "form_fields": [
             {"name": "spotify-links", "label": "Spotify Şarkı/Playlist Linkleri (her satıra bir tane)"}
         ]
@@ -800,57 +4529,457 @@ CONVERTERS = {
         "display_name": "YouTube'dan Ses İndir",
         "is_online_service": True,
         "function": handle_youtube_download,
+        # İndirme ve ffmpeg çıkarma, diğer dönüştürücüler gibi süre/bellek/çıktı sınırlarıyla izlenir
+        "pool": 'download',
+        "requires": ('yt_dlp',),
+        "programs": ('ffmpeg',),
         "form_fields": [
             {"name": "youtube_url", "label": "YouTube Video URL"}
         ]
     }
 }
 
-# Sadece Windows'ta çalışacak dönüştürücüleri ekle
-if platform.system() == "Windows":
-    try:
-        import win32com.client
-        logging.info("Windows algılandı. Office dönüştürücüleri ekleniyor.")
-        
-        CONVERTERS['excel-to-pdf'] = {
-            'display_name': "Excel'den PDF'e (.xlsx → .pdf)",
-            'function': convert_excel_to_pdf,
-            'allowed_extensions': {'xlsx'},
-            'output_format': 'pdf'
-        }
-        CONVERTERS['powerpoint-to-pdf'] = {
-            'display_name': "PowerPoint'ten PDF'e (.pptx → .pdf)",
-            'function': convert_powerpoint_to_pdf,
-            'allowed_extensions': {'pptx', 'ppt'},
-            'output_format': 'pdf'
-        }
-    except ImportError:
-        logging.warning("Windows algılandı ancak 'pypiwin32' kütüphanesi bulunamadı. Office dönüştürücüleri devre dışı bırakıldı.")
+# Ofis render arka ucu varsa (Windows'ta Office, Linux/macOS'ta LibreOffice) Excel/PowerPoint dönüştürücülerini ekle
+if document_renderer is not None:
+    logging.info(f"Ofis render arka ucu: {document_renderer.name}. Office dönüştürücüleri ekleniyor.")
+
+    CONVERTERS['excel-to-pdf'] = {
+        'display_name': "Excel'den PDF'e (.xlsx → .pdf)",
+        'function': convert_excel_to_pdf,
+        'allowed_extensions': {'xlsx'},
+        'output_format': 'pdf',
+        'pool': document_renderer.pool_group
+    }
+    CONVERTERS['powerpoint-to-pdf'] = {
+        'display_name': "PowerPoint'ten PDF'e (.pptx → .pdf)",
+        'function': convert_powerpoint_to_pdf,
+        'allowed_extensions': {'pptx', 'ppt'},
+        'output_format': 'pdf',
+        'pool': document_renderer.pool_group
+    }
+
+
+# pyarrow kuruluysa Parquet dönüştürücülerini ekle
+if importlib.util.find_spec('pyarrow') is not None:
+    CONVERTERS['csv-to-parquet'] = {
+        'display_name': "CSV'den Parquet'e (.csv → .parquet)",
+        'function': convert_csv_to_parquet,
+        'allowed_extensions': {'csv'},
+        'output_format': 'parquet',
+        'pool': 'data',
+        'requires': ('pyarrow',)
+    }
+    CONVERTERS['parquet-to-csv'] = {
+        'display_name': "Parquet'ten CSV'ye (.parquet → .csv)",
+        'function': convert_parquet_to_csv,
+        'allowed_extensions': {'parquet'},
+        'output_format': 'csv',
+        'pool': 'data',
+        'requires': ('pyarrow',)
+    }
+else:
+    logging.info("pyarrow bulunamadı. Parquet dönüştürücüleri devre dışı.")
+
+# --- DÖNÜŞTÜRÜCÜ KAYDI (TEMBEL YÜKLEME) ---
+
+# Dönüştürücülerin 'programs' alanındaki sistem programları; ilk sorguda aranır
+PROGRAM_PROBES = {
+    'ffmpeg': find_ffmpeg,
+    'unrar': lambda: shutil.which('unrar'),
+}
+
+class ConverterUnavailable(RuntimeError):
+    """Dönüştürücünün kütüphanesi veya sistem programı kurulu olmadığında fırlatılır"""
+
+class ConverterRegistry:
+    """
+    CONVERTERS kayıtlarının ağır kütüphanelerini ('requires') ve sistem programı kontrollerini
+    ('programs') ilk kullanıma kadar erteler. Uygulama import edilirken hiçbir dönüştürücü
+    kütüphanesi yüklenmez: uygunluk importlib.util.find_spec ile import etmeden kontrol edilir,
+    kütüphaneler dönüştürücünün çalıştığı process'te ilk kullanımda ya da warm_up() ile yüklenir.
+    """
+    def __init__(self, converters):
+        self.converters = converters
+        self.lock = threading.Lock()
+        self.missing = {}        # conversion_type -> eksik bileşenler (ilk sorguda hesaplanır)
+        self.import_costs = {}   # conversion_type -> temiz process'te import süresi (ms)
+        self.import_costs_measured_at = None
+        self.measuring = False   # Arka planda süren bir import ölçümü var mı
+        self.warmed_modules = {} # modül -> bu process'te yüklenme süresi (ms)
+
+    def missing_requirements(self, conversion_type):
+        """Dönüştürücünün eksik kütüphane ve programlarını döndür (hiçbir şey import edilmez)"""
+        with self.lock:
+            if conversion_type in self.missing:
+                return self.missing[conversion_type]
+        info = self.converters[conversion_type]
+        missing = [module for module in info.get('requires', ()) if importlib.util.find_spec(module) is None]
+        missing += [program for program in info.get('programs', ()) if not PROGRAM_PROBES[program]()]
+        with self.lock:
+            self.missing[conversion_type] = missing
+        return missing
+
+    def require(self, conversion_type):
+        """Eksik bileşen varsa dönüştürücüyü çalıştırmadan anlaşılır bir hata fırlat"""
+        missing = self.missing_requirements(conversion_type)
+        if missing:
+            raise ConverterUnavailable(f"Bu dönüştürme için sunucuda gerekli bileşenler kurulu değil: {', '.join(missing)}")
+
+    def select(self, names):
+        """'all', havuz grubu ya da dönüştürme türü adlarından oluşan listeye uyan kayıtları döndür"""
+        names = {name.strip() for name in names if name.strip()}
+        return [(conversion_type, info) for conversion_type, info in self.converters.items()
+                if 'all' in names or conversion_type in names or info.get('pool') in names]
+
+    def warm_up(self, names, pooled):
+        """
+        Seçilen dönüştürücülerin kütüphanelerini şimdi import et. pooled=True process havuzunda
+        çalışanları (havuz process'i başlarken), False web process'inde çalışanları yükler.
+        """
+        for conversion_type, info in self.select(names):
+            if bool(info.get('pool')) != pooled:
+                continue
+            for module in info.get('requires', ()):
+                if module in sys.modules:
+                    continue
+                started = time.perf_counter()
+                try:
+                    importlib.import_module(module)
+                except ImportError as e:
+                    logging.warning(f"Dönüştürücü ısındırılamadı ({conversion_type}): {e}")
+                    continue
+                self.warmed_modules[module] = round((time.perf_counter() - started) * 1000, 1)
+        return dict(self.warmed_modules)
+
+    def measure_import_costs(self):
+        """
+        Her dönüştürücünün kütüphanelerini temiz bir Python process'inde import ederek ilk kullanım
+        maliyetini ölç (ms). Bu process'te zaten yüklü modüller sonucu etkilemez.
+        """
+        costs = {}
+        for conversion_type, info in self.converters.items():
+            modules = list(info.get('requires', ()))
+            if not modules or self.missing_requirements(conversion_type):
+                continue
+            code = ("import importlib, time\n"
+                    "started = time.perf_counter()\n"
+                    f"for module in {modules!r}: importlib.import_module(module)\n"
+                    "print((time.perf_counter() - started) * 1000)")
+            try:
+                result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=120)
+                costs[conversion_type] = round(float(result.stdout.strip()), 1) if result.returncode == 0 else None
+            except (subprocess.TimeoutExpired, ValueError, OSError):
+                costs[conversion_type] = None
+        with self.lock:
+            self.import_costs = costs
+            self.import_costs_measured_at = datetime.now().isoformat()
+        return costs
+
+    def start_import_measurement(self):
+        """
+        measure_import_costs'u arka plan thread'inde başlat; her dönüştürücü için yeni bir Python
+        process'i açıldığı için isteği bekletmez. Süren bir ölçüm varsa yenisi başlatılmaz, False döner.
+        """
+        with self.lock:
+            if self.measuring:
+                return False
+            self.measuring = True
+
+        def measure():
+            try:
+                log_converter_import_costs()
+            finally:
+                with self.lock:
+                    self.measuring = False
+        threading.Thread(target=measure, name='import-report', daemon=True).start()
+        return True
+
+    def get_stats(self):
+        """Dönüştürücü bazında uygunluk, eksik bileşenler ve ölçülen import maliyetleri"""
+        converters = {}
+        for conversion_type in self.converters:
+            missing = self.missing_requirements(conversion_type)
+            converters[conversion_type] = {
+                'available': not missing,
+                'missing': missing,
+                'import_ms': self.import_costs.get(conversion_type)
+            }
+        return {'converters': converters, 'warmed_modules': dict(self.warmed_modules),
+                'import_costs_measured_at': self.import_costs_measured_at, 'measuring': self.measuring}
+
+converter_registry = ConverterRegistry(CONVERTERS)
+
+def warm_up_converter_process():
+    """Dönüştürücü process'i başlarken CONVERTER_WARMUP'taki kütüphaneleri önceden yükle"""
+    if app.config['CONVERTER_WARMUP']:
+        converter_registry.warm_up(app.config['CONVERTER_WARMUP'].split(','), pooled=True)
+
+def log_converter_import_costs():
+    """Dönüştürücü başına import maliyetini ölçüp logla (CONVERTER_IMPORT_REPORT)"""
+    costs = converter_registry.measure_import_costs()
+    for conversion_type, cost in sorted(costs.items(), key=lambda item: -(item[1] or 0)):
+        logging.info(f"Dönüştürücü import maliyeti: {conversion_type} = "
+                     f"{'ölçülemedi' if cost is None else f'{cost:.1f} ms'}")
+
+# --- DÖNÜŞÜM GRAFİĞİ (ÇOK ADIMLI DÖNÜŞÜMLER) ---
+
+class ConversionGraph:
+    """
+    CONVERTERS kayıtlarından formatlar arası yönlü bir grafik kurar (allowed_extensions → output_format)
+    ve iki format arasındaki en az adımlı dönüştürücü zincirini planlar (örn: DOCX → PDF → JPG).
+    Çevrimiçi servisler grafiğe girmez. Kaydın 'produces' alanı varsa output_format yerine kullanılır.
+    """
+    FORMAT_ALIASES = {'jpeg': 'jpg'}
+
+    def __init__(self, converters, max_steps):
+        self.max_steps = max_steps
+        self.edges = {}
+        for conversion_type, info in converters.items():
+            if info.get('is_online_service') or not info.get('function'):
+                continue
+            for extension in info['allowed_extensions']:
+                for target in info.get('produces', (info['output_format'],)):
+                    self.edges.setdefault(extension, []).append((target, conversion_type))
+
+    def normalize(self, file_format):
+        file_format = (file_format or '').strip().lower().lstrip('.')
+        return self.FORMAT_ALIASES.get(file_format, file_format)
+
+    def plan(self, source_format, target_format):
+        """En az adımlı dönüştürücü listesini döndür; yol yoksa ya da max_steps'i aşıyorsa None"""
+        source_format = (source_format or '').strip().lower().lstrip('.')
+        target_format = self.normalize(target_format)
+        if self.normalize(source_format) == target_format:
+            return None
+        # Genişlik öncelikli arama: ilk ulaşılan yol en az adımlı yoldur
+        previous = {source_format: None}
+        frontier = [source_format]
+        for _ in range(self.max_steps):
+            next_frontier = []
+            for file_format in frontier:
+                for target, conversion_type in self.edges.get(file_format, ()):
+                    if target in previous:
+                        continue
+                    previous[target] = (file_format, conversion_type)
+                    if target == target_format:
+                        steps = []
+                        while previous[target]:
+                            target, conversion_type = previous[target]
+                            steps.append(conversion_type)
+                        return steps[::-1]
+                    next_frontier.append(target)
+            frontier = next_frontier
+        return None
+
+    def reachable_formats(self, source_format):
+        """Kaynak formattan max_steps içinde ulaşılabilen hedef formatlar"""
+        source_format = (source_format or '').strip().lower().lstrip('.')
+        seen = {source_format}
+        frontier = [source_format]
+        for _ in range(self.max_steps):
+            next_frontier = []
+            for file_format in frontier:
+                for target, _ in self.edges.get(file_format, ()):
+                    if target not in seen:
+                        seen.add(target)
+                        next_frontier.append(target)
+            frontier = next_frontier
+        seen.discard(source_format)
+        return sorted(seen)
 
+conversion_graph = ConversionGraph(CONVERTERS, app.config['PIPELINE_MAX_STEPS'])
 
 # --- Spotify İndirme Durum Takibi ---
 # Her session_id için ayrı bir durum ve dosya listesi tutulur
 # Spotify sessions artık SessionManager tarafından yönetiliyor
 
+# --- Spotify İndirme Hattı (Pipeline) ---
+# Her şarkı; bilgi çekme -> YouTube arama -> indirme -> MP3'e dönüştürme aşamalarından geçer.
+# Şarkılar paralel ilerler ama her aşamanın kendi eşzamanlılık limiti vardır; dış servislere
+# yapılan istekler sabit bekleme yerine token bucket ile hız sınırlanır.
+
+class TokenBucket:
+    """Saniyede 'rate' jeton üreten, en fazla 'capacity' jeton biriktiren hız sınırlayıcı"""
+    def __init__(self, rate, capacity):
+        self.rate = max(rate, 0.01)
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Bir jeton alınana kadar bekle"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+class SpotifyPipeline:
+    """Şarkı bazlı indirme hattı: aşama limitleri, hız sınırlayıcılar ve şarkı thread havuzu"""
+    STAGES = ('metadata', 'search', 'download', 'transcode')
+
+    def __init__(self, stage_limits, spotify_rate, youtube_rate):
+        limits = {stage: stage_limits.get(stage, 2) for stage in self.STAGES}
+        self.semaphores = {stage: threading.BoundedSemaphore(limit) for stage, limit in limits.items()}
+        self.rate_limiters = {
+            'spotify': TokenBucket(spotify_rate, max(1, int(spotify_rate * 2))),
+            'youtube': TokenBucket(youtube_rate, max(1, int(youtube_rate * 2)))
+        }
+        # Her aşama dolu olabilsin diye thread sayısı limitlerin toplamı kadar
+        self.track_executor = ThreadPoolExecutor(max_workers=sum(limits.values()), thread_name_prefix='spotify-track')
+
+    @contextmanager
+    def stage(self, name, service=None):
+        """Aşamanın eşzamanlılık limiti içinde çalış; service verilirse önce hız sınırına uy"""
+        with self.semaphores[name]:
+            if service:
+                self.rate_limiters[service].acquire()
+            yield
+
+    def shutdown(self):
+        self.track_executor.shutdown(wait=False)
+
+# Global Spotify indirme hattı
+spotify_pipeline = SpotifyPipeline(
+    parse_concurrency_limits(app.config['SPOTIFY_STAGE_LIMITS']),
+    app.config['SPOTIFY_REQUESTS_PER_SECOND'],
+    app.config['YOUTUBE_REQUESTS_PER_SECOND']
+)
+
+# --- Spotify Şarkı Bilgisi (HTTP havuzu ve önbellek) ---
+
+SPOTIFY_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+META_READ_CHUNK_SIZE = 16 * 1024
+META_MAX_BYTES = 512 * 1024  # <head> bu boyutta bitmezse ayrıştırmayı bırak
+META_DRAIN_MAX_BYTES = 4 * 1024 * 1024  # Bağlantıyı havuza döndürmek için en fazla bu kadar okunur
+
+_http_session_state = {'session': None, 'pid': None}
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """
+    Bağlantı havuzlu, process başına tek bir requests.Session döndürür.
+    Aynı sunucuya giden istekler TCP/TLS bağlantısını yeniden kullanır.
+    """
+    with _http_session_lock:
+        # Fork sonrası ebeveynin soketleri paylaşılmasın diye her process kendi oturumunu açar
+        if _http_session_state['session'] is None or _http_session_state['pid'] != os.getpid():
+            import requests
+            from requests.adapters import HTTPAdapter
+            http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=app.config['HTTP_POOL_SIZE'], max_retries=2)
+            http_session.mount('https://', adapter)
+            http_session.mount('http://', adapter)
+            http_session.headers['User-Agent'] = SPOTIFY_USER_AGENT
+            _http_session_state['session'] = http_session
+            _http_session_state['pid'] = os.getpid()
+        return _http_session_state['session']
+
+class TTLCache:
+    """Boyutu sınırlı, kayıtları belirli süre sonra geçersiz olan LRU önbellek"""
+    def __init__(self, maxsize, ttl_seconds):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None or item[0] <= time.monotonic():
+                self.items.pop(key, None)
+                self.stats['misses'] += 1
+                return None
+            self.items.move_to_end(key)
+            self.stats['hits'] += 1
+            return item[1]
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = (time.monotonic() + self.ttl_seconds, value)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, size=len(self.items))
+
+# Spotify track ID -> (şarkı adı, sanatçı)
+spotify_track_cache = TTLCache(app.config['SPOTIFY_TRACK_CACHE_SIZE'], app.config['SPOTIFY_TRACK_CACHE_TTL_HOURS'] * 3600)
+
+class MetaTagParser(HTMLParser):
+    """Sadece <head> içindeki og: meta etiketlerini toplar, <body>'ye gelince durur"""
+    def __init__(self, wanted):
+        super().__init__(convert_charrefs=True)
+        self.wanted = set(wanted)
+        self.meta = {}
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            self.done = True
+        elif tag == 'meta':
+            attrs = dict(attrs)
+            prop = attrs.get('property') or attrs.get('name')
+            if prop in self.wanted and prop not in self.meta and attrs.get('content') is not None:
+                self.meta[prop] = attrs['content']
+                if len(self.meta) == len(self.wanted):
+                    self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+
+def fetch_meta_tags(url, wanted, timeout=10):
+    """
+    Sayfanın yalnızca <head> bölümünü ayrıştırarak istenen meta etiketlerini döndürür.
+    Etiketler bulununca gövdenin kalanı ayrıştırılmadan okunup atılır; yanıt sonuna kadar
+    okunmazsa bağlantı havuza dönemez. META_DRAIN_MAX_BYTES'ı aşan sayfalarda bağlantı kapatılır.
+    Sayfa 200 dönmezse None döndürür.
+    """
+    with get_http_session().get(url, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+            return None
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        parser = MetaTagParser(wanted)
+        bytes_read = 0
+        for chunk in response.iter_content(chunk_size=META_READ_CHUNK_SIZE):
+            bytes_read += len(chunk)
+            if not parser.done and bytes_read <= META_MAX_BYTES:
+                parser.feed(decoder.decode(chunk))
+            elif bytes_read > META_DRAIN_MAX_BYTES:
+                break
+        return parser.meta
+
 def get_spotify_track_info(track_url):
-    """Spotify track URL'sinden şarkı adı ve sanatçıyı çeker."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    """Spotify track URL'sinden şarkı adı ve sanatçıyı çeker. Sonuçlar track ID'sine göre önbelleğe alınır."""
+    track_id_match = re.search(r'/track/([a-zA-Z0-9]+)', track_url)
+    track_id = track_id_match.group(1) if track_id_match else track_url
+    cached = spotify_track_cache.get(track_id)
+    if cached:
+        return cached
+
     try:
-        response = requests.get(track_url, headers=headers, timeout=10)
-        if response.status_code != 200:
+        meta = fetch_meta_tags(track_url, ('og:title', 'og:description'))
+        if meta is None:
             return None, None
-        soup = BeautifulSoup(response.content, 'html.parser')
-        title = soup.find('meta', property='og:title')
-        description = soup.find('meta', property='og:description')
+        title = meta.get('og:title')
+        description = meta.get('og:description')
         
-        song_name = title['content'] if title else 'Bilinmeyen Şarkı'
+        song_name = title if title else 'Bilinmeyen Şarkı'
         
         artist = 'Bilinmeyen Sanatçı'
         if description:
             # "Listen to X on Spotify. Y · Song · 2023." formatından sanatçıyı al
-            desc_content = description['content']
+            desc_content = description
             parts = desc_content.split('·')
             if len(parts) > 1:
                 artist_candidate = parts[0].replace('Listen to ', '').replace(f' on Spotify', '').strip()
@@ -866,68 +4995,107 @@ def get_spotify_track_info(track_url):
             song_name = parts[0]
             artist = parts[1]
 
+        # Eksik bilgiyle dönen yedek değerler önbelleğe alınmaz, sonraki istekte yeniden denenir
+        if title and artist != 'Bilinmeyen Sanatçı':
+            spotify_track_cache.set(track_id, (song_name, artist))
         return song_name, artist
     except Exception as e:
         logging.error(f"Spotify bilgisi alınamadı ({track_url}): {e}")
         return None, None
 
+def transcode_to_mp3(source_path, output_path, bitrate='192k', timeout=None):
+    """İndirilen ses dosyasını ffmpeg ile MP3'e dönüştürür."""
+    cmd = [find_ffmpeg() or 'ffmpeg', '-y', '-loglevel', 'error', '-i', source_path,
+           '-vn', '-codec:a', 'libmp3lame', '-b:a', bitrate, output_path]
+    subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=timeout)
+
 def download_youtube_audio(search_query, output_path, song_name, session_id):
-    """Verilen arama sorgusu ile YouTube'dan en iyi ses sonucunu indirir."""
-    session = session_manager.get_session(session_id)
-    if not session: return
+    """
+    Verilen arama sorgusu ile YouTube'dan en iyi ses sonucunu indirir.
+    Arama, indirme ve MP3 dönüştürme ayrı aşamalar olarak, her biri kendi limitiyle çalışır.
+    Şarkı web process'inin thread'inde işlendiği için process havuzunun sınırları yerine
+    CONVERTER_TIMEOUTS ('spotify-downloader' veya 'default') süresi ve CONVERTER_MAX_OUTPUT_MB uygulanır.
+    """
+    if not session_manager.get_session(session_id): return
+    import yt_dlp
+    last_percent = {'value': None}
+    limits = converter_limits('spotify-downloader')
+    deadline = time.monotonic() + limits['timeout'] if limits['timeout'] else None
+
+    def remaining_time():
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ConverterLimitExceeded(f"Şarkı {limits['timeout']} saniyede indirilemedi ve durduruldu.")
+        return remaining
 
     def progress_hook(d):
+        remaining_time()  # Süre dolduysa indirme hook'tan fırlatılan hatayla kesilir
         if d['status'] == 'downloading':
             percent = d.get('_percent_str', '0%').strip().replace('%', '')
-            session['status'][song_name] = f"İndiriliyor... {percent}%"
-        elif d['status'] == 'finished':
-            session['status'][song_name] = "İşleniyor..."
+            # Paylaşılan depoya her ilerleme olayında değil, yüzde değiştiğinde yaz
+            whole_percent = percent.split('.', 1)[0]
+            if whole_percent != last_percent['value']:
+                last_percent['value'] = whole_percent
+                session_manager.set_status(session_id, song_name, f"İndiriliyor... {percent}%")
 
+    base_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'force_ipv4': True,  # IPv4 kullanmaya zorla
+        'ffmpeg_location': find_ffmpeg(), # FFmpeg yolunu burada belirt
+        'socket_timeout': 30  # Yanıt vermeyen bağlantı hook'a hiç ulaşmadan thread'i tutmasın
+    }
+    if limits['max_output_mb']:
+        base_opts['max_filesize'] = limits['max_output_mb'] * 1024 * 1024
+    downloaded_file = None
     try:
-        session['status'][song_name] = "YouTube'da aranıyor..."
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'progress_hooks': [progress_hook],
-            'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': '192'}],
-            'outtmpl': os.path.join(output_path, f'{search_query}.%(ext)s'),
-            'default_search': 'ytsearch5',
-            'force_ipv4': True,  # IPv4 kullanmaya zorla
-            'verbose': True, # Hata ayıklama için ayrıntılı çıktı
-            'ffmpeg_location': ffmpeg_path # FFmpeg yolunu burada belirt
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Arama sonucundan bilgi al, indirme yapma
-            info = ydl.extract_info(search_query, download=False)
-            
-            # Gerçek indirme için seçenekleri ayarla (sessiz modda)
-            ydl.params['quiet'] = True
-            ydl.params['verbose'] = False
-            ydl.params['no_warnings'] = True
-            
-            # Videoyu indir
-            ydl.download([info['entries'][0]['id']])
+        session_manager.set_status(session_id, song_name, "YouTube'da aranıyor...")
+        with spotify_pipeline.stage('search', service='youtube'):
+            with yt_dlp.YoutubeDL(base_opts) as ydl:
+                # Arama sonucundan bilgi al, indirme yapma
+                info = ydl.extract_info(f"ytsearch5:{search_query}", download=False)
 
-            # İndirme sonrası dosya adını bul ve yeniden adlandır
-            original_ext = info['entries'][0]['ext']
-            downloaded_file = ydl.prepare_filename(info['entries'][0]).rsplit('.', 1)[0] + '.mp3'
+        entries = [entry for entry in (info.get('entries') or []) if entry]
+        if not entries:
+            raise FileNotFoundError("YouTube'da uygun sonuç bulunamadı.")
+        video_url = entries[0].get('webpage_url') or entries[0]['id']
 
-            # Dosya adını güvenli hale getir
-            safe_filename = secure_filename(f"{search_query}.mp3")
-            final_path = os.path.join(output_path, safe_filename)
-            
-            # Eğer dosya zaten varsa ismini değiştirerek kaydet
-            if os.path.exists(final_path):
-                 final_path = os.path.join(output_path, f"{datetime.now().strftime('%H%M%S')}_{safe_filename}")
+        session_manager.set_status(session_id, song_name, "İndirme sırasında...")
+        with spotify_pipeline.stage('download', service='youtube'):
+            download_opts = dict(
+                base_opts,
+                format='bestaudio/best',
+                progress_hooks=[progress_hook],
+                # Aynı anda inen şarkıların geçici dosyaları çakışmasın
+                outtmpl=os.path.join(output_path, f"{os.urandom(6).hex()}.%(ext)s")
+            )
+            with yt_dlp.YoutubeDL(download_opts) as ydl:
+                downloaded_info = ydl.extract_info(video_url, download=True)
+                downloaded_file = ydl.prepare_filename(downloaded_info)
 
-            if os.path.exists(downloaded_file):
-                os.rename(downloaded_file, final_path)
-            
-            if os.path.exists(final_path):
-                session['status'][song_name] = "Tamamlandı"
-                session['files'].append(final_path)
-                logging.info(f"'{search_query}' başarıyla indirildi: {final_path}")
-            else:
-                 raise FileNotFoundError(f"İndirilen dosya bulunamadı: {downloaded_file}")
+        if not os.path.exists(downloaded_file):
+            raise FileNotFoundError(f"İndirilen dosya bulunamadı: {downloaded_file}")
+
+        # Dosya adını güvenli hale getir
+        safe_filename = secure_filename(f"{search_query}.mp3")
+        final_path = os.path.join(output_path, safe_filename)
+        
+        # Eğer dosya zaten varsa ismini değiştirerek kaydet
+        if os.path.exists(final_path):
+             final_path = os.path.join(output_path, f"{datetime.now().strftime('%H%M%S')}_{safe_filename}")
+
+        session_manager.set_status(session_id, song_name, "İşleniyor...")
+        with spotify_pipeline.stage('transcode'):
+            transcode_to_mp3(downloaded_file, final_path, timeout=remaining_time())
+
+        if os.path.exists(final_path):
+            session_manager.add_file(session_id, final_path)
+            session_manager.set_status(session_id, song_name, "Tamamlandı")
+            logging.info(f"'{search_query}' başarıyla indirildi: {final_path}")
+        else:
+             raise FileNotFoundError(f"Dönüştürülen dosya bulunamadı: {final_path}")
 
     except yt_dlp.utils.DownloadError as e:
         logging.error(f"yt-dlp indirme hatası ({search_query}): {e}")
@@ -943,98 +5111,595 @@ def download_youtube_audio(search_query, output_path, song_name, session_id):
             # Hatanın başını al, çok uzun olmasın
             error_message = re.sub(r'\[[^\]]+\]', '', error_message).strip().split('\n')[-1]
 
-        session['status'][song_name] = f"Hata: {error_message[:100]}"
+        session_manager.set_status(session_id, song_name, f"Hata: {error_message[:100]}")
+    except subprocess.CalledProcessError as e:
+        logging.error(f"FFmpeg MP3 dönüştürme hatası ({search_query}): {e.stderr}")
+        session_manager.set_status(session_id, song_name, "Hata: MP3'e dönüştürülemedi.")
+    except (ConverterLimitExceeded, subprocess.TimeoutExpired) as e:
+        logging.warning(f"Şarkı süre sınırını aştı ({search_query}): {e}")
+        session_manager.set_status(session_id, song_name, f"Hata: Süre sınırı ({limits['timeout']} sn) aşıldı.")
     except Exception as e:
         logging.error(f"Genel YouTube indirme hatası ({search_query}): {e}")
-        session['status'][song_name] = f"Hata: {str(e)[:100]}..."
+        session_manager.set_status(session_id, song_name, f"Hata: {str(e)[:100]}...")
+    finally:
+        # Ham indirme dosyasını temizle
+        if downloaded_file and os.path.exists(downloaded_file):
+            os.remove(downloaded_file)
+
+
+# --- YÜKLEME AKIŞI (STREAMING INGEST) ---
+# Yüklenen dosya, multipart gövdesi okunurken doğrudan DOWNLOAD_FOLDER altındaki bir
+# spool dosyasına yazılır; aynı geçişte SHA-256 özeti hesaplanır ve ilk baytlardan gerçek
+# format tespit edilir. Uzantısıyla uyuşmayan veya sınırı aşan dosyalar gövdenin geri
+# kalanı gelmeden reddedilir. Spool dosyası job klasörüne kopyalanmadan taşınır.
+
+# Bilinen dosya imzaları: (offset, imza, format)
+MAGIC_SIGNATURES = [
+    (0, b'%PDF', 'pdf'),
+    (0, b'\xff\xd8\xff', 'jpg'),
+    (0, b'\x89PNG\r\n\x1a\n', 'png'),
+    (0, b'PK\x03\x04', 'zip'),
+    (0, b'Rar!\x1a\x07', 'rar'),
+    (0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'ole'),
+    (8, b'WAVE', 'wav'),
+    (4, b'ftyp', 'mp4'),
+    (0, b'ID3', 'mp3'),
+    (0, b'GIF8', 'gif'),
+    (0, b'PAR1', 'parquet'),
+]
+MAGIC_HEAD_SIZE = 16
+
+# Uzantı -> kabul edilen gerçek formatlar. 'text' bilinen bir ikili imzası olmayan içerik demektir.
+EXTENSION_FORMATS = {
+    'pdf': {'pdf'},
+    'jpg': {'jpg'},
+    'jpeg': {'jpg'},
+    'png': {'png'},
+    'docx': {'zip'},
+    'xlsx': {'zip'},
+    'pptx': {'zip'},
+    'ppt': {'ole'},
+    'rar': {'rar'},
+    'zip': {'zip'},
+    'wav': {'wav'},
+    'mp4': {'mp4'},
+    'mp3': {'mp3'},
+    'txt': {'text'},
+    'json': {'text'},
+    'xml': {'text'},
+    'csv': {'text'},
+    'parquet': {'parquet'},
+}
+
+def detect_file_format(head):
+    """Dosyanın ilk baytlarından gerçek formatını tespit et"""
+    for offset, signature, file_format in MAGIC_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return file_format
+    # UTF-16 metinler null bayt içerdiği için BOM'larından tanınır
+    if head.startswith(TEXT_BOMS):
+        return 'text'
+    # ID3 etiketi olmayan MP3'ler doğrudan bir çerçeve başlığıyla başlar (11 bit senkron: FF Ex)
+    if len(head) >= 2 and head[0] == 0xff and head[1] & 0xe0 == 0xe0:
+        return 'mp3'
+    return 'text' if b'\x00' not in head else 'unknown'
+
+def content_mismatch(extension, head):
+    """İçerik uzantının kabul ettiği formatlardan biri değilse kullanıcıya gösterilecek mesajı döndürür"""
+    allowed_formats = EXTENSION_FORMATS.get(extension)
+    if allowed_formats and detect_file_format(head) not in allowed_formats:
+        return f"Dosya içeriği .{extension} uzantısıyla uyuşmuyor. Lütfen geçerli bir dosya yükleyin."
+    return None
 
+class UploadSpool:
+    """
+    Werkzeug'un yükleme için kullandığı dosya nesnesinin yerine geçer.
+    Gelen veriyi diske yazarken özet çıkarır, format ve boyut kontrolü yapar.
+    reject_mismatch False ise uzantısıyla uyuşmayan dosya isteği durdurmaz: gövdesi diske
+    yazılmadan okunur ve neden 'rejected' alanında bırakılır (toplu işte 'skipped' raporlanır).
+    """
+    def __init__(self, filename, max_bytes, reject_mismatch=True):
+        self.extension = filename.rsplit('.', 1)[1].lower() if filename and '.' in filename else ''
+        self.max_bytes = max_bytes
+        spool_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], app.config['UPLOAD_SPOOL_FOLDER'])
+        os.makedirs(spool_folder, exist_ok=True)
+        self.path = os.path.join(spool_folder, f"{os.getpid()}_{os.urandom(8).hex()}.part")
+        self.file = open(self.path, 'w+b')
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.head = b''
+        self.detected_format = None
+        self.moved = False
+        self.reject_mismatch = reject_mismatch
+        self.rejected = None
+
+    def write(self, data):
+        self.size += len(data)
+        if self.max_bytes and self.size > self.max_bytes:
+            self.discard()
+            raise RequestEntityTooLarge()
+        if self.rejected:
+            return len(data)
+        if self.detected_format is None:
+            self.head += data[:MAGIC_HEAD_SIZE - len(self.head)]
+            if len(self.head) >= MAGIC_HEAD_SIZE:
+                self._check_format()
+                if self.rejected:
+                    return len(data)
+        self.digest.update(data)
+        return self.file.write(data)
+
+    def _check_format(self):
+        self.detected_format = detect_file_format(self.head)
+        message = content_mismatch(self.extension, self.head)
+        if message:
+            self.discard()
+            if not self.reject_mismatch:
+                self.rejected = message
+                return
+            # Werkzeug form ayrıştırırken ValueError'ları yuttuğu için HTTP hatası fırlatılır
+            raise UnsupportedMediaType(message)
+
+    def seek(self, *args):
+        # Werkzeug gövde bitince başa sarar; kısa dosyalarda format kontrolü burada yapılır
+        if self.detected_format is None:
+            self._check_format()
+        if self.rejected:
+            return 0
+        return self.file.seek(*args)
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+    def move_to(self, dest_path):
+        """Spool dosyasını kopyalamadan hedef konuma taşı"""
+        self.file.close()
+        os.replace(self.path, dest_path)
+        self.moved = True
+
+    def discard(self):
+        self.file.close()
+        if not self.moved:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def close(self):
+        # İstek bittiğinde taşınmamış spool dosyası silinir
+        self.discard()
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+class UploadRequest(Request):
+    """Yüklemeleri UploadSpool ile diske akıtan istek sınıfı"""
+    BATCH_ENDPOINT = 'batch_submit_route'
+
+    @property
+    def max_content_length(self):
+        # Toplu istekler birden çok dosya (veya bir ZIP) taşıdığı için kendi sınırını kullanır
+        if self.endpoint == self.BATCH_ENDPOINT:
+            return app.config['BATCH_MAX_CONTENT_LENGTH']
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Toplu istekte tek dosyanın içerik uyuşmazlığı ve boyutu tüm isteği değil yalnızca o dosyayı
+        # etkiler; dosya başına MAX_CONTENT_LENGTH sınırı submit_batch_job'da uygulanır (ZIP alanı hariç)
+        if self.endpoint == self.BATCH_ENDPOINT:
+            return UploadSpool(filename, self.max_content_length, reject_mismatch=False)
+        return UploadSpool(filename, self.max_content_length)
+
+app.request_class = UploadRequest
+
+def save_upload(uploaded_file, input_path):
+    """Yüklenen dosyayı job klasörüne yerleştirir ve içeriğin SHA-256 özetini döndürür"""
+    if isinstance(uploaded_file.stream, UploadSpool):
+        uploaded_file.stream.move_to(input_path)
+        return uploaded_file.stream.hexdigest()
+
+    # UploadSpool kullanılmadıysa parça parça kopyala
+    digest = hashlib.sha256()
+    with open(input_path, 'wb') as f:
+        while True:
+            chunk = uploaded_file.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+def get_converter_options(converter_info, form):
+    """Dönüştürücünün 'options' listesinde tanımlı ve formda doldurulmuş alanları topla"""
+    options = {}
+    for option in converter_info.get('options', []):
+        value = (form.get(option['name']) or '').strip()
+        if value:
+            options[option['name']] = value
+    return options
+
+def submit_conversion_job(form, files):
+    """
+    Formdaki dönüştürme isteğini doğrular, girdiyi job klasörüne kaydeder ve
+    işi kuyruğa ekler. Geçersiz isteklerde ValueError fırlatır, job_id döndürür.
+    """
+    conversion_type = form.get('conversion_type')
+    if not conversion_type and form.get('target_format'):
+        return submit_pipeline_job(form, files)
+    if not conversion_type or conversion_type not in CONVERTERS:
+        raise ValueError('Geçersiz dönüştürme türü seçtiniz.')
+
+    converter_info = CONVERTERS[conversion_type]
+
+    # Çevrimiçi servisler dosya yüklemesi gerektirmez
+    if converter_info.get('is_online_service'):
+        if conversion_type != 'youtube-audio-downloader':
+            # Spotify gibi diğer online servisler kendi rotaları üzerinden yönetilir.
+            raise ValueError("Beklenmeyen bir istek yapıldı.")
+        admission_controller.admit([conversion_type], 0)
+        job_id, job_folder = job_manager.create_job_folder(conversion_type)
+        # Form nesnesi istekten sonra geçersiz olacağı için kopyasını gönder
+        job_manager.submit(job_id, conversion_type, (form.to_dict(), job_folder))
+        return job_id
+
+    # Dosya tabanlı dönüştürücüler
+    uploaded_file = files.get('file')
+    if not uploaded_file or uploaded_file.filename == '':
+        raise ValueError('Lütfen bir dosya seçin.')
+
+    original_filename = secure_filename(uploaded_file.filename)
+    file_extension = '.' in original_filename and original_filename.rsplit('.', 1)[1].lower()
+
+    if file_extension not in converter_info['allowed_extensions']:
+        allowed = ", ".join(converter_info['allowed_extensions'])
+        raise ValueError(f"Hatalı dosya türü. Lütfen bir {allowed} dosyası yükleyin.")
+
+    job_id, job_folder = job_manager.create_job_folder(conversion_type)
+    input_path = os.path.join(job_folder, original_filename)
+    content_hash = save_upload(uploaded_file, input_path)
+    logging.info(f"Dosya geçici olarak '{input_path}' konumuna kaydedildi.")
+
+    # Aynı içerik aynı ayarlarla daha önce dönüştürüldüyse dönüştürücüyü hiç çalıştırma
+    options = get_converter_options(converter_info, form)
+    cache_key = result_cache.make_key(content_hash, conversion_type, options)
+    cached_output = result_cache.fetch(cache_key, job_folder, original_filename.rsplit('.', 1)[0])
+    if cached_output:
+        job_manager.complete_from_cache(job_id, conversion_type, cached_output)
+        return job_id
+
+    # Önbellekten karşılanamayan iş kuyruğa alınmadan önce yük kontrolünden geçer
+    try:
+        admission_controller.admit([conversion_type], os.path.getsize(input_path))
+    except (ServiceOverloaded, JobTooLarge):
+        shutil.rmtree(job_folder, ignore_errors=True)
+        raise
+
+    job_manager.submit(job_id, conversion_type, (input_path, job_folder), options=options, cache_key=cache_key)
+    return job_id
+
+def submit_pipeline_job(form, files):
+    """
+    Yüklenen dosyayı formdaki target_format'a dönüştürmek için dönüşüm grafiğinden en kısa
+    zinciri planlar ve tek bir iş olarak kuyruğa ekler. Tek adımlık yollar normal iş olarak
+    çalışır. Geçersiz isteklerde ValueError fırlatır, job_id döndürür.
+    """
+    uploaded_file = files.get('file')
+    if not uploaded_file or uploaded_file.filename == '':
+        raise ValueError('Lütfen bir dosya seçin.')
+
+    original_filename = secure_filename(uploaded_file.filename)
+    file_extension = '.' in original_filename and original_filename.rsplit('.', 1)[1].lower()
+    target_format = conversion_graph.normalize(form.get('target_format'))
+    steps = conversion_graph.plan(file_extension or '', target_format)
+    if not steps:
+        raise ValueError(f"{(file_extension or 'Bu').upper()} dosyasından {target_format.upper()} formatına "
+                         f"{app.config['PIPELINE_MAX_STEPS']} adımda ulaşan bir dönüşüm yok.")
+
+    conversion_type = steps[0] if len(steps) == 1 else 'pipeline'
+    job_id, job_folder = job_manager.create_job_folder(conversion_type)
+    input_path = os.path.join(job_folder, original_filename)
+    content_hash = save_upload(uploaded_file, input_path)
+    logging.info(f"Dosya geçici olarak '{input_path}' konumuna kaydedildi. Plan: {' -> '.join(steps)}")
+
+    # Her adımın seçenekleri formdan toplanır; çakışan adlar tüm adımlara aynı değerle gider
+    options = {}
+    for step in steps:
+        options.update(get_converter_options(CONVERTERS[step], form))
+    cache_key = result_cache.make_key(content_hash, '>'.join(steps), options)
+    cached_output = result_cache.fetch(cache_key, job_folder, original_filename.rsplit('.', 1)[0])
+    if cached_output:
+        job_manager.complete_from_cache(job_id, conversion_type, cached_output)
+        return job_id
+
+    try:
+        admission_controller.admit(steps, os.path.getsize(input_path))
+    except (ServiceOverloaded, JobTooLarge):
+        shutil.rmtree(job_folder, ignore_errors=True)
+        raise
+
+    job_manager.submit(job_id, conversion_type, (input_path, job_folder), options=options,
+                       cache_key=cache_key, steps=steps if len(steps) > 1 else None)
+    return job_id
+
+def extract_batch_archive(archive_path, work_root, allowed_extensions, max_files):
+    """
+    Toplu işe yüklenen ZIP'in dosyalarını ayrı çalışma klasörlerine çıkarır ve içerik özetini alır.
+    Her dosya MAX_CONTENT_LENGTH, toplam açılmış boyut BATCH_MAX_CONTENT_LENGTH ile sınırlıdır
+    (ZIP bombalarına karşı bildirilen değil gerçekten okunan bayt sayılır). İçeriği uzantısıyla
+    uyuşmayan dosyalar, doğrudan yüklenenlerde olduğu gibi atlanır.
+    """
+    inputs = []
+    total_bytes = 0
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = [member for member in archive.infolist() if not member.is_dir()]
+            if len(members) > max_files:
+                raise ValueError(f"Toplu işte en fazla {max_files} dosya olabilir.")
+            for index, member in enumerate(members):
+                file_name = secure_filename(os.path.basename(member.filename))
+                extension = file_name.rsplit('.', 1)[1].lower() if '.' in file_name else ''
+                if extension not in allowed_extensions:
+                    inputs.append({'file': member.filename, 'error': "Bu dönüştürme için desteklenmeyen dosya türü."})
+                    continue
+                digest = hashlib.sha256()
+                size = 0
+                with archive.open(member) as source:
+                    chunk = source.read(MAGIC_HEAD_SIZE)
+                    message = content_mismatch(extension, chunk)
+                    if message:
+                        inputs.append({'file': member.filename, 'error': message})
+                        continue
+                    work_folder = os.path.join(work_root, f"{index:04d}")
+                    os.makedirs(work_folder, exist_ok=True)
+                    input_path = os.path.join(work_folder, file_name)
+                    with open(input_path, 'wb') as target:
+                        while chunk:
+                            size += len(chunk)
+                            total_bytes += len(chunk)
+                            if size > app.config['MAX_CONTENT_LENGTH'] or total_bytes > app.config['BATCH_MAX_CONTENT_LENGTH']:
+                                raise ValueError("ZIP içindeki dosyalar boyut sınırını aşıyor.")
+                            digest.update(chunk)
+                            target.write(chunk)
+                            chunk = source.read(UPLOAD_CHUNK_SIZE)
+                inputs.append({'file': file_name, 'path': input_path, 'hash': digest.hexdigest()})
+    except zipfile.BadZipFile:
+        raise ValueError("Yüklenen arşiv geçerli bir ZIP dosyası değil.")
+    return inputs
+
+def submit_batch_job(form, files):
+    """
+    Toplu dönüştürme isteğini doğrular: 'files' alanındaki dosyaları veya 'archive' alanındaki
+    ZIP'in içeriğini tek bir job klasörüne kaydeder ve toplu işi kuyruğa ekler. job_id döndürür.
+    Kabul edilmeyen dosyalar işi durdurmaz, manifest'te 'skipped' olarak raporlanır.
+    """
+    conversion_type = form.get('conversion_type')
+    if not conversion_type or conversion_type not in CONVERTERS or CONVERTERS[conversion_type].get('is_online_service'):
+        raise ValueError('Geçersiz dönüştürme türü seçtiniz.')
+    converter_info = CONVERTERS[conversion_type]
+    options = get_converter_options(converter_info, form)
+
+    uploads = [upload for upload in files.getlist('files') if upload and upload.filename]
+    archive = files.get('archive')
+    if not uploads and not (archive and archive.filename):
+        raise ValueError("Lütfen 'files' alanında dosyalar veya 'archive' alanında bir ZIP gönderin.")
+    if len(uploads) > app.config['BATCH_MAX_FILES']:
+        raise ValueError(f"Toplu işte en fazla {app.config['BATCH_MAX_FILES']} dosya olabilir.")
+
+    job_id, job_folder = job_manager.create_job_folder(f"batch_{conversion_type}")
+    work_root = os.path.join(job_folder, JobManager.BATCH_WORK_FOLDER)
+    inputs = []
+    try:
+        for index, upload in enumerate(uploads):
+            file_name = secure_filename(upload.filename)
+            extension = file_name.rsplit('.', 1)[1].lower() if '.' in file_name else ''
+            if extension not in converter_info['allowed_extensions']:
+                inputs.append({'file': upload.filename, 'error': "Bu dönüştürme için desteklenmeyen dosya türü."})
+                continue
+            if isinstance(upload.stream, UploadSpool):
+                if upload.stream.rejected:
+                    inputs.append({'file': upload.filename, 'error': upload.stream.rejected})
+                    continue
+                if upload.stream.size > app.config['MAX_CONTENT_LENGTH']:
+                    inputs.append({'file': upload.filename, 'error': f"Dosya boyut sınırını aşıyor. Maksimum boyut: "
+                                                                     f"{app.config['MAX_CONTENT_LENGTH'] // 1024 // 1024} MB."})
+                    continue
+            work_folder = os.path.join(work_root, f"{index:04d}")
+            os.makedirs(work_folder, exist_ok=True)
+            input_path = os.path.join(work_folder, file_name)
+            inputs.append({'file': file_name, 'path': input_path, 'hash': save_upload(upload, input_path)})
+
+        if archive and archive.filename:
+            if not archive.filename.lower().endswith('.zip') or getattr(archive.stream, 'rejected', None):
+                raise ValueError("'archive' alanı bir ZIP dosyası olmalıdır.")
+            archive_path = os.path.join(job_folder, 'archive.zip')
+            save_upload(archive, archive_path)
+            try:
+                inputs += extract_batch_archive(archive_path, os.path.join(work_root, 'zip'),
+                                                converter_info['allowed_extensions'],
+                                                app.config['BATCH_MAX_FILES'] - len(inputs))
+            finally:
+                os.remove(archive_path)
+    except Exception:
+        shutil.rmtree(job_folder, ignore_errors=True)
+        raise
+
+    if not any('path' in item for item in inputs):
+        shutil.rmtree(job_folder, ignore_errors=True)
+        allowed = ", ".join(converter_info['allowed_extensions'])
+        raise ValueError(f"Dönüştürülecek uygun dosya bulunamadı. Lütfen {allowed} dosyaları gönderin.")
+
+    try:
+        admission_controller.admit([conversion_type], sum(os.path.getsize(item['path']) for item in inputs if 'path' in item))
+    except (ServiceOverloaded, JobTooLarge):
+        shutil.rmtree(job_folder, ignore_errors=True)
+        raise
+
+    job_manager.submit_batch(job_id, conversion_type, inputs, options)
+    logging.info(f"Toplu iş oluşturuldu ({job_id}): {len(inputs)} dosya.")
+    return job_id
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
-    """Ana sayfa. Dosya yükleme formunu gösterir ve dönüştürme isteğini işler."""
-    # İşletim sistemi ve FFmpeg durumunu şablona gönder
-    is_windows = platform.system() == "Windows"
-    ffmpeg_available = bool(ffmpeg_path)
+    """Ana sayfa. Dosya yükleme formunu gösterir ve dönüştürme isteğini kuyruğa ekler."""
+    # Ofis render arka ucu ve FFmpeg durumunu şablona gönder
+    office_available = document_renderer is not None
+    ffmpeg_available = bool(find_ffmpeg())
 
     if request.method == 'POST':
-        # Disk alanını kontrol et
         try:
-            check_disk_space()
-        except Exception as e:
+            # Aşırı yükte yükleme hiç okunmadan reddedilir
+            admission_controller.admit([], request.content_length)
+            job_id = submit_conversion_job(request.form, request.files)
+        except HTTPException:
+            raise
+        except ServiceOverloaded as e:
             flash(str(e), 'error')
-            return redirect(url_for('index'))
-        conversion_type = request.form.get('conversion_type')
-        if not conversion_type or conversion_type not in CONVERTERS:
-            flash('Geçersiz dönüştürme türü seçtiniz.', 'error')
-            return redirect(request.referrer or url_for('index'))
-        
-        converter_info = CONVERTERS[conversion_type]
-
-        try:
-            # Her işlem için benzersiz bir klasör oluştur
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # Güvenli bir temel ad oluştur
-            base_name = re.sub(r'[^a-zA-Z0-9_.-]', '', f"job_{conversion_type}")
-            job_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], f"{timestamp}_{base_name}")
-            os.makedirs(job_folder, exist_ok=True)
-            
-            output_path = None
-
-            # Çevrimiçi servisler dosya yüklemesi gerektirmez
-            if converter_info.get('is_online_service'):
-                 if conversion_type == 'youtube-audio-downloader':
-                    output_path = converter_info['function'](request.form, job_folder)
-                 else:
-                    # Spotify gibi diğer online servisler kendi rotaları üzerinden yönetilir.
-                    # Bu POST isteği buraya gelmemeli.
-                    flash("Beklenmeyen bir istek yapıldı.", 'error')
-                    return redirect(url_for('index'))
-            else: # Dosya tabanlı dönüştürücüler
-                uploaded_file = request.files.get('file')
-                if not uploaded_file or uploaded_file.filename == '':
-                    flash('Lütfen bir dosya seçin.', 'error')
-                    return redirect(request.referrer or url_for('index'))
-
-                original_filename = secure_filename(uploaded_file.filename)
-                file_extension = '.' in original_filename and original_filename.rsplit('.', 1)[1].lower()
-
-                if file_extension not in converter_info['allowed_extensions']:
-                    allowed = ", ".join(converter_info['allowed_extensions'])
-                    flash(f"Hatalı dosya türü. Lütfen bir {allowed} dosyası yükleyin.", 'error')
-                    return redirect(request.referrer or url_for('index'))
-                
-                input_path = os.path.join(job_folder, original_filename)
-                uploaded_file.save(input_path)
-                logging.info(f"Dosya geçici olarak '{input_path}' konumuna kaydedildi.")
-                output_path = converter_info['function'](input_path, job_folder)
-
-            # Sonucu kullanıcıya gönder
-            if output_path and os.path.exists(output_path):
-                logging.info(f"Dönüştürülen dosya '{output_path}' indirilmek üzere gönderiliyor.")
-                return send_file(output_path, as_attachment=True)
-            else:
-                flash("Dosya dönüştürme sırasında bir hata oluştu veya dönüştürücü bir dosya döndürmedi. Lütfen tekrar deneyin.", 'error')
-                return redirect(request.referrer or url_for('index'))
-
+            return render_template('index.html',
+                                   converters=CONVERTERS,
+                                   office_available=office_available,
+                                   ffmpeg_available=ffmpeg_available,
+                                   job_id=None), 503, {'Retry-After': str(e.retry_after)}
         except Exception as e:
-            logging.error(f"İşlem sırasında beklenmedik bir hata oluştu: {e}")
-            import traceback
-            logging.error(traceback.format_exc())
-            
-            error_message = "Beklenmedik bir sunucu hatası oluştu. Lütfen yönetici ile iletişime geçin."
-            if "unrar' programı sisteminizde bulunamadı" in str(e):
-                error_message = "RAR dönüştürme başarısız: 'unrar' programı sistemde kurulu veya erişilebilir değil."
-            elif isinstance(e, ValueError):
-                error_message = str(e)
-            
-            flash(error_message, 'error')
+            if not isinstance(e, ValueError):
+                logging.error(f"İşlem sırasında beklenmedik bir hata oluştu: {e}")
+                import traceback
+                logging.error(traceback.format_exc())
+            flash(get_user_error_message(e), 'error')
             return redirect(request.referrer or url_for('index'))
 
+        # Sayfa iş durumunu takip eder ve iş bitince dosyayı indirir
+        return redirect(url_for('index', job_id=job_id, _anchor=request.form.get('conversion_type')))
+
     # GET isteği için her zaman sayfayı render et
     return render_template('index.html', 
                            converters=CONVERTERS, 
-                           is_windows=is_windows, 
-                           ffmpeg_available=ffmpeg_available)
+                           office_available=office_available,
+                           ffmpeg_available=ffmpeg_available,
+                           job_id=request.args.get('job_id'))
+
+# --- İŞ API'Sİ ---
+
+def job_to_dict(job):
+    """İş durumunu API yanıtına dönüştür"""
+    data = dict(job)
+    data.pop('output_file', None)
+    data['status_url'] = url_for('job_status_route', job_id=job['job_id'])
+    data['download_url'] = url_for('job_download_route', job_id=job['job_id']) if job['status'] == 'done' else None
+    if job.get('batch'):
+        data['manifest_url'] = (url_for('job_manifest_route', job_id=job['job_id'])
+                                if job['status'] in JobManager.FINISHED_STATUSES and job.get('output_file') else None)
+    return data
+
+@app.route('/jobs', methods=['POST'])
+def job_submit_route():
+    """Dönüştürme işi oluşturur ve hemen job_id döndürür. Aşırı yükte 503 ve Retry-After, sunucuya sığmayan işte 413 döner."""
+    try:
+        admission_controller.admit([], request.content_length)
+        job_id = submit_conversion_job(request.form, request.files)
+    except ServiceOverloaded as e:
+        return overloaded_response(e)
+    except JobTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RequestEntityTooLarge:
+        return jsonify({'error': f"Dosya çok büyük. Maksimum boyut: {app.config['MAX_CONTENT_LENGTH'] // 1024 // 1024} MB."}), 413
+    except HTTPException as e:
+        return jsonify({'error': e.description}), e.code
+    except Exception as e:
+        logging.error(f"İş oluşturulamadı: {e}")
+        return jsonify({'error': get_user_error_message(e)}), 500
+
+    return jsonify(job_to_dict(job_manager.get_job(job_id))), 202
+
+@app.route('/conversions/plan')
+def conversion_plan_route():
+    """İki format arasındaki dönüşüm zincirini ya da kaynaktan ulaşılabilen formatları döndürür."""
+    source_format = conversion_graph.normalize(request.args.get('from'))
+    target_format = request.args.get('to')
+    if not source_format:
+        return jsonify({'error': "'from' parametresi gerekli."}), 400
+    if not target_format:
+        return jsonify({'source_format': source_format,
+                        'target_formats': conversion_graph.reachable_formats(source_format)})
+
+    steps = conversion_graph.plan(source_format, target_format)
+    if not steps:
+        return jsonify({'error': 'Bu formatlar arasında bir dönüşüm yolu bulunamadı.'}), 404
+    # Bellek içi adımlar yalnızca yine bellek içi çalışabilen bir komşu adımla birleştirilir
+    memory = [('memory_step' in CONVERTERS[step]) for step in steps]
+    return jsonify({
+        'source_format': source_format,
+        'target_format': conversion_graph.normalize(target_format),
+        'steps': [{'conversion_type': step, 'display_name': CONVERTERS[step]['display_name'],
+                   'in_memory': memory[i] and ((i > 0 and memory[i - 1]) or (i + 1 < len(steps) and memory[i + 1]))}
+                  for i, step in enumerate(steps)]
+    })
+
+@app.route('/batches', methods=['POST'])
+def batch_submit_route():
+    """Birden çok dosyayı (veya bir ZIP'i) tek istekte alır, toplu dönüştürme işi oluşturur."""
+    try:
+        admission_controller.admit([], request.content_length)
+        job_id = submit_batch_job(request.form, request.files)
+    except ServiceOverloaded as e:
+        return overloaded_response(e)
+    except JobTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RequestEntityTooLarge:
+        return jsonify({'error': f"İstek çok büyük. Maksimum boyut: {app.config['BATCH_MAX_CONTENT_LENGTH'] // 1024 // 1024} MB."}), 413
+    except HTTPException as e:
+        return jsonify({'error': e.description}), e.code
+    except Exception as e:
+        logging.error(f"Toplu iş oluşturulamadı: {e}")
+        return jsonify({'error': get_user_error_message(e)}), 500
+
+    return jsonify(job_to_dict(job_manager.get_job(job_id))), 202
+
+@app.route('/jobs/<job_id>/manifest')
+def job_manifest_route(job_id):
+    """Toplu işin dosya bazlı sonuç listesini döndürür."""
+    job = job_manager.get_job(job_id)
+    if not job or not job.get('batch') or not job.get('output_file'):
+        return jsonify({'error': 'Toplu iş bulunamadı veya henüz tamamlanmadı.'}), 404
+    return send_file(os.path.abspath(os.path.join(job_manager.get_job_folder(job_id), JobManager.BATCH_MANIFEST_FILE)),
+                     mimetype='application/json')
+
+@app.route('/jobs/<job_id>')
+def job_status_route(job_id):
+    """Bir dönüştürme işinin durumunu döndürür."""
+    job = job_manager.get_job(job_id)
+    if not job:
+        return jsonify({'error': 'İş bulunamadı veya süresi doldu.'}), 404
+    return jsonify(job_to_dict(job))
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def job_cancel_route(job_id):
+    """Kuyruktaki veya çalışan bir işi iptal eder; process havuzunda çalışan dönüştürücü durdurulur."""
+    job = job_manager.cancel(job_id)
+    if not job:
+        return jsonify({'error': 'İş bulunamadı veya süresi doldu.'}), 404
+    if job['status'] in JobManager.FINISHED_STATUSES:
+        return jsonify({'error': 'İş zaten tamamlanmış.', **job_to_dict(job)}), 409
+    return jsonify(job_to_dict(job)), 202
+
+@app.route('/jobs/<job_id>/download')
+def job_download_route(job_id):
+    """Tamamlanan işin çıktısını indirir."""
+    output_path = job_manager.get_output_path(job_id)
+    if not output_path:
+        return "Dosya bulunamadı, süresi doldu veya iş henüz tamamlanmadı.", 404
+    if job_manager.get_job(job_id).get('batch'):
+        # Toplu işin çıktıları ve manifest'i diskte ara arşiv oluşturmadan tek ZIP olarak akıtılır
+        return zip_stream_response(job_manager.get_batch_entries(job_id), f"{job_id}.zip")
+    logging.info(f"Dönüştürülen dosya '{output_path}' indirilmek üzere gönderiliyor.")
+    return send_file(os.path.abspath(output_path), as_attachment=True)
+
+# Durum sorguları sık yapıldığı için genel rate limit'ten muaf tut
+if limiter:
+    limiter.exempt(job_status_route)
 
 @app.route('/download_spotify', methods=['POST'])
 def download_spotify_route():
@@ -1046,11 +5711,11 @@ def download_spotify_route():
         except Exception:
             return jsonify({'error': 'Çok fazla istek gönderdiniz. Lütfen bekleyin.'}), 429
     
-    # Disk alanını kontrol et
+    # Disk, bellek ve kuyruk yükünü kontrol et
     try:
-        check_disk_space()
-    except Exception as e:
-        return jsonify({'error': str(e)}), 507
+        admission_controller.admit(['spotify-downloader'], 0)
+    except ServiceOverloaded as e:
+        return overloaded_response(e)
     
     data = request.get_json()
     links_text = data.get('links', '')
@@ -1068,6 +5733,8 @@ def download_spotify_route():
     session_id = f"spotify_{datetime.now().strftime('%Y%m%d%H%M%S')}_{os.urandom(4).hex()}"
     session_folder = os.path.join(app.config['DOWNLOAD_FOLDER'], session_id)
     os.makedirs(session_folder)
+    download_index.add(session_id, 0)
+    cleanup_scheduler.schedule(session_id)
 
     session_manager.create_session(session_id, {'status': {}, 'files': [], 'is_complete': False})
     
@@ -1076,49 +5743,65 @@ def download_spotify_route():
     
     return jsonify({'message': 'İndirme başlatıldı.', 'session_id': session_id})
 
+def process_spotify_track(url, session_folder, session_id):
+    """Tek bir Spotify şarkısını indirme hattının tüm aşamalarından geçirir."""
+    # Session'ın hala var olduğunu kontrol et
+    if not session_manager.get_session(session_id):
+        logging.warning(f"Session süresi doldu: {session_id}")
+        return
+
+    session_manager.set_status(session_id, url, "Şarkı bilgisi alınıyor...")
+    with spotify_pipeline.stage('metadata', service='spotify'):
+        song_name, artist = get_spotify_track_info(url)
+
+    if not (song_name and artist):
+        session_manager.set_status(session_id, url, "Hata: Şarkı bilgisi alınamadı")
+        return
+
+    display_name = f"{artist} - {song_name}"
+
+    def rename_track(session):
+        # Link yerine şarkı adını göster
+        session['status'].pop(url, None)
+        session['status'][display_name] = "Sırada"
+    session_manager.mutate_session(session_id, rename_track)
+
+    search_query = f"{artist} {song_name}"
+    download_youtube_audio(search_query, session_folder, display_name, session_id)
+
 def spotify_download_thread(track_urls, session_folder, session_id):
     """Arka planda Spotify şarkılarını indiren thread fonksiyonu."""
-    session = session_manager.get_session(session_id)
-    if not session:
+    if not session_manager.get_session(session_id):
         logging.error(f"Session bulunamadı: {session_id}")
         return
         
     try:
-        for url in track_urls:
-            # Session'ın hala var olduğunu kontrol et
-            session = session_manager.get_session(session_id)
-            if not session:
-                logging.warning(f"Session süresi doldu: {session_id}")
-                break
-                
-            song_name, artist = get_spotify_track_info(url)
-            if song_name and artist:
-                display_name = f"{artist} - {song_name}"
-                session['status'][display_name] = "Sırada"
-                session_manager.update_session(session_id, session)
-                
-                search_query = f"{artist} {song_name}"
-                download_youtube_audio(search_query, session_folder, display_name, session_id)
-            else:
-                session['status'][url] = "Hata: Şarkı bilgisi alınamadı"
-                session_manager.update_session(session_id, session)
-            
-            time.sleep(1)  # Rate limiting
+        def queue_tracks(session):
+            for url in track_urls:
+                session['status'][url] = "Sırada"
+        session_manager.mutate_session(session_id, queue_tracks)
+
+        # Şarkılar indirme hattında paralel işlenir; bir şarkının hatası diğerlerini durdurmaz
+        futures = [
+            spotify_pipeline.track_executor.submit(process_spotify_track, url, session_folder, session_id)
+            for url in dict.fromkeys(track_urls)
+        ]
+        for future, url in zip(futures, dict.fromkeys(track_urls)):
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Şarkı işlenemedi ({url}): {e}")
+                session_manager.set_status(session_id, url, f"Hata: {str(e)[:100]}")
         
+        download_index.refresh(session_id)
+
         # Session'ı tamamlandı olarak işaretle
-        session = session_manager.get_session(session_id)
-        if session:
-            session['is_complete'] = True
-            session_manager.update_session(session_id, session)
+        if session_manager.update_session(session_id, {'is_complete': True}):
             logging.info(f"Spotify indirme oturumu ({session_id}) tamamlandı.")
             
     except Exception as e:
         logging.error(f"Spotify indirme thread hatası ({session_id}): {e}")
-        session = session_manager.get_session(session_id)
-        if session:
-            session['is_complete'] = True
-            session['error'] = str(e)
-            session_manager.update_session(session_id, session)
+        session_manager.update_session(session_id, {'is_complete': True, 'error': str(e)})
 
 
 @app.route('/spotify_status/<session_id>')
@@ -1148,41 +5831,57 @@ def download_spotify_zip_route(session_id):
     if not downloaded_files:
         return "İndirilecek dosya bulunamadı.", 404
 
-    zip_path = os.path.join(app.config['DOWNLOAD_FOLDER'], f"{session_id}.zip")
-    try:
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            for f_path in downloaded_files:
-                if os.path.exists(f_path):
-                    zipf.write(f_path, os.path.basename(f_path))
-
-        return send_file(zip_path, as_attachment=True)
-    except Exception as e:
-        logging.error(f"ZIP oluşturma hatası ({session_id}): {e}")
-        return "ZIP dosyası oluşturulamadı.", 500
+    # ZIP diskte oluşturulmadan, şarkılar eklendikçe kullanıcıya akıtılır
+    existing_files = [f_path for f_path in downloaded_files if os.path.exists(f_path)]
+    if not existing_files:
+        return "İndirilecek dosya bulunamadı.", 404
+    return zip_stream_response(
+        ((os.path.basename(f_path), f_path) for f_path in existing_files),
+        f"{session_id}.zip"
+    )
 
 
 # --- ADMİN VE MONİTORİNG ---
 
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Route bazında istek süresi ve durum kodu sayacı (yol değil endpoint adı etiketlenir)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        endpoint = request.endpoint or 'unknown'
+        metrics.observe('allconvert_http_request_duration_seconds', time.perf_counter() - started,
+                        endpoint=endpoint, method=request.method)
+        metrics.inc('allconvert_http_requests_total', endpoint=endpoint, method=request.method,
+                    status=str(response.status_code))
+    return response
+
+@app.route('/metrics')
+def metrics_route():
+    """Tüm gunicorn worker'larından toplanan metrikler (Prometheus metin formatı)"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
 @app.route('/admin/status')
 def admin_status():
     """Sistem durumu endpoint'i (admin için)"""
     try:
         stats = get_system_stats()
         
-        # Downloads klasöründeki toplam dosya sayısı
-        total_files = 0
-        total_folders = 0
-        for root, dirs, files in os.walk(app.config['DOWNLOAD_FOLDER']):
-            total_files += len(files)
-            total_folders += len(dirs)
+        # Downloads klasöründeki toplam dosya sayısı (klasör taranmadan dizinden okunur)
+        index_stats = download_index.get_stats()
         
         return jsonify({
             'status': 'healthy',
             'system': stats,
             'downloads': {
-                'total_files': total_files,
-                'total_folders': total_folders,
-                'retention_hours': app.config['FILE_RETENTION_HOURS']
+                'total_files': index_stats['total_files'],
+                'total_folders': index_stats['total_folders'],
+                'retention_hours': app.config['FILE_RETENTION_HOURS'],
+                'last_reconciled': index_stats['last_reconciled'],
+                'last_drift_bytes': index_stats['last_drift_bytes']
             },
             'config': {
                 'max_concurrent_downloads': app.config['MAX_CONCURRENT_DOWNLOADS'],
@@ -1190,6 +5889,13 @@ def admin_status():
                 'disk_warning_percent': app.config['DISK_USAGE_WARNING_PERCENT'],
                 'disk_critical_percent': app.config['DISK_USAGE_CRITICAL_PERCENT']
             },
+            'converter_pool': converter_pool.get_stats(),
+            'admission': admission_controller.get_stats(),
+            'document_renderer': document_renderer.get_stats() if document_renderer else None,
+            'sessions': session_manager.get_stats(),
+            'cleanup': cleanup_scheduler.get_stats(),
+            'result_cache': result_cache.get_stats(),
+            'spotify_track_cache': spotify_track_cache.get_stats(),
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -1199,17 +5905,30 @@ def admin_status():
             'timestamp': datetime.now().isoformat()
         }), 500
 
+@app.route('/admin/converters')
+def admin_converters():
+    """
+    Dönüştürücü uygunluğu ve son ölçülen import maliyetleri. ?measure=1 arka planda yeni bir ölçüm
+    başlatır ve beklemeden 202 ile mevcut değerleri döndürür; sonuç sonraki sorgularda görünür.
+    """
+    if request.args.get('measure') == '1':
+        converter_registry.start_import_measurement()
+        return jsonify(converter_registry.get_stats()), 202
+    return jsonify(converter_registry.get_stats())
+
 @app.route('/admin/cleanup', methods=['POST'])
 def admin_cleanup():
     """Manuel dosya temizleme endpoint'i (admin için)"""
     try:
-        cleaned_count = cleanup_old_files()
+        report = cleanup_old_files()
         session_manager.cleanup_expired_sessions()
         
         return jsonify({
             'status': 'success',
-            'cleaned_files': cleaned_count,
-            'message': f'{cleaned_count} eski dosya/klasör temizlendi',
+            'cleaned_files': report['removed'],
+            'reclaimed_bytes': report['reclaimed_bytes'],
+            'message': f"{report['removed']} eski dosya/klasör temizlendi, "
+                       f"{report['reclaimed_bytes'] / (1024 * 1024):.1f} MB yer açıldı",
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -1225,6 +5944,12 @@ def request_entity_too_large(error):
     flash(f"Yüklemeye çalıştığınız dosya çok büyük. Maksimum boyut: {app.config['MAX_CONTENT_LENGTH'] // 1024 // 1024} MB.", 'error')
     return redirect(url_for('index'))
 
+@app.errorhandler(415)
+def unsupported_media_type(error):
+    """İçeriği uzantısıyla uyuşmayan yüklemeler için hata."""
+    flash(error.description, 'error')
+    return redirect(url_for('index'))
+
 
 if __name__ == '__main__':
     # Geliştirme ortamı için debug modunu aç.
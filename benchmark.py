@@ -0,0 +1,456 @@
+"""
+Dönüştürücü performans ölçümü (benchmark).
+
+Deterministik test dosyalarını (çok sayfalı PDF, büyük DOCX/TXT, farklı boyutlarda resimler,
+ffmpeg ile sentetik WAV/MP4, büyük JSON/XML/CSV/XLSX) yerelde üretir, CONVERTERS içindeki her
+dönüştürücüyü ayrı bir process'te tek başına çalıştırır ve duvar saati süresini, CPU süresini,
+en yüksek bellek kullanımını (RSS) ve çıktı boyutunu bir JSON dosyasına yazar. Önceki bir sonuç
+dosyası --compare ile verilirse süre ve bellek karşılaştırılır, eşiği aşan yavaşlamalar raporlanır.
+
+Kullanım:
+    python benchmark.py                                # tüm dönüştürücüler, benchmark_results.json
+    python benchmark.py --only pdf-to-word,mp4-to-avi --repeat 5
+    python benchmark.py --compare baseline.json --threshold 0.15
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import metadata
+
+# Sürümü sonuca yazılan kütüphaneler (kütüphane güncellemesi sonrası karşılaştırma için)
+TRACKED_PACKAGES = ('pdf2docx', 'PyMuPDF', 'Pillow', 'python-docx', 'pandas', 'openpyxl', 'pyarrow',
+                    'ijson', 'xmltodict', 'imageio-ffmpeg', 'rarfile')
+
+# Resim dosyaları bu boyutlarda üretilir
+IMAGE_SIZES = {'small': (640, 480), 'medium': (1920, 1080), 'large': (4000, 3000)}
+
+WORDS = ('dosya', 'format', 'sayfa', 'veri', 'kayıt', 'metin', 'tablo', 'resim', 'ses', 'video',
+         'alpha', 'beta', 'gamma', 'delta', 'lorem', 'ipsum', 'dolor', 'sit', 'amet', 'convert')
+ASCII_WORDS = tuple(word for word in WORDS if word.isascii())
+
+def _sentence(rng, words=WORDS, length=12):
+    return ' '.join(rng.choice(words) for _ in range(length))
+
+def _records(count, seed):
+    """Tablo ve JSON/XML dosyaları için aynı tohumdan aynı kayıtları üretir"""
+    rng = random.Random(seed)
+    for index in range(count):
+        yield {
+            'id': index,
+            'name': _sentence(rng, length=3),
+            'price': round(rng.uniform(1, 1000), 2),
+            'quantity': rng.randint(0, 500),
+            'active': rng.random() < 0.5,
+            'note': _sentence(rng, length=8)
+        }
+
+# --- Test dosyası üreticileri ---
+# Her üretici (yol, ölçek) alır; gereken kütüphane/program yoksa RuntimeError fırlatır.
+
+def write_text_pdf(path, scale):
+    """Kütüphane kullanmadan Helvetica metinli çok sayfalı bir PDF yazar"""
+    rng = random.Random(1)
+    page_count = max(1, int(20 * scale))
+    bodies = {1: b"<< /Type /Catalog /Pages 2 0 R >>",
+              3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for page in range(page_count):
+        page_number, content_number = 4 + page * 2, 5 + page * 2
+        lines = [_sentence(rng, ASCII_WORDS, 10) for _ in range(50)]
+        stream = "BT /F1 10 Tf 14 TL 50 800 Td " + " T* ".join(f"({line}) Tj" for line in lines) + " ET"
+        bodies[content_number] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode('ascii')
+        bodies[page_number] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                               f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_number} 0 R >>").encode('ascii')
+        kids.append(f"{page_number} 0 R")
+    bodies[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {page_count} >>".encode('ascii')
+
+    with open(path, 'wb') as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = {}
+        for number in sorted(bodies):
+            offsets[number] = f.tell()
+            f.write(f"{number} 0 obj\n".encode('ascii') + bodies[number] + b"\nendobj\n")
+        xref_offset = f.tell()
+        size = max(bodies) + 1
+        f.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode('ascii'))
+        for number in range(1, size):
+            f.write(f"{offsets[number]:010d} 00000 n \n".encode('ascii'))
+        f.write(f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii'))
+
+def write_txt(path, scale):
+    rng = random.Random(2)
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(int(50000 * scale)):
+            f.write(_sentence(rng) + '\n')
+
+def write_docx(path, scale):
+    try:
+        import docx
+    except ImportError:
+        raise RuntimeError("python-docx kurulu değil")
+    rng = random.Random(3)
+    document = docx.Document()
+    for index in range(int(2000 * scale)):
+        if index % 100 == 0:
+            document.add_heading(f"Bölüm {index // 100 + 1}", level=1)
+        document.add_paragraph(_sentence(rng, length=30))
+    document.save(path)
+
+def write_image(size, image_format):
+    """Gradyan + gürültü kanallı deterministik bir resim üreticisi döndürür"""
+    def writer(path, scale):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise RuntimeError("Pillow kurulu değil")
+        width, height = size
+        noise = Image.frombytes('L', (width, height), random.Random(width).randbytes(width * height))
+        red = Image.linear_gradient('L').resize((width, height))
+        green = Image.radial_gradient('L').resize((width, height))
+        image = Image.merge('RGB', (red, green, noise))
+        if image_format == 'PNG':
+            image = image.convert('RGBA')  # PNG -> JPG'de alfa kanalı kaldırma yolu da ölçülsün
+        image.save(path, image_format)
+    return writer
+
+def _ffmpeg(path, *args):
+    from app import find_ffmpeg
+    executable = find_ffmpeg()
+    if not executable:
+        raise RuntimeError("ffmpeg bulunamadı")
+    subprocess.run([executable, '-y', '-loglevel', 'error', *args, '-bitexact', path], check=True)
+
+def write_wav(path, scale):
+    duration = max(1, int(60 * scale))
+    _ffmpeg(path, '-f', 'lavfi', '-i', f"sine=frequency=440:sample_rate=44100:duration={duration}", '-ac', '2')
+
+def write_mp4(path, scale):
+    duration = max(1, int(10 * scale))
+    _ffmpeg(path, '-f', 'lavfi', '-i', f"testsrc2=size=1280x720:rate=30:duration={duration}",
+            '-f', 'lavfi', '-i', f"sine=frequency=440:duration={duration}",
+            '-c:v', 'libx264', '-preset', 'veryfast', '-threads', '1', '-c:a', 'aac', '-shortest')
+
+def write_json(path, scale):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n')
+        for index, record in enumerate(_records(int(100000 * scale), seed=4)):
+            f.write((',\n' if index else '') + json.dumps(record, ensure_ascii=False))
+        f.write('\n]\n')
+
+def write_xml(path, scale):
+    from xml.sax.saxutils import escape
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<records>\n')
+        for record in _records(int(100000 * scale), seed=4):
+            fields = ''.join(f"<{key}>{escape(str(value))}</{key}>" for key, value in record.items())
+            f.write(f"  <record>{fields}</record>\n")
+        f.write('</records>\n')
+
+def write_csv(path, scale):
+    import csv
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = None
+        for record in _records(int(100000 * scale), seed=4):
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(record))
+                writer.writeheader()
+            writer.writerow(record)
+
+def write_xlsx(path, scale):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise RuntimeError("openpyxl kurulu değil")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Veri')
+    header = None
+    for record in _records(int(50000 * scale), seed=4):
+        if header is None:
+            header = list(record)
+            sheet.append(header)
+        sheet.append(list(record.values()))
+    workbook.save(path)
+
+def write_parquet(path, scale):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("pyarrow kurulu değil")
+    pq.write_table(pa.Table.from_pylist(list(_records(int(100000 * scale), seed=4))), path)
+
+# Test dosyası adı -> üretici; dönüştürücüler allowed_extensions'a göre eşleştirilir
+FIXTURES = {
+    'document.pdf': write_text_pdf,
+    'document.txt': write_txt,
+    'document.docx': write_docx,
+    'audio.wav': write_wav,
+    'video.mp4': write_mp4,
+    'records.json': write_json,
+    'records.xml': write_xml,
+    'records.csv': write_csv,
+    'records.xlsx': write_xlsx,
+    'records.parquet': write_parquet,
+}
+for _size_name, _size in IMAGE_SIZES.items():
+    FIXTURES[f"image_{_size_name}.png"] = write_image(_size, 'PNG')
+    FIXTURES[f"image_{_size_name}.jpg"] = write_image(_size, 'JPEG')
+
+def generate_fixtures(folder, scale, wanted_extensions):
+    """Gereken test dosyalarını üret (varsa yeniden kullanılır); {ad: yol} ve {ad: hata} döndürür"""
+    os.makedirs(folder, exist_ok=True)
+    # Farklı ölçekle üretilmiş dosyalar yeniden kullanılmaz
+    scale_marker = os.path.join(folder, 'scale.txt')
+    if os.path.exists(scale_marker):
+        with open(scale_marker, 'r', encoding='utf-8') as f:
+            if f.read().strip() != str(scale):
+                for name in FIXTURES:
+                    if os.path.exists(os.path.join(folder, name)):
+                        os.remove(os.path.join(folder, name))
+    with open(scale_marker, 'w', encoding='utf-8') as f:
+        f.write(str(scale))
+    paths, errors = {}, {}
+    for name, writer in FIXTURES.items():
+        if name.rsplit('.', 1)[1] not in wanted_extensions:
+            continue
+        path = os.path.join(folder, name)
+        if not os.path.exists(path):
+            started = time.perf_counter()
+            # Geçici ad uzantıyı korur (ffmpeg/Pillow biçimi uzantıdan seçer)
+            partial_path = os.path.join(folder, f"partial_{name}")
+            try:
+                writer(partial_path, scale)
+                os.replace(partial_path, path)
+            except Exception as e:
+                errors[name] = str(e)
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                continue
+            print(f"  üretildi: {name} ({os.path.getsize(path) / 1024 / 1024:.1f} MB, "
+                  f"{time.perf_counter() - started:.1f} sn)", file=sys.stderr)
+        paths[name] = path
+    return paths, errors
+
+# --- Ölçüm ---
+
+def _peak_rss_mb(usage):
+    # Linux'ta KB, macOS'ta bayt
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+def _own_peak_rss_mb():
+    """
+    Bu process'in en yüksek RSS'i. Linux'ta ru_maxrss exec'ten sonra da ebeveynin değerini
+    taşıdığı için /proc/self/status'taki VmHWM okunur.
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return _peak_rss_mb(resource.getrusage(resource.RUSAGE_SELF))
+
+def run_case(conversion_type, input_path, output_folder):
+    """
+    (Alt process'te) dönüştürücüyü havuz ve iş kuyruğu olmadan doğrudan çağırır ve ölçümü
+    stdout'a tek satır JSON olarak yazar. Uygulamanın import maliyeti süreye dahil değildir.
+    """
+    import resource
+    from app import CONVERTERS
+
+    function = CONVERTERS[conversion_type]['function']
+    rss_before = _own_peak_rss_mb()
+    self_before = resource.getrusage(resource.RUSAGE_SELF)
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    started = time.perf_counter()
+    error = None
+    try:
+        output_path = function(input_path, output_folder)
+    except Exception as e:
+        output_path, error = None, f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - started
+    self_after = resource.getrusage(resource.RUSAGE_SELF)
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    # ffmpeg, LibreOffice ve PDF sayfa process'leri de CPU süresine dahildir
+    cpu = sum(getattr(after, field) - getattr(before, field)
+              for before, after in ((self_before, self_after), (children_before, children_after))
+              for field in ('ru_utime', 'ru_stime'))
+    ok = bool(output_path) and os.path.exists(output_path)
+    if not ok and not error:
+        error = "dönüştürücü çıktı üretmedi"
+    print(json.dumps({
+        'status': 'ok' if ok else 'error',
+        'error': error if not ok else None,
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu, 4),
+        'rss_before_mb': round(rss_before, 1),
+        'peak_rss_mb': round(max(_own_peak_rss_mb(), _peak_rss_mb(children_after)), 1),
+        'output_bytes': os.path.getsize(output_path) if ok else None
+    }))
+
+def measure(conversion_type, input_path, work_folder, repeat):
+    """Dönüştürücüyü repeat kez ayrı process'lerde çalıştır; en düşük süre ve en yüksek RSS raporlanır"""
+    runs = []
+    for attempt in range(repeat):
+        output_folder = tempfile.mkdtemp(prefix=f"{conversion_type}_", dir=work_folder)
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-case', conversion_type, input_path, output_folder],
+            capture_output=True, text=True, cwd=work_folder,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(os.path.abspath(__file__)),
+                                                                         os.environ.get('PYTHONPATH')])))
+        )
+        shutil.rmtree(output_folder, ignore_errors=True)
+        lines = result.stdout.strip().splitlines()
+        try:
+            run = json.loads(lines[-1])
+        except (IndexError, ValueError):
+            run = {'status': 'error', 'error': (result.stderr.strip().splitlines() or ['process çöktü'])[-1]}
+        if run['status'] != 'ok':
+            # Dönüştürücüler hatayı loglayıp None döndürür; ilk hata logu nedeni gösterir
+            logged = [line.split(':', 2)[-1] for line in result.stderr.splitlines()
+                      if line.startswith('ERROR:') and 'Traceback' not in line]
+            if logged:
+                run['error'] = f"{run['error']} ({logged[0].strip()})"
+            return run
+        runs.append(run)
+    return {
+        'status': 'ok',
+        'error': None,
+        'runs': repeat,
+        'wall_s': min(run['wall_s'] for run in runs),
+        'cpu_s': min(run['cpu_s'] for run in runs),
+        'rss_before_mb': max(run['rss_before_mb'] for run in runs),
+        'peak_rss_mb': max(run['peak_rss_mb'] for run in runs),
+        'output_bytes': runs[-1]['output_bytes']
+    }
+
+def package_versions():
+    versions = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+def compare(baseline, current, threshold):
+    """Süre/bellek farklarını yazdır, eşiği aşan yavaşlamaların listesini döndür"""
+    regressions = []
+    print(f"\n{'Ölçüm':<42}{'önce (sn)':>11}{'şimdi (sn)':>11}{'fark':>9}{'RSS fark':>10}")
+    for case_id, result in sorted(current['results'].items()):
+        before = baseline.get('results', {}).get(case_id)
+        if not before or before.get('status') != 'ok' or result['status'] != 'ok':
+            continue
+        change = (result['wall_s'] - before['wall_s']) / before['wall_s'] if before['wall_s'] else 0.0
+        rss_change = result['peak_rss_mb'] - before['peak_rss_mb']
+        flag = ' <-- yavaşladı' if change > threshold else ''
+        print(f"{case_id:<42}{before['wall_s']:>11.3f}{result['wall_s']:>11.3f}{change:>+9.1%}{rss_change:>+9.1f}M{flag}")
+        if change > threshold:
+            regressions.append(case_id)
+    changed = {package: (baseline.get('packages', {}).get(package), version)
+               for package, version in current['packages'].items()
+               if baseline.get('packages', {}).get(package) != version}
+    for package, (old, new) in changed.items():
+        print(f"Kütüphane sürümü değişti: {package} {old} -> {new}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Dönüştürücü performans ölçümü")
+    parser.add_argument('--only', help="Virgülle ayrılmış dönüştürme türleri (varsayılan: tümü)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Test dosyası boyut çarpanı (varsayılan: 1.0)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her ölçümün tekrar sayısı (varsayılan: 3)")
+    parser.add_argument('--fixtures', help="Test dosyalarının klasörü (varsayılan: geçici klasör; verilirse yeniden kullanılır)")
+    parser.add_argument('--output', default='benchmark_results.json', help="Sonuç dosyası")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Yavaşlama eşiği (0.2 = %%20)")
+    parser.add_argument('--run-case', nargs=3, metavar=('TUR', 'GIRDI', 'CIKTI'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case(*args.run_case)
+        return 0
+
+    # Uygulama import edilirken oluşturulan klasörler çalışma klasörüne düşsün
+    original_cwd = os.getcwd()
+    output_path = os.path.abspath(args.output)
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+    fixtures_folder = os.path.abspath(args.fixtures) if args.fixtures else None
+    work_folder = tempfile.mkdtemp(prefix='allconvert_bench_')
+    os.chdir(work_folder)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as application
+    from app import CONVERTERS, converter_registry
+    # Çalışma klasörü ölçüm sonunda silinir; uygulamanın çıkış temizliği gerekmez
+    atexit.unregister(application.cleanup_on_exit)
+
+    selected = [name.strip() for name in args.only.split(',')] if args.only else list(CONVERTERS)
+    unknown = [name for name in selected if name not in CONVERTERS]
+    if unknown:
+        parser.error(f"Bilinmeyen dönüştürme türü: {', '.join(unknown)}")
+
+    converters = {name: CONVERTERS[name] for name in selected if not CONVERTERS[name].get('is_online_service')}
+    wanted = {extension for info in converters.values() for extension in info['allowed_extensions']}
+    fixtures_folder = fixtures_folder or os.path.join(work_folder, 'fixtures')
+    print(f"Test dosyaları hazırlanıyor: {fixtures_folder}", file=sys.stderr)
+    fixtures, fixture_errors = generate_fixtures(fixtures_folder, args.scale, wanted)
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'scale': args.scale,
+        'repeat': args.repeat,
+        'packages': package_versions(),
+        'results': {}
+    }
+    for conversion_type, info in converters.items():
+        missing = converter_registry.missing_requirements(conversion_type)
+        cases = [(name, path) for name, path in fixtures.items() if name.rsplit('.', 1)[1] in info['allowed_extensions']]
+        if missing or not cases:
+            reason = (f"eksik bileşen: {', '.join(missing)}" if missing else
+                      '; '.join(f"{name}: {error}" for name, error in fixture_errors.items()
+                                if name.rsplit('.', 1)[1] in info['allowed_extensions']) or 'test dosyası yok')
+            report['results'][conversion_type] = {'converter': conversion_type, 'status': 'skipped', 'error': reason}
+            print(f"{conversion_type:<42} atlandı ({reason})", file=sys.stderr)
+            continue
+        for fixture_name, fixture_path in cases:
+            case_id = f"{conversion_type}:{fixture_name}"
+            result = measure(conversion_type, fixture_path, work_folder, max(1, args.repeat))
+            result.update(converter=conversion_type, fixture=fixture_name, input_bytes=os.path.getsize(fixture_path))
+            report['results'][case_id] = result
+            if result['status'] == 'ok':
+                print(f"{case_id:<42} {result['wall_s']:>8.3f} sn  CPU {result['cpu_s']:>8.3f} sn  "
+                      f"RSS {result['peak_rss_mb']:>7.1f} MB  çıktı {result['output_bytes'] / 1024:>9.1f} KB", file=sys.stderr)
+            else:
+                print(f"{case_id:<42} HATA: {result['error']}", file=sys.stderr)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar yazıldı: {output_path}", file=sys.stderr)
+
+    os.chdir(original_cwd)
+    shutil.rmtree(work_folder, ignore_errors=True)
+
+    if compare_path:
+        with open(compare_path, 'r', encoding='utf-8') as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} ölçümde %{args.threshold * 100:.0f}'den fazla yavaşlama var.")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Worker metrik dosyalarının toplanmasını doğrular."""
+import json
+import os
+
+import pytest
+
+pytest.importorskip('psutil')
+
+import app  # noqa: E402
+
+DEFINITIONS = {
+    'jobs_total': ('counter', 'Biten işler', None),
+    'jobs_running': ('gauge', 'Çalışan işler', None),
+    'duration_seconds': ('histogram', 'Süre', (1, 10)),
+}
+
+
+def _write_worker(folder, name, pid, started, values):
+    with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+        json.dump({'pid': pid, 'started': started, 'updated': 0, 'values': values}, f)
+
+
+def test_dead_worker_is_folded_into_exited_file(tmp_path):
+    registry = app.MetricsRegistry(str(tmp_path), DEFINITIONS)
+    registry.inc('jobs_total')
+    # Aynı pid'i kullanan ama başka zamanda başlamış (artık ölü) bir worker
+    _write_worker(str(tmp_path), f'worker_{os.getpid()}_1.json', os.getpid(), 0.01, {
+        'jobs_total': {'[]': 5},
+        'jobs_running': {'[]': 2},
+        'duration_seconds': {'[]': {'buckets': [1, 0, 0], 'sum': 0.5, 'count': 1}},
+    })
+
+    merged = registry.collect()
+    assert merged['jobs_total']['[]'] == 6
+    assert merged['jobs_running'] == {}
+    assert merged['duration_seconds']['[]']['count'] == 1
+    assert not os.path.exists(os.path.join(str(tmp_path), f'worker_{os.getpid()}_1.json'))
+    assert os.path.exists(os.path.join(str(tmp_path), registry.EXITED_FILE))
+
+    # Katlanan değerler sonraki toplamalarda bir kez sayılmaya devam eder
+    assert registry.collect()['jobs_total']['[]'] == 6
+    assert len([name for name in os.listdir(str(tmp_path)) if name.endswith('.json')]) == 2
@@ -0,0 +1,91 @@
+"""Spotify şarkı bilgisi okumasını yerel bir HTTP sunucusuna karşı doğrular."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+
+import app  # noqa: E402
+
+TRACK_PAGE = (
+    b'<!DOCTYPE html><html><head><title>Spotify</title>'
+    b'<meta property="og:title" content="Test Song">'
+    b'<meta property="og:description" content="Test Artist \xc2\xb7 Song \xc2\xb7 2023.">'
+    b'</head><body>' + b'<div>padding</div>' * 64 * 1024 + b'</body></html>'
+)
+EMPTY_PAGE = b'<!DOCTYPE html><html><head><title>Spotify</title></head><body>nothing</body></html>'
+
+
+class _SpotifyStandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SpotifyHandler)
+        self.connections = 0
+        self.requests = []
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+class _SpotifyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Bağlantı yeniden kullanılabilsin
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        body = EMPTY_PAGE if self.path.startswith('/track/empty') else TRACK_PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    # Her test kendi oturumu ve önbelleğiyle başlar
+    monkeypatch.setitem(app._http_session_state, 'session', None)
+    monkeypatch.setattr(app, 'spotify_track_cache', app.TTLCache(100, 3600))
+    stand_in = _SpotifyStandIn()
+    thread = threading.Thread(target=stand_in.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+
+def _url(server, path):
+    return f'http://127.0.0.1:{server.server_address[1]}{path}'
+
+
+def test_meta_tags_are_parsed(server):
+    meta = app.fetch_meta_tags(_url(server, '/track/abc'), ('og:title', 'og:description'))
+    assert meta['og:title'] == 'Test Song'
+    assert meta['og:description'] == 'Test Artist · Song · 2023.'
+
+
+def test_connection_is_reused(server):
+    for track_id in ('first', 'second'):
+        app.fetch_meta_tags(_url(server, f'/track/{track_id}'), ('og:title', 'og:description'))
+    assert server.requests == ['/track/first', '/track/second']
+    assert server.connections == 1
+
+
+def test_track_info_is_cached(server):
+    url = _url(server, '/track/cached1')
+    assert app.get_spotify_track_info(url) == ('Test Song', 'Test Artist')
+    assert app.get_spotify_track_info(url) == ('Test Song', 'Test Artist')
+    assert server.requests == ['/track/cached1']
+
+
+def test_fallback_values_are_not_cached(server):
+    url = _url(server, '/track/empty1')
+    assert app.get_spotify_track_info(url) == ('Bilinmeyen Şarkı', 'Bilinmeyen Sanatçı')
+    app.get_spotify_track_info(url)
+    assert server.requests == ['/track/empty1', '/track/empty1']
+    assert app.spotify_track_cache.get('empty1') is None
@@ -0,0 +1,39 @@
+"""Akan XML -> JSON dönüşümünün xmltodict ile aynı çıktıyı ürettiğini doğrular."""
+import json
+
+import pytest
+
+xmltodict = pytest.importorskip('xmltodict')
+
+import app  # noqa: E402
+
+DOCUMENTS = [
+    '<r><a>1</a><b>2</b></r>',
+    '<r><a>1</a><a>2</a><b x="y">3</b></r>',
+    '<r id="7"><a><c>1</c></a><a/><b/></r>',
+    '<r><a>1</a><b>2</b><a>3</a></r>',
+    '<r>hi<a>1</a></r>',
+    '<r><a>1</a>tail</r>',
+    '<r>\n  <a>1</a>\n  <b x="y"> 2 </b>\n</r>',
+    '<r>only text</r>',
+    '<r/>',
+]
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('indent', [0, 4])
+def test_xml_to_json_matches_xmltodict(tmp_path, document, indent):
+    source = tmp_path / 'input.xml'
+    source.write_text(document, encoding='utf-8')
+
+    output_path = app.convert_xml_to_json(str(source), str(tmp_path), indent=indent)
+
+    with open(output_path, encoding='utf-8') as f:
+        assert json.load(f) == xmltodict.parse(document)
+
+
+@pytest.mark.parametrize('document', ['<r>hi<a>1</a></r>', '<r><a>1</a>tail</r>'])
+def test_root_text_falls_back_to_full_parse(document):
+    import io
+    with pytest.raises(app._IrregularXml):
+        app._stream_xml_to_json(io.BytesIO(document.encode()), io.StringIO(), 4)